@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("answers", "0009_puzzles_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(
+                fields=["puzzle", "updated_on"], name="answer_puzzle_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(fields=["created_on", "id"], name="answer_created_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("answers", "0010_answer_queue_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="answer",
+            name="answer_puzzle_updated_idx",
+        ),
+        migrations.AddIndex(
+            model_name="answer",
+            index=models.Index(fields=["updated_on"], name="answer_updated_idx"),
+        ),
+    ]
@@ -51,6 +51,12 @@ class Answer(SoftDeleteModel):
 
     class Meta:
         ordering = ("created_on",)
+        indexes = [
+            # For the answer queue's incremental feed, which scans the whole
+            # hunt by updated_on, and its history pages.
+            models.Index(fields=["updated_on"], name="answer_updated_idx"),
+            models.Index(fields=["created_on", "id"], name="answer_created_idx"),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["text", "puzzle"], name="unique_answer_text_per_puzzle"
@@ -1,3 +1,6 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.test import TestCase
 from guardian.shortcuts import assign_perm
 
@@ -126,3 +129,71 @@ class TestAnswers(TestCase):
         self._puzzle.refresh_from_db()
         self.assertEqual(self._puzzle.status, Puzzle.SOLVED)
         self.assertEqual(self._puzzle.answer, guess1.text)
+
+    @patch("answers.views.ANSWER_CURSOR_OVERLAP", timedelta(0))
+    @patch("answers.views.ANSWER_PAGE_SIZE", 2)
+    def test_answer_feed(self):
+        url = "/answers/queue/{}/answers".format(self._test_hunt.slug)
+        other_puzzle = Puzzle.objects.create(
+            name="other", hunt=self._test_hunt, url="other.com"
+        )
+        guesses = [
+            Answer.objects.create(puzzle=self._puzzle, text="guess1"),
+            Answer.objects.create(puzzle=self._puzzle, text="guess2"),
+            Answer.objects.create(puzzle=other_puzzle, text="guess3"),
+        ]
+
+        def ids(response):
+            return [row[6] for row in response.json()["data"]]
+
+        response = self.client.get(url)
+        self.assertEqual(ids(response), [g.pk for g in reversed(guesses)])
+
+        response = self.client.get(url, {"since": ""})
+        self.assertEqual(ids(response), [guesses[2].pk, guesses[1].pk])
+        cursor = response.json()["cursor"]
+        response = self.client.get(url, {"before": response.json()["next"]})
+        self.assertEqual(ids(response), [guesses[0].pk])
+        self.assertIsNone(response.json()["next"])
+
+        response = self.client.get(url, {"since": cursor})
+        self.assertEqual(response.json()["data"], [])
+        self.assertEqual(response.json()["puzzles"], [])
+        self.assertEqual(response.json()["answers"], [])
+        cursor = response.json()["cursor"]
+
+        # Only the answer that changed is sent. Its puzzle changes too, so the
+        # ids of the puzzle's answers are listed.
+        guesses[0].set_notes("notes")
+        response = self.client.get(url, {"since": cursor})
+        self.assertEqual(ids(response), [guesses[0].pk])
+        self.assertEqual(response.json()["data"][0][7], "notes")
+        self.assertEqual(response.json()["puzzles"], [self._puzzle.pk])
+        self.assertCountEqual(
+            response.json()["answers"], [guesses[0].pk, guesses[1].pk]
+        )
+        cursor = response.json()["cursor"]
+
+        # Renaming a puzzle changes how its answers are shown.
+        other_puzzle.name = "renamed"
+        other_puzzle.save()
+        response = self.client.get(url, {"since": cursor})
+        self.assertEqual(ids(response), [guesses[2].pk])
+        self.assertEqual(response.json()["data"][0][1], "renamed")
+        cursor = response.json()["cursor"]
+
+        # Other changes to a puzzle don't.
+        other_puzzle.notes = "notes"
+        other_puzzle.save()
+        response = self.client.get(url, {"since": cursor})
+        self.assertEqual(response.json()["data"], [])
+        cursor = response.json()["cursor"]
+
+        other_puzzle.delete()
+        response = self.client.get(url, {"since": cursor})
+        self.assertEqual(response.json()["data"], [])
+        self.assertEqual(response.json()["puzzles"], [other_puzzle.pk])
+        self.assertEqual(response.json()["answers"], [])
+
+        self.assertEqual(self.client.get(url, {"since": "yesterday"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"before": "1_2"}).status_code, 400)
@@ -1,24 +1,51 @@
+import datetime
 import logging
 
+import dateutil.parser
+from dateutil import tz
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
+from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, render
+from django.utils import timezone
 from django.views import View
 from django.views.decorators.http import require_GET, require_POST
 from guardian.decorators import permission_required_or_403
 
 import google_api_lib
 from hunts.models import Hunt
+from puzzles.models import Puzzle
 
 from .forms import UpdateAnswerNotesForm, UpdateAnswerStatusForm
 from .models import Answer
 
 logger = logging.getLogger(__name__)
 
+# Columns of the rows returned by the answers feed.
+ANSWER_ROW_FIELDS = (
+    "created_on",
+    "puzzle__name",
+    "puzzle__url",
+    "puzzle__is_meta",
+    "text",
+    "status",
+    "id",
+    "response",
+    "puzzle_id",
+)
+
+# Number of answers per page of answer history.
+ANSWER_PAGE_SIZE = 100
+
+# Incremental answer feed requests re-send anything changed this long before the
+# client's cursor, to cover transactions that were still in flight when the
+# cursor was issued. Clients treat the results as upserts, so overlap is harmless.
+ANSWER_CURSOR_OVERLAP = datetime.timedelta(seconds=10)
+
 
 @require_POST
 @login_required(login_url="/")
@@ -39,33 +66,104 @@ def update_note(request, answer_pk):
     return JsonResponse({})
 
 
+def _format_time(time):
+    return time.astimezone(tz.UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_time(value):
+    try:
+        time = dateutil.parser.isoparse(value)
+    except ValueError:
+        return None
+    return time if time.tzinfo else None
+
+
+def _answer_rows(queryset, limit=None):
+    rows = queryset.order_by("-created_on", "-id").values_list(*ANSWER_ROW_FIELDS)
+    return list(rows[:limit])
+
+
+def _answer_page(queryset, before=None):
+    """
+    Returns {"data", "next"} for the page of answers in `queryset` submitted
+    before the answer identified by the page key `before`, newest first.
+    """
+    if before:
+        created_on, pk = before
+        queryset = queryset.filter(created_on__lte=created_on).exclude(
+            created_on=created_on, pk__gte=pk
+        )
+    rows = _answer_rows(queryset, limit=ANSWER_PAGE_SIZE + 1)
+    next_page = None
+    if len(rows) > ANSWER_PAGE_SIZE:
+        rows = rows[:ANSWER_PAGE_SIZE]
+        next_page = "%s_%d" % (_format_time(rows[-1][0]), rows[-1][6])
+    return {"data": rows, "next": next_page}
+
+
+def _parse_page_key(value):
+    created_on, _, pk = value.rpartition("_")
+    created_on = _parse_time(created_on)
+    if created_on is None or not pk.isdigit():
+        return None
+    return created_on, int(pk)
+
+
 @require_GET
 @login_required(login_url="/")
 @permission_required_or_403("hunt_access", (Hunt, "slug", "hunt_slug"))
 def answers(request, hunt_slug):
-    Hunt.get_object_or_404(user=request.user, slug=hunt_slug)
-    answer_objects = (
-        Answer.objects.filter(puzzle__hunt__slug=hunt_slug)
-        .prefetch_related("puzzle")
-        .order_by("-created_on")
+    """
+    Without query parameters, returns all of the hunt's answers, newest first,
+    as lists of ANSWER_ROW_FIELDS.
+
+    With `since`, returns {"cursor", "data", "puzzles", "answers"}: the answers
+    that changed after the given cursor, and a new cursor to pass on the next
+    request. "puzzles" lists the puzzles that changed after the cursor, which
+    may have had answers deleted, and "answers" the ids of the answers they
+    still have; clients drop any others of theirs. An empty `since` returns an
+    initial cursor along with the first page of answers, as for `before`.
+
+    With `before`, returns {"data", "next"}: the next page of answers after
+    the one ending at `before`, and the key for the page after it, or null.
+    """
+    hunt = Hunt.get_object_or_404(user=request.user, slug=hunt_slug)
+    answer_objects = Answer.objects.filter(puzzle__hunt=hunt)
+
+    if "before" in request.GET:
+        before = _parse_page_key(request.GET["before"])
+        if before is None:
+            return JsonResponse({"error": "Invalid page key."}, status=400)
+        return JsonResponse(_answer_page(answer_objects, before))
+
+    if "since" not in request.GET:
+        return JsonResponse({"data": _answer_rows(answer_objects)})
+
+    cursor = _format_time(timezone.now())
+    if not request.GET["since"]:
+        return JsonResponse({"cursor": cursor, **_answer_page(answer_objects)})
+
+    since_time = _parse_time(request.GET["since"])
+    if since_time is None:
+        return JsonResponse({"error": "Invalid since cursor."}, status=400)
+    window_start = since_time - ANSWER_CURSOR_OVERLAP
+    changed_puzzles = list(
+        Puzzle.global_objects.filter(hunt=hunt)
+        .filter(Q(updated_on__gt=window_start) | Q(deleted_at__gt=window_start))
+        .values_list("pk", flat=True)
+    )
+    rows = _answer_rows(answer_objects.filter(updated_on__gt=window_start))
+    answer_ids = list(
+        answer_objects.filter(puzzle__in=changed_puzzles).values_list("pk", flat=True)
+    )
+    return JsonResponse(
+        {
+            "cursor": cursor,
+            "data": rows,
+            "puzzles": changed_puzzles,
+            "answers": answer_ids,
+        }
     )
-
-    result = {
-        "data": [
-            [
-                answer.created_on,
-                answer.puzzle.name,
-                answer.puzzle.url,
-                answer.puzzle.is_meta,
-                answer.text,
-                answer.status,
-                answer.id,
-                answer.response,
-            ]
-            for answer in answer_objects
-        ]
-    }
-    return JsonResponse(result)
 
 
 class AnswerView(LoginRequiredMixin, View):
@@ -78,6 +176,7 @@ class AnswerView(LoginRequiredMixin, View):
             raise PermissionDenied()
 
         context = {
+            "hunt_id": hunt.pk,
             "hunt_slug": hunt_slug,
             "hunt_name": hunt.name,
         }
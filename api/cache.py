@@ -0,0 +1,85 @@
+import datetime
+import logging
+import time
+from collections import defaultdict
+
+from dateutil import tz
+from django.core.cache import cache
+
+from cardboard import metrics
+
+from .serializers import PuzzleListSerializer
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the serialized puzzle format changes, so that a deploy doesn't
+# serve dicts cached by the previous version.
+PUZZLE_CACHE_FORMAT_VERSION = 1
+
+# Upper bound on how long a serialized puzzle stays cached. Entries are normally
+# replaced well before this, since any change to a puzzle changes its key.
+PUZZLE_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def _puzzle_cache_key(pk, updated_on, lookback):
+    # updated_on is bumped whenever the puzzle or anything serialized with it
+    # changes (see touch_puzzles), so it identifies a version of the puzzle.
+    return "puzzle_data_v%d_%d_%d_%d" % (
+        PUZZLE_CACHE_FORMAT_VERSION,
+        pk,
+        updated_on.timestamp() * 1e6,
+        lookback.total_seconds(),
+    )
+
+
+def _puzzle_cache_timeout(oldest_recent_edit, now, lookback):
+    # recent_editors changes without any write once the oldest recent edit ages
+    # out of the lookback window, so expire the entry by then.
+    if oldest_recent_edit is None:
+        return PUZZLE_CACHE_TIMEOUT
+    expiry = oldest_recent_edit + lookback - now
+    return max(1, min(PUZZLE_CACHE_TIMEOUT, int(expiry.total_seconds())))
+
+
+def serialize_puzzles(queryset, lookback):
+    """
+    Returns PuzzleSerializer data for the puzzles in `queryset`, in order. Each
+    puzzle's data is cached by version, so only puzzles that changed since they
+    were last serialized are fetched and serialized again.
+
+    `queryset` must be built by PuzzleViewSet (see PuzzleListSerializer), and
+    `lookback` must be the hunt's active_user_lookback.
+    """
+    versions = list(queryset.prefetch_related(None).values_list("pk", "updated_on"))
+    keys = {
+        pk: _puzzle_cache_key(pk, updated_on, lookback) for pk, updated_on in versions
+    }
+    data = cache.get_many(keys.values())
+
+    missing = [pk for pk, key in keys.items() if key not in data]
+    metrics.increment("puzzle_cache_hits", len(keys) - len(missing))
+    metrics.increment("puzzle_cache_misses", len(missing))
+
+    if missing:
+        start = time.monotonic()
+        now = datetime.datetime.now(tz=tz.UTC)
+        entries_by_timeout = defaultdict(dict)
+        serializer = PuzzleListSerializer(queryset.filter(pk__in=missing))
+        for row, puzzle_data in zip(serializer.rows, serializer.data):
+            # Key by the version read together with the data; if the puzzle
+            # changed since `versions` was read, this is the newer version.
+            key = _puzzle_cache_key(row["id"], row["updated_on"], lookback)
+            timeout = _puzzle_cache_timeout(row["_oldest_recent_edit"], now, lookback)
+            entries_by_timeout[timeout][key] = puzzle_data
+            data[keys[row["id"]]] = puzzle_data
+        for timeout, entries in entries_by_timeout.items():
+            cache.set_many(entries, timeout=timeout)
+
+        elapsed = time.monotonic() - start
+        metrics.increment("puzzle_cache_rebuild_seconds", elapsed)
+        logger.info(
+            f"Serialized {len(missing)} of {len(keys)} puzzles in {elapsed:.3f}s"
+        )
+
+    # Puzzles deleted between the two queries have no data.
+    return [data[key] for key in keys.values() if key in data]
@@ -2,70 +2,61 @@ import logging
 
 from rest_framework import permissions
 
-from hunts.models import Hunt
+from hunts.permissions import get_puzzle_hunt_id, has_hunt_permission
 
 logger = logging.getLogger(__name__)
 
+# Permissions are checked on every request, so these go through the hunt
+# permission cache rather than querying guardian directly.
+
 
 class HuntAccessPermission(permissions.BasePermission):
     message = "You do not have access to this hunt"
 
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
-            return request.user.has_perm("hunt_access", obj)
+            return has_hunt_permission(request.user, "hunt_access", obj.pk)
         else:
-            return request.user.has_perm("hunt_admin", obj)
+            return has_hunt_permission(request.user, "hunt_admin", obj.pk)
 
 
 class PuzzleAccessPermission(permissions.BasePermission):
     message = "You do not have access to this puzzle"
 
     def has_permission(self, request, view):
-        try:
-            hunt = Hunt.objects.get(id=view.kwargs["hunt_id"])
-        except Hunt.DoesNotExist:
-            hunt = None
-
-        if not hunt:
-            return False
-
-        return request.user.has_perm("hunt_access", hunt)
+        return has_hunt_permission(request.user, "hunt_access", view.kwargs["hunt_id"])
 
     def has_object_permission(self, request, view, obj):
-        return request.user.has_perm("hunt_access", obj.hunt)
+        return has_hunt_permission(request.user, "hunt_access", obj.hunt_id)
 
 
 class PuzzleTagAccessPermission(permissions.BasePermission):
     message = "You do not have access to this puzzle tag"
 
     def has_permission(self, request, view):
-        try:
-            hunt = Hunt.objects.get(puzzles=view.kwargs["puzzle_id"])
-        except Hunt.DoesNotExist:
-            hunt = None
+        hunt_id = get_puzzle_hunt_id(view.kwargs["puzzle_id"])
 
-        if not hunt:
+        if not hunt_id:
             return False
 
-        return request.user.has_perm("hunt_access", hunt)
+        return has_hunt_permission(request.user, "hunt_access", hunt_id)
 
     def has_object_permission(self, request, view, obj):
-        return request.user.has_perm("hunt_access", obj.hunt)
+        return has_hunt_permission(request.user, "hunt_access", obj.hunt_id)
 
 
 class AnswerAccessPermission(permissions.BasePermission):
     message = "You do not have access to this answer"
 
     def has_permission(self, request, view):
-        try:
-            hunt = Hunt.objects.get(puzzles=view.kwargs["puzzle_id"])
-        except Hunt.DoesNotExist:
-            hunt = None
+        hunt_id = get_puzzle_hunt_id(view.kwargs["puzzle_id"])
 
-        if not hunt:
+        if not hunt_id:
             return False
 
-        return request.user.has_perm("hunt_access", hunt)
+        return has_hunt_permission(request.user, "hunt_access", hunt_id)
 
     def has_object_permission(self, request, view, obj):
-        return request.user.has_perm("hunt_access", obj.puzzle.hunt)
+        return has_hunt_permission(
+            request.user, "hunt_access", get_puzzle_hunt_id(obj.puzzle_id)
+        )
@@ -0,0 +1,52 @@
+import json
+
+import msgpack
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class EventStreamRenderer(renderers.BaseRenderer):
+    """
+    Lets views accept EventSource requests. Successful responses stream their
+    own events; this only renders error responses, as a single error event.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return f"event: error\ndata: {json.dumps(data)}\n\n"
+
+
+class CompactJSONRenderer(renderers.JSONRenderer):
+    """
+    JSON for clients that accept the compact puzzle list format, where puzzles
+    refer to tags by id (see compact_puzzles). Views that support it check the
+    accepted renderer's `compact_format` attribute.
+    """
+
+    media_type = "application/vnd.cardboard.compact+json"
+    format = "compact"
+    compact_format = True
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    MessagePack encoding of the compact puzzle list format.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    compact_format = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # Encode dates and other non-primitive values the same way as JSON.
+        return msgpack.packb(data, default=JSONEncoder().default)
+
+
+COMPACT_RENDERER_CLASSES = [CompactJSONRenderer, MessagePackRenderer]
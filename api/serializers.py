@@ -1,8 +1,11 @@
 import datetime
 import re
+from collections import defaultdict
 
 from dateutil import tz
 from django.conf import settings
+from django.db.models import Q
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 from url_normalize import url_normalize
@@ -10,7 +13,8 @@ from url_normalize import url_normalize
 from answers.models import Answer
 from chat.models import ChatRoom
 from hunts.models import Hunt
-from puzzles.models import Puzzle, PuzzleTag
+from puzzles.models import Puzzle, PuzzleActivity, PuzzleTag
+from puzzles.puzzle_tag import META_COLOR, PuzzleTagColor
 
 
 class PuzzleTagSerializer(serializers.ModelSerializer):
@@ -129,6 +133,18 @@ class ChatRoomSerializer(serializers.ModelSerializer):
         )
 
 
+def _editor_names(activities, before_time):
+    """
+    Returns a puzzle's recent_editors and top_editors, given its activity as
+    (editor name, last edit time, number of edits), with the most edits first.
+    """
+    recent_editors = sorted(
+        name for name, last_edit_time, _ in activities if last_edit_time > before_time
+    )
+    top_editors = [name for name, _, num_edits in activities if num_edits > 5][:5]
+    return recent_editors, top_editors
+
+
 class PuzzleSerializer(serializers.ModelSerializer):
     chat_room = ChatRoomSerializer(required=False)
     tags = PuzzleTagSerializer(required=False, many=True)
@@ -154,9 +170,22 @@ class PuzzleSerializer(serializers.ModelSerializer):
     def get_has_sheet(self, obj):
         return bool(obj.sheet)
 
+    def _prefetched_editor_names(self, obj):
+        before_time = (
+            datetime.datetime.now(tz=tz.UTC) - obj.hunt.settings.active_user_lookback
+        )
+        return _editor_names(
+            [
+                (str(activity.user), activity.last_edit_time, activity.num_edits)
+                for activity in obj._prefetched_activities
+            ],
+            before_time,
+        )
+
     def get_recent_editors(self, obj):
-        if hasattr(obj, "_recent_editors"):
-            return sorted([str(user) for user in obj._recent_editors])
+        if hasattr(obj, "_prefetched_activities"):
+            # Prefetched by PuzzleViewSet.
+            return self._prefetched_editor_names(obj)[0]
 
         before_time = (
             datetime.datetime.now(tz=tz.UTC) - obj.hunt.settings.active_user_lookback
@@ -169,13 +198,13 @@ class PuzzleSerializer(serializers.ModelSerializer):
         return sorted([str(user) for user in recent_editors])
 
     def get_top_editors(self, obj):
+        if hasattr(obj, "_prefetched_activities"):
+            return self._prefetched_editor_names(obj)[1]
+
         # distinct and order_by with a related model interact oddly and result in non-distinct results
-        if hasattr(obj, "_top_editors"):
-            top_editors_with_duplicates = obj._top_editors
-        else:
-            top_editors_with_duplicates = obj.active_users.filter(
-                puzzle_activities__num_edits__gt=5
-            ).order_by("-puzzle_activities__num_edits")
+        top_editors_with_duplicates = obj.active_users.filter(
+            puzzle_activities__num_edits__gt=5
+        ).order_by("-puzzle_activities__num_edits")
 
         top_editors = []
         for user in top_editors_with_duplicates:
@@ -188,6 +217,9 @@ class PuzzleSerializer(serializers.ModelSerializer):
         return top_editors
 
     def get_last_edited_on(self, obj):
+        if hasattr(obj, "_last_edited_on"):
+            return obj._last_edited_on
+
         puzzle_activities = obj.puzzle_activities.all()
         if len(puzzle_activities) > 0:
             return max(
@@ -277,3 +309,308 @@ class PuzzleSerializer(serializers.ModelSerializer):
                 message="There is already a puzzle with this URL.",
             ),
         )
+
+
+class PuzzleBulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Validates a batch of new puzzles as a whole, with a fixed number of queries
+    however large the batch is.
+    """
+
+    def validate(self, data):
+        data = super().validate(data)
+        hunt = self.context["hunt"]
+
+        names = [puzzle["name"] for puzzle in data]
+        urls = [puzzle["url"] for puzzle in data]
+        if len(set(names)) < len(names):
+            raise serializers.ValidationError("Puzzle names must be unique.")
+        if len(set(urls)) < len(urls):
+            raise serializers.ValidationError("Puzzle URLs must be unique.")
+
+        for name, url in Puzzle.objects.filter(
+            Q(name__in=names) | Q(url__in=urls), hunt=hunt
+        ).values_list("name", "url"):
+            if name in names:
+                raise serializers.ValidationError(
+                    f"There is already a puzzle named {name}."
+                )
+            raise serializers.ValidationError(
+                f"There is already a puzzle with the URL {url}."
+            )
+
+        # Puzzles can be assigned to existing metas or to metas in the batch.
+        assigned_metas = {
+            puzzle["name"]: puzzle["assigned_meta"]
+            for puzzle in data
+            if puzzle.get("assigned_meta")
+        }
+        meta_names = set(
+            Puzzle.objects.filter(
+                hunt=hunt, is_meta=True, name__in=assigned_metas.values()
+            ).values_list("name", flat=True)
+        )
+        new_meta_names = {puzzle["name"] for puzzle in data if puzzle.get("is_meta")}
+        for meta_name in assigned_metas.values():
+            if meta_name not in meta_names | new_meta_names:
+                raise serializers.ValidationError(
+                    f"There is no meta named {meta_name}."
+                )
+
+        # Existing puzzles can't be fed by new ones, so only assignments within
+        # the batch can form a cycle.
+        for name in assigned_metas:
+            seen = {name}
+            while name in assigned_metas:
+                name = assigned_metas[name]
+                if name in seen:
+                    raise serializers.ValidationError(
+                        "Unable to assign metapuzzles since doing so would "
+                        "introduce a meta-cycle."
+                    )
+                seen.add(name)
+
+        return data
+
+
+class PuzzleBulkCreateSerializer(PuzzleSerializer):
+    """Validates one puzzle in a request to PuzzleViewSet.bulk_create."""
+
+    assigned_meta = serializers.CharField(
+        required=False, allow_blank=True, write_only=True
+    )
+    create_channels = serializers.BooleanField(default=False, write_only=True)
+
+    class Meta(PuzzleSerializer.Meta):
+        fields = PuzzleSerializer.Meta.fields + ("assigned_meta", "create_channels")
+        list_serializer_class = PuzzleBulkCreateListSerializer
+        # Checked once for the whole batch by PuzzleBulkCreateListSerializer.
+        validators = ()
+
+
+class PuzzleBulkOperationSerializer(serializers.Serializer):
+    ADD_TAG = "add_tag"
+    REMOVE_TAG = "remove_tag"
+    SET_STATUS = "set_status"
+
+    op = serializers.ChoiceField(choices=[ADD_TAG, REMOVE_TAG, SET_STATUS])
+    # Tag operations
+    name = serializers.CharField(max_length=100, required=False)
+    # Meta tag colors are only given out by creating metas.
+    color = serializers.ChoiceField(
+        choices=[color for color in PuzzleTagColor if color != META_COLOR],
+        required=False,
+    )
+    # Status operations
+    status = serializers.ChoiceField(
+        choices=Puzzle.VISIBLE_STATUS_CHOICES, required=False
+    )
+
+    def validate(self, data):
+        required_field = "status" if data["op"] == self.SET_STATUS else "name"
+        if required_field not in data:
+            raise serializers.ValidationError(
+                f"{data['op']} operations require a {required_field}."
+            )
+        return data
+
+
+class PuzzleBulkUpdateSerializer(serializers.Serializer):
+    """Validates a request to PuzzleViewSet.bulk_update."""
+
+    puzzle_ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False
+    )
+    operations = PuzzleBulkOperationSerializer(many=True, allow_empty=False)
+
+    def validate_puzzle_ids(self, puzzle_ids):
+        puzzle_ids = set(puzzle_ids)
+        found = Puzzle.objects.filter(
+            hunt=self.context["hunt"], pk__in=puzzle_ids
+        ).values_list("pk", "status")
+        if len(found) < len(puzzle_ids):
+            raise serializers.ValidationError("Some of these puzzles don't exist.")
+        self.statuses = dict(found)
+        return sorted(puzzle_ids)
+
+    def validate(self, data):
+        changes_status = any(
+            operation["op"] == PuzzleBulkOperationSerializer.SET_STATUS
+            for operation in data["operations"]
+        )
+        if changes_status and Puzzle.SOLVED in self.statuses.values():
+            raise serializers.ValidationError(
+                "The status of solved puzzles can only be changed one at a time."
+            )
+        return data
+
+
+class PuzzleListSerializer:
+    """
+    Read-only serializer for puzzle lists that builds PuzzleSerializer's output
+    from .values() rows instead of model instances, skipping DRF's per-field
+    overhead. The output must stay identical to PuzzleSerializer's, so change
+    both together; PuzzleListSerializerParityTests checks this.
+
+    Expects a queryset built by PuzzleViewSet, which annotates last_edited_on.
+    """
+
+    created_on_field = serializers.DateTimeField()
+
+    def __init__(self, queryset):
+        self.queryset = queryset
+
+    @cached_property
+    def rows(self):
+        # Also includes fields that aren't serialized but that callers may want,
+        # e.g. for cache keys.
+        return list(
+            self.queryset.prefetch_related(None).values(
+                "id",
+                "name",
+                "hunt_id",
+                "url",
+                "notes",
+                "sheet",
+                "chat_room_id",
+                "chat_room__text_channel_url",
+                "chat_room__audio_channel_url",
+                "status",
+                "is_meta",
+                "created_on",
+                "updated_on",
+                "hunt__settings__active_user_lookback",
+                "_last_edited_on",
+                "_oldest_recent_edit",
+            )
+        )
+
+    @cached_property
+    def data(self):
+        puzzle_ids = [row["id"] for row in self.rows]
+
+        tags = defaultdict(list)
+        for tag in (
+            Puzzle.tags.through.objects.filter(puzzle_id__in=puzzle_ids)
+            .order_by("puzzletag_id")
+            .values(
+                "puzzle_id",
+                "puzzletag_id",
+                "puzzletag__name",
+                "puzzletag__color",
+                "puzzletag__is_meta",
+                "puzzletag__is_location",
+            )
+        ):
+            tags[tag["puzzle_id"]].append(
+                {
+                    "id": tag["puzzletag_id"],
+                    "name": tag["puzzletag__name"],
+                    "color": tag["puzzletag__color"],
+                    "is_meta": tag["puzzletag__is_meta"],
+                    "is_high_pri": tag["puzzletag__name"] == PuzzleTag.HIGH_PRIORITY,
+                    "is_low_pri": tag["puzzletag__name"] == PuzzleTag.LOW_PRIORITY,
+                    "is_location": tag["puzzletag__is_location"],
+                }
+            )
+
+        guesses = defaultdict(list)
+        for answer in Answer.objects.filter(
+            puzzle_id__in=puzzle_ids, status=Answer.CORRECT
+        ).values("id", "text", "puzzle_id"):
+            guesses[answer["puzzle_id"]].append(answer)
+
+        # Like the metas and feeders prefetches, skip deleted puzzles.
+        metas = defaultdict(list)
+        feeders = defaultdict(list)
+        for feeder_id, meta_id in (
+            Puzzle.metas.through.objects.filter(
+                Q(from_puzzle_id__in=puzzle_ids, to_puzzle__deleted_at__isnull=True)
+                | Q(to_puzzle_id__in=puzzle_ids, from_puzzle__deleted_at__isnull=True)
+            )
+            .order_by("to_puzzle_id", "from_puzzle_id")
+            .values_list("from_puzzle_id", "to_puzzle_id")
+        ):
+            metas[feeder_id].append(meta_id)
+            feeders[meta_id].append(feeder_id)
+        for feeder_ids in feeders.values():
+            feeder_ids.sort()
+
+        now = datetime.datetime.now(tz=tz.UTC)
+        before_times = {
+            row["id"]: now - row["hunt__settings__active_user_lookback"]
+            for row in self.rows
+        }
+        # Only activity that makes someone a recent or top editor.
+        activities = defaultdict(list)
+        for puzzle_id, first_name, last_name, last_edit_time, num_edits in (
+            PuzzleActivity.objects.filter(puzzle_id__in=puzzle_ids)
+            .filter(
+                Q(num_edits__gt=5)
+                | Q(last_edit_time__gt=min(before_times.values(), default=now))
+            )
+            .order_by("-num_edits", "pk")
+            .values_list(
+                "puzzle_id",
+                "user__first_name",
+                "user__last_name",
+                "last_edit_time",
+                "num_edits",
+            )
+        ):
+            # Matches Puzzler.__str__.
+            activities[puzzle_id].append(
+                (first_name + " " + last_name, last_edit_time, num_edits)
+            )
+        editor_names = {
+            puzzle_id: _editor_names(activities[puzzle_id], before_time)
+            for puzzle_id, before_time in before_times.items()
+        }
+
+        return [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "hunt_id": row["hunt_id"],
+                "url": row["url"],
+                "notes": row["notes"],
+                "has_sheet": bool(row["sheet"]),
+                "chat_room": (
+                    {
+                        "text_channel_url": row["chat_room__text_channel_url"],
+                        "audio_channel_url": row["chat_room__audio_channel_url"],
+                    }
+                    if row["chat_room_id"] is not None
+                    else None
+                ),
+                "status": row["status"],
+                "tags": tags[row["id"]],
+                "guesses": guesses[row["id"]],
+                "metas": metas[row["id"]],
+                "feeders": feeders[row["id"]],
+                "is_meta": row["is_meta"],
+                "created_on": self.created_on_field.to_representation(
+                    row["created_on"]
+                ),
+                "recent_editors": editor_names[row["id"]][0],
+                "top_editors": editor_names[row["id"]][1],
+                "last_edited_on": row["_last_edited_on"],
+            }
+            for row in self.rows
+        ]
+
+
+def compact_puzzles(puzzles):
+    """
+    Converts a list of serialized puzzles to the compact format, which avoids
+    repeating each tag for every puzzle that has it: returns {"puzzles",
+    "tags"}, where each puzzle's tags are replaced by their ids and `tags`
+    lists every tag used by the puzzles.
+    """
+    tags = {}
+    compacted = []
+    for puzzle in puzzles:
+        for tag in puzzle["tags"]:
+            tags.setdefault(tag["id"], tag)
+        compacted.append({**puzzle, "tags": [tag["id"] for tag in puzzle["tags"]]})
+    return {"puzzles": compacted, "tags": list(tags.values())}
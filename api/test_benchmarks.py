@@ -0,0 +1,231 @@
+import os
+import time
+import unittest
+from dataclasses import dataclass
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from accounts.models import Puzzler
+from chat.fake_service import FakeChatService
+from hunts.versions import bump_hunt_version
+from puzzles.models import Puzzle
+
+from .serializers import PuzzleListSerializer, PuzzleSerializer
+from .test_helpers import CardboardTestCase
+from .views import PuzzleViewSet
+
+# Benchmarks are slow, so they only run when asked for:
+#   CARDBOARD_BENCHMARKS=1 python manage.py test api.test_benchmarks
+# CARDBOARD_BENCHMARK_PUZZLES sets the size of the seeded hunt. Query counts are
+# checked on every test run regardless.
+RUN_BENCHMARKS = bool(os.environ.get("CARDBOARD_BENCHMARKS"))
+BENCHMARK_PUZZLES = int(os.environ.get("CARDBOARD_BENCHMARK_PUZZLES", 500))
+
+
+@dataclass
+class Measurement:
+    queries: int
+    seconds: float
+    payload_bytes: int
+
+
+def measure(request):
+    """Makes the request and returns its query count, wall time and payload size."""
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        response = request()
+        seconds = time.perf_counter() - start
+    assert response.status_code < 400, response.content
+    return Measurement(len(queries), seconds, len(response.content))
+
+
+def best_time(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class HotEndpoints:
+    """
+    Requests for the endpoints that get the most traffic during a hunt, for
+    tests mixing in CardboardTestCase with a hunt seeded by
+    create_seeded_puzzles. Mutations act on puzzles nothing else touches.
+    """
+
+    # Maximum number of queries each request may make, regardless of hunt size.
+    # A test fails if a change makes any of these go up; if a change brings one
+    # down, lower it here to lock in the improvement.
+    QUERY_BUDGETS = {
+        "hunt_retrieve": 7,
+        "puzzle_list": 9,
+        "puzzle_list_cached": 4,
+        "puzzle_list_since": 10,
+        "hunt_stats": 8,
+        "hunt_stats_cached": 6,
+        "answer_queue": 7,
+        "create_puzzle": 19,
+        "edit_puzzle": 12,
+        "create_answer": 22,
+        "create_tag": 27,
+    }
+
+    def unused_puzzle(self):
+        self._unused_puzzles += 1
+        return Puzzle.objects.create(
+            name=f"Unused puzzle {self._unused_puzzles}",
+            hunt=self._hunt,
+            url=f"https://unused.test/{self._unused_puzzles}",
+        )
+
+    # Each prepare_* method does any setup the request needs, then returns a
+    # function making the request itself.
+
+    def prepare_hunt_retrieve(self):
+        return self.get_hunt
+
+    def prepare_puzzle_list(self):
+        # Touch every puzzle so none of them are cached.
+        Puzzle.objects.filter(hunt=self._hunt).update(updated_on=timezone.now())
+        return self.list_puzzles
+
+    def prepare_puzzle_list_cached(self):
+        self.list_puzzles()
+        return self.list_puzzles
+
+    def prepare_puzzle_list_since(self):
+        cursor = self.list_puzzles(since="").data["cursor"]
+        Puzzle.objects.filter(hunt=self._hunt).update(updated_on=timezone.now())
+        return lambda: self.list_puzzles(since=cursor)
+
+    def prepare_hunt_stats(self):
+        # A solve or unlock would invalidate the cached stats.
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_hunt_version(self._hunt.pk)
+        return lambda: self.client.get(f"/hunts/{self._hunt.slug}/stats")
+
+    def prepare_hunt_stats_cached(self):
+        self.client.get(f"/hunts/{self._hunt.slug}/stats")
+        return lambda: self.client.get(f"/hunts/{self._hunt.slug}/stats")
+
+    def prepare_answer_queue(self):
+        return lambda: self.client.get(f"/answers/queue/{self._hunt.slug}/answers")
+
+    def prepare_create_puzzle(self):
+        self._unused_puzzles += 1
+        data = {
+            "name": f"New puzzle {self._unused_puzzles}",
+            "url": f"https://new.test/{self._unused_puzzles}",
+            "is_meta": False,
+            "create_channels": True,
+        }
+        return lambda: self.create_puzzle(data)
+
+    def prepare_edit_puzzle(self):
+        puzzle = self.unused_puzzle()
+        return lambda: self.edit_puzzle(puzzle.pk, {"status": Puzzle.STUCK})
+
+    def prepare_create_answer(self):
+        puzzle = self.unused_puzzle()
+        return lambda: self.create_answer(puzzle.pk, {"text": "answer"})
+
+    def prepare_create_tag(self):
+        puzzle = self.unused_puzzle()
+        data = {"name": f"Tag {self._unused_puzzles}", "color": "primary"}
+        return lambda: self.create_tag(puzzle.pk, data)
+
+    def measure_hot_endpoints(self, warmup=False):
+        """Returns a dict of endpoint name to Measurement."""
+        self._unused_puzzles = getattr(self, "_unused_puzzles", 0)
+        measurements = {}
+        for name in self.QUERY_BUDGETS:
+            prepare = getattr(self, f"prepare_{name}")
+            if warmup:
+                prepare()()
+            measurements[name] = measure(prepare())
+        return measurements
+
+
+@override_settings(
+    CHAT_DEFAULT_SERVICE="FAKE",
+    CHAT_SERVICES={
+        "FAKE": FakeChatService,
+    },
+)
+class HotEndpointQueryCountTests(HotEndpoints, CardboardTestCase, APITestCase):
+    def test_query_budgets(self):
+        self.create_seeded_puzzles(20)
+        for name, measurement in self.measure_hot_endpoints().items():
+            with self.subTest(name):
+                self.assertLessEqual(
+                    measurement.queries, self.QUERY_BUDGETS[name], msg=name
+                )
+
+    def test_query_counts_independent_of_hunt_size(self):
+        self.create_seeded_puzzles(10)
+        # Warm up the permission cache, so both runs find it hot.
+        self.get_hunt()
+        small = self.measure_hot_endpoints()
+        self.create_seeded_puzzles(30)
+        large = self.measure_hot_endpoints()
+        for name in self.QUERY_BUDGETS:
+            with self.subTest(name):
+                self.assertEqual(small[name].queries, large[name].queries, msg=name)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "set CARDBOARD_BENCHMARKS=1 to run benchmarks")
+@override_settings(
+    CHAT_DEFAULT_SERVICE="FAKE",
+    CHAT_SERVICES={
+        "FAKE": FakeChatService,
+    },
+)
+class HotEndpointBenchmark(HotEndpoints, CardboardTestCase, APITestCase):
+    def test_hot_endpoints(self):
+        for i in range(4):
+            Puzzler.objects.create_user(
+                username=f"editor{i}", first_name="Editor", last_name=str(i)
+            )
+        self.create_seeded_puzzles(BENCHMARK_PUZZLES)
+
+        print()
+        print(f"Hunt with {BENCHMARK_PUZZLES} puzzles")
+        print("endpoint              queries       time    payload")
+        for name, measurement in self.measure_hot_endpoints(warmup=True).items():
+            print(
+                f"{name:20s}  {measurement.queries:7d}  "
+                f"{measurement.seconds * 1000:7.1f}ms  "
+                f"{measurement.payload_bytes / 1024:7.1f}KB"
+            )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "set CARDBOARD_BENCHMARKS=1 to run benchmarks")
+@override_settings(
+    CHAT_DEFAULT_SERVICE=None,
+    CHAT_SERVICES={},
+)
+class PuzzleListSerializerBenchmark(CardboardTestCase, APITestCase):
+    def test_puzzle_list_serializers(self):
+        for i in range(4):
+            Puzzler.objects.create_user(
+                username=f"editor{i}", first_name="Editor", last_name=str(i)
+            )
+
+        print()
+        print("puzzles  PuzzleSerializer  PuzzleListSerializer  speedup")
+        created = 0
+        for size in (100, 500, 2000):
+            self.create_seeded_puzzles(size - created)
+            created = size
+            queryset = PuzzleViewSet()._get_puzzles_queryset(self._hunt)
+
+            slow = best_time(lambda: PuzzleSerializer(queryset.all(), many=True).data)
+            fast = best_time(lambda: PuzzleListSerializer(queryset.all()).data)
+            print(f"{size:7d}  {slow:15.3f}s  {fast:19.3f}s  {slow / fast:6.1f}x")
@@ -1,9 +1,15 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from guardian.shortcuts import assign_perm, remove_perm
 from rest_framework import status
 
 from accounts.models import Puzzler
+from answers.models import Answer
+from cardboard.redis_client import get_redis_client
+from hunts.last_accessed import LAST_ACCESSED_HUNTS_KEY
 from hunts.models import Hunt
-from puzzles.models import PuzzleTag
+from puzzles.models import Puzzle, PuzzleActivity, PuzzleTag
 
 TEST_SHEET_TEMPLATE_ID = "12345abcde"
 
@@ -27,6 +33,9 @@ class CardboardTestCase:
             tag.delete()
 
         self._hunt.delete()
+        # Accesses buffered in Redis outlive the test database, whose user and
+        # hunt ids get reused by later tests.
+        get_redis_client().delete(LAST_ACCESSED_HUNTS_KEY)
 
     # General test methods
 
@@ -39,6 +48,64 @@ class CardboardTestCase:
         if not can_access:
             remove_perm("hunt_access", self._user, self._hunt)
 
+    def create_seeded_puzzles(self, count):
+        """
+        Bulk creates `count` puzzles resembling a hunt in progress: one in ten is
+        a meta the following puzzles feed into, every third is solved, and each
+        has a tag, a wrong guess, and edits by every user.
+        """
+        if not PuzzleTag.objects.filter(hunt=self._hunt).exists():
+            PuzzleTag.create_default_tags(self._hunt)
+        start = Puzzle.objects.filter(hunt=self._hunt).count()
+        puzzles = Puzzle.objects.bulk_create(
+            Puzzle(
+                name=f"Seeded puzzle {i}",
+                hunt=self._hunt,
+                url=f"https://puzzles.test/{i}",
+                is_meta=i % 10 == 0,
+                status=Puzzle.SOLVED if i % 3 == 0 else Puzzle.SOLVING,
+            )
+            for i in range(start, start + count)
+        )
+        tags = list(PuzzleTag.objects.filter(hunt=self._hunt))
+        users = list(Puzzler.objects.all())
+        now = timezone.now()
+
+        meta = None
+        feeder_links = []
+        for puzzle in puzzles:
+            if puzzle.is_meta:
+                meta = puzzle
+            elif meta is not None:
+                feeder_links.append(
+                    Puzzle.metas.through(from_puzzle=puzzle, to_puzzle=meta)
+                )
+        Puzzle.metas.through.objects.bulk_create(feeder_links)
+        Puzzle.tags.through.objects.bulk_create(
+            Puzzle.tags.through(puzzle=puzzle, puzzletag=tags[i % len(tags)])
+            for i, puzzle in enumerate(puzzles)
+        )
+        Answer.objects.bulk_create(
+            Answer(puzzle=puzzle, text=f"WRONG{puzzle.pk}", status=Answer.INCORRECT)
+            for puzzle in puzzles
+        )
+        Answer.objects.bulk_create(
+            Answer(puzzle=puzzle, text=f"ANSWER{puzzle.pk}", status=Answer.CORRECT)
+            for puzzle in puzzles
+            if puzzle.status == Puzzle.SOLVED
+        )
+        PuzzleActivity.objects.bulk_create(
+            PuzzleActivity(
+                user=user,
+                puzzle=puzzle,
+                last_edit_time=now - timedelta(minutes=j * 4),
+                num_edits=j * 2,
+            )
+            for puzzle in puzzles
+            for j, user in enumerate(users)
+        )
+        return puzzles
+
     # Hunt methods
 
     def get_hunt(self):
@@ -49,14 +116,27 @@ class CardboardTestCase:
     def create_puzzle(self, data):
         return self.client.post(f"/api/v1/hunts/{self._hunt.pk}/puzzles", data)
 
+    def bulk_create_puzzles(self, data):
+        return self.client.post(f"/api/v1/hunts/{self._hunt.pk}/puzzles/bulk", data)
+
+    def bulk_update_puzzles(self, puzzle_ids, operations):
+        return self.client.patch(
+            f"/api/v1/hunts/{self._hunt.pk}/puzzles/bulk",
+            {"puzzle_ids": puzzle_ids, "operations": operations},
+        )
+
     def delete_puzzle(self, pk):
         return self.client.delete(f"/api/v1/hunts/{self._hunt.pk}/puzzles/{pk}")
 
     def edit_puzzle(self, pk, data):
         return self.client.patch(f"/api/v1/hunts/{self._hunt.pk}/puzzles/{pk}", data)
 
-    def list_puzzles(self):
-        return self.client.get(f"/api/v1/hunts/{self._hunt.pk}/puzzles")
+    def list_puzzles(self, since=None):
+        if since is None:
+            return self.client.get(f"/api/v1/hunts/{self._hunt.pk}/puzzles")
+        return self.client.get(
+            f"/api/v1/hunts/{self._hunt.pk}/puzzles", {"since": since}
+        )
 
     # Tag methods
 
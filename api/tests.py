@@ -1,17 +1,34 @@
+import gzip
+import json
+from datetime import timedelta
 from unittest.mock import patch
 
+import brotli
+import msgpack
 from django.conf import settings
+from django.db import connection
 from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
+from guardian.shortcuts import assign_perm
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
 import google_api_lib
 import google_api_lib.tests
-from puzzles.models import Puzzle
+from accounts.models import Puzzler
+from answers.models import Answer
+from cardboard import metrics
+from chat.fake_service import FakeChatService
+from chat.models import ChatRoom
+from hunts.permissions import get_puzzle_hunt_id
+from puzzles.models import Puzzle, PuzzleActivity
 from puzzles.puzzle_tag import LOCATION_COLOR, META_COLOR, PuzzleTag, PuzzleTagColor
 
+from .serializers import PuzzleListSerializer, PuzzleSerializer, PuzzleTagSerializer
 from .test_helpers import CardboardTestCase
+from .views import PuzzleViewSet
 
 TEST_URL = "https://cardboard.test/"
 TEST_NAME = "Test"
@@ -45,6 +62,294 @@ class ApiTests(CardboardTestCase, APITestCase):
         self.set_permissions_level(can_access=False)
         self.check_response_status(self.get_hunt(), status.HTTP_403_FORBIDDEN)
 
+    def test_hunt_permissions_cached(self):
+        puzzle = Puzzle.objects.create(name=TEST_NAME, hunt=self._hunt, url=TEST_URL)
+        requests = [
+            self.get_hunt,
+            self.list_puzzles,
+            lambda: self.create_tag(puzzle.pk, {"name": "taggy", "color": "primary"}),
+        ]
+        for request in requests:
+            self.check_response_status(request())
+        for request in requests:
+            with CaptureQueriesContext(connection) as queries:
+                self.check_response_status(request())
+            self.assertFalse(
+                any(
+                    "guardian_" in query["sql"] or "auth_group" in query["sql"]
+                    for query in queries.captured_queries
+                )
+            )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(get_puzzle_hunt_id(puzzle.pk), self._hunt.pk)
+        self.assertEqual(len(queries), 0)
+        self.assertIsNone(get_puzzle_hunt_id(puzzle.pk + 1000))
+
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(self.get_hunt(), status.HTTP_403_FORBIDDEN)
+        assign_perm("hunt_access", self._user, self._hunt)
+        self.check_response_status(self.get_hunt())
+
+    def test_get_hunt_stats(self):
+        Puzzle.objects.create(name=TEST_NAME, hunt=self._hunt, url=TEST_URL)
+        response = self.client.get(f"/api/v1/hunts/{self._hunt.pk}/stats")
+        self.check_response_status(response)
+        self.assertEqual(response.data["num_unlocked"], 1)
+        self.assertEqual(response.data["num_solved"], 0)
+
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(
+            self.client.get(f"/api/v1/hunts/{self._hunt.pk}/stats"),
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_get_hunt_etag(self):
+        response = self.get_hunt()
+        self.check_response_status(response)
+        etag = response["ETag"]
+
+        response = self.client.get(
+            f"/api/v1/hunts/{self._hunt.pk}", HTTP_IF_NONE_MATCH=etag
+        )
+        self.check_response_status(response, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PuzzleTag.objects.create(name="taggy", hunt=self._hunt)
+        response = self.client.get(
+            f"/api/v1/hunts/{self._hunt.pk}", HTTP_IF_NONE_MATCH=etag
+        )
+        self.check_response_status(response)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["puzzle_tags"]), 1)
+
+    def test_list_puzzles_etag(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.check_response_status(
+                self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
+            )
+        puzzle = Puzzle.objects.get()
+        url = f"/api/v1/hunts/{self._hunt.pk}/puzzles"
+
+        response = self.list_puzzles()
+        self.check_response_status(response)
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.check_response_status(response, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(
+            any("puzzles_puzzle" in query["sql"] for query in queries.captured_queries)
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.check_response_status(self.create_answer(puzzle.pk, {"text": "ans"}))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.check_response_status(response)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data[0]["guesses"][0]["text"], "ANS")
+
+    def test_list_puzzles_etag_permissions(self):
+        etag = self.list_puzzles()["ETag"]
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(
+            self.client.get(
+                f"/api/v1/hunts/{self._hunt.pk}/puzzles", HTTP_IF_NONE_MATCH=etag
+            ),
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def create_tagged_puzzles(self):
+        PuzzleTag.create_default_tags(self._hunt)
+        tag = PuzzleTag.objects.get(hunt=self._hunt, name=PuzzleTag.HIGH_PRIORITY)
+        for i in range(3):
+            Puzzle.objects.create(
+                name=f"{TEST_NAME}{i}", hunt=self._hunt, url=f"{TEST_URL}{i}"
+            ).tags.add(tag)
+        return tag
+
+    def test_list_puzzles_compact(self):
+        tag = self.create_tagged_puzzles()
+        url = f"/api/v1/hunts/{self._hunt.pk}/puzzles"
+        puzzles = self.client.get(url).json()
+
+        response = self.client.get(
+            url, HTTP_ACCEPT="application/vnd.cardboard.compact+json"
+        )
+        self.check_response_status(response)
+        compact = response.json()
+        self.assertEqual(compact["tags"], [PuzzleTagSerializer(tag).data])
+        self.assertEqual(
+            compact["puzzles"],
+            [{**puzzle, "tags": [tag.pk]} for puzzle in puzzles],
+        )
+        self.assertNotEqual(response["ETag"], self.client.get(url)["ETag"])
+
+        response = self.client.get(url, {"since": "", "format": "compact"})
+        self.assertEqual(response.json()["tags"], compact["tags"])
+        self.assertEqual(response.json()["puzzles"], compact["puzzles"])
+
+    def test_list_puzzles_msgpack(self):
+        self.create_tagged_puzzles()
+        url = f"/api/v1/hunts/{self._hunt.pk}/puzzles"
+        compact = self.client.get(url, {"format": "compact"}).json()
+
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+        self.check_response_status(response)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), compact)
+
+    def test_list_puzzles_compression(self):
+        self.create_tagged_puzzles()
+        url = f"/api/v1/hunts/{self._hunt.pk}/puzzles"
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].startswith("W/"))
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content)), self.client.get(url).json()
+        )
+        # Weak ETags from compressed responses still get 304s.
+        self.check_response_status(
+            self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]),
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(
+            json.loads(brotli.decompress(response.content)),
+            self.client.get(url).json(),
+        )
+
+    def test_list_puzzles_cache(self):
+        puzzle = Puzzle.objects.create(
+            name=TEST_NAME, hunt=self._hunt, url=TEST_URL, is_meta=False
+        )
+        Puzzle.objects.create(
+            name=META_NAME, hunt=self._hunt, url=META_URL, is_meta=True
+        )
+        expected = self.list_puzzles().data
+
+        misses = metrics.get_metrics().get("puzzle_cache_misses", 0)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.list_puzzles()
+        self.assertEqual(response.data, expected)
+        self.assertFalse(
+            any("answers_answer" in query["sql"] for query in queries.captured_queries)
+        )
+        self.assertEqual(metrics.get_metrics()["puzzle_cache_misses"], misses)
+
+        self.check_response_status(self.create_answer(puzzle.pk, {"text": "ans"}))
+        response = self.list_puzzles()
+        self.assertEqual(
+            [p["guesses"] for p in response.data if p["id"] == puzzle.pk][0][0]["text"],
+            "ANS",
+        )
+        # Only the answered puzzle was serialized again.
+        self.assertEqual(metrics.get_metrics()["puzzle_cache_misses"], misses + 1)
+
+    def test_list_puzzles_editors(self):
+        puzzle = Puzzle.objects.create(
+            name=TEST_NAME, hunt=self._hunt, url=TEST_URL, is_meta=False
+        )
+        now = timezone.now()
+        for i, (minutes_ago, num_edits) in enumerate([(1, 3), (2, 20), (60, 10)]):
+            user = Puzzler.objects.create_user(
+                username=f"editor{i}", first_name="Editor", last_name=str(i)
+            )
+            PuzzleActivity.objects.create(
+                user=user,
+                puzzle=puzzle,
+                last_edit_time=now - timedelta(minutes=minutes_ago),
+                num_edits=num_edits,
+            )
+        # Soft deleted activity doesn't count.
+        PuzzleActivity.objects.create(
+            user=Puzzler.objects.create_user(
+                username="deleted", first_name="Deleted", last_name="Editor"
+            ),
+            puzzle=puzzle,
+            last_edit_time=now,
+            num_edits=50,
+        ).delete()
+
+        response = self.list_puzzles()
+        self.check_response_status(response)
+        self.assertEqual(response.data[0]["recent_editors"], ["Editor 0", "Editor 1"])
+        self.assertEqual(response.data[0]["top_editors"], ["Editor 1", "Editor 2"])
+        self.assertEqual(response.data[0]["last_edited_on"], now - timedelta(minutes=1))
+
+    def test_list_puzzles_query_count(self):
+        def count_list_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.check_response_status(self.list_puzzles())
+            return len(queries)
+
+        Puzzle.objects.create(
+            name=TEST_NAME, hunt=self._hunt, url=TEST_URL, is_meta=False
+        )
+        # Warm up the permission cache.
+        self.get_hunt()
+        num_queries = count_list_queries()
+        for i in range(5):
+            Puzzle.objects.create(
+                name=f"{TEST_NAME}{i}", hunt=self._hunt, url=f"{TEST_URL}{i}"
+            )
+        self.assertEqual(count_list_queries(), num_queries)
+
+    @override_settings(HUNT_EVENTS_STREAM_SECONDS=2, HUNT_EVENTS_HEARTBEAT_SECONDS=1)
+    def test_hunt_events(self):
+        response = self.client.get(f"/api/v1/hunts/{self._hunt.pk}/events")
+        self.check_response_status(response)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        chunks = iter(response.streaming_content)
+        self.assertTrue(next(chunks).startswith(b"retry: "))
+        self.assertTrue(next(chunks).startswith(b"event: version\n"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            puzzle_id = self.create_puzzle(
+                {"name": TEST_NAME, "url": TEST_URL, "is_meta": False}
+            ).data["id"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_answer(puzzle_id, {"text": "ANSWER"})
+
+        # The stream ends by itself after HUNT_EVENTS_STREAM_SECONDS.
+        events = [chunk.decode() for chunk in chunks]
+        self.assertIn(
+            f'event: puzzles\ndata: {{"ids": [{puzzle_id}]}}\n\n',
+            events,
+        )
+        self.assertIn(
+            f'event: answers\ndata: {{"puzzle_id": {puzzle_id}}}\n\n',
+            events,
+        )
+        self.assertIn(": heartbeat\n\n", events)
+
+    @override_settings(HUNT_EVENTS_MAX_STREAMS=1, HUNT_EVENTS_STREAM_SECONDS=0)
+    def test_hunt_events_capped(self):
+        url = f"/api/v1/hunts/{self._hunt.pk}/events"
+        response = self.client.get(url)
+        self.check_response_status(response)
+
+        # Clients turned away fall back to polling.
+        busy = self.client.get(url)
+        self.check_response_status(busy, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertIn("Retry-After", busy)
+
+        # Finishing the stream frees up its slot.
+        list(response.streaming_content)
+        response = self.client.get(url)
+        self.check_response_status(response)
+        list(response.streaming_content)
+
+    def test_hunt_events_permissions(self):
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(
+            self.client.get(f"/api/v1/hunts/{self._hunt.pk}/events"),
+            status.HTTP_403_FORBIDDEN,
+        )
+
     def test_create_invalid_puzzle(self):
         # Missing name
         self.check_response_status(
@@ -123,6 +428,329 @@ class ApiTests(CardboardTestCase, APITestCase):
         puzzle = Puzzle.objects.get(is_meta=False)
         self.assertEqual(response.data["metas"], [meta_id])
 
+    def test_bulk_create_puzzles(self):
+        meta = Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        response = self.bulk_create_puzzles(
+            [
+                {
+                    "name": "Round meta",
+                    "url": "https://cardboard.test/round",
+                    "is_meta": True,
+                    "assigned_meta": META_NAME,
+                },
+                {
+                    "name": "Feeder 1",
+                    "url": "https://cardboard.test/1",
+                    "assigned_meta": "Round meta",
+                },
+                {
+                    "name": "Feeder 2",
+                    "url": "https://cardboard.test/2",
+                    "assigned_meta": META_NAME,
+                },
+                {"name": "Feeder 3", "url": "https://cardboard.test/3"},
+            ]
+        )
+        self.check_response_status(response)
+
+        round_meta = Puzzle.objects.get(name="Round meta")
+        feeders = Puzzle.objects.filter(name__startswith="Feeder").order_by("name")
+        self.assertEqual(list(round_meta.metas.all()), [meta])
+        self.assertEqual(list(feeders[0].metas.all()), [round_meta])
+        self.assertEqual(list(feeders[1].metas.all()), [meta])
+        self.assertEqual(list(feeders[2].metas.all()), [])
+        self.assertEqual(
+            sorted(round_meta.tags.values_list("name", flat=True)),
+            [META_NAME, "Round meta"],
+        )
+        self.assertEqual(
+            list(feeders[0].tags.values_list("name", flat=True)), ["Round meta"]
+        )
+        self.assertEqual(
+            list(feeders[1].tags.values_list("name", flat=True)), [META_NAME]
+        )
+        self.assertEqual(list(feeders[2].tags.all()), [])
+
+        # Returns the new puzzles and the existing meta they were assigned to.
+        self.assertEqual(
+            response.data,
+            PuzzleSerializer(
+                Puzzle.objects.filter(hunt=self._hunt).order_by("pk"), many=True
+            ).data,
+        )
+
+    def test_bulk_create_invalid_puzzles(self):
+        Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        Puzzle.objects.create(name=TEST_NAME, url=TEST_URL, hunt=self._hunt)
+        for data in [
+            [],
+            # Missing url
+            [{"name": "A"}],
+            # Duplicate names or URLs in the batch
+            [
+                {"name": "A", "url": "https://a.test/"},
+                {"name": "A", "url": "https://b.test/"},
+            ],
+            [
+                {"name": "A", "url": "https://a.test/"},
+                {"name": "B", "url": "https://a.test/"},
+            ],
+            # Name or URL of an existing puzzle
+            [{"name": TEST_NAME, "url": "https://a.test/"}],
+            [{"name": "A", "url": TEST_URL}],
+            # Assigned to a missing meta or a puzzle that isn't a meta
+            [{"name": "A", "url": "https://a.test/", "assigned_meta": "Missing"}],
+            [{"name": "A", "url": "https://a.test/", "assigned_meta": TEST_NAME}],
+            # Meta cycles
+            [
+                {
+                    "name": "A",
+                    "url": "https://a.test/",
+                    "is_meta": True,
+                    "assigned_meta": "A",
+                }
+            ],
+            [
+                {
+                    "name": "A",
+                    "url": "https://a.test/",
+                    "is_meta": True,
+                    "assigned_meta": "B",
+                },
+                {
+                    "name": "B",
+                    "url": "https://b.test/",
+                    "is_meta": True,
+                    "assigned_meta": "A",
+                },
+            ],
+        ]:
+            with self.subTest(data=data):
+                self.check_response_status(
+                    self.bulk_create_puzzles(data), status.HTTP_400_BAD_REQUEST
+                )
+        self.assertEqual(Puzzle.objects.count(), 2)
+
+    def test_bulk_create_puzzles_permissions(self):
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(
+            self.bulk_create_puzzles([{"name": TEST_NAME, "url": TEST_URL}]),
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(Puzzle.objects.count(), 0)
+
+    def test_bulk_create_puzzles_query_count(self):
+        Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+
+        def bulk_create(start, count):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.bulk_create_puzzles(
+                    [
+                        {
+                            "name": f"Puzzle {i}",
+                            "url": f"https://cardboard.test/{i}",
+                            "assigned_meta": META_NAME,
+                        }
+                        for i in range(start, start + count)
+                    ]
+                )
+            self.check_response_status(response)
+            return len(queries)
+
+        bulk_create(0, 1)  # warms up the permission cache
+        self.assertEqual(bulk_create(1, 2), bulk_create(3, 20))
+
+    def _create_puzzles(self, count, start=0):
+        return [
+            Puzzle.objects.create(
+                name=f"Puzzle {i}", url=f"https://cardboard.test/{i}", hunt=self._hunt
+            )
+            for i in range(start, start + count)
+        ]
+
+    def test_bulk_update_puzzles(self):
+        PuzzleTag.create_default_tags(self._hunt)
+        puzzles = self._create_puzzles(3)
+        puzzle_ids = [puzzle.pk for puzzle in puzzles]
+
+        response = self.bulk_update_puzzles(
+            puzzle_ids,
+            [
+                {"op": "add_tag", "name": "Word stuff", "color": PuzzleTagColor.BLUE},
+                {"op": "add_tag", "name": PuzzleTag.HIGH_PRIORITY},
+                {"op": "add_tag", "name": PuzzleTag.LOW_PRIORITY},
+                {"op": "set_status", "status": Puzzle.STUCK},
+            ],
+        )
+        self.check_response_status(response)
+        for puzzle in puzzles:
+            self.assertEqual(
+                sorted(puzzle.tags.values_list("name", flat=True)),
+                [PuzzleTag.LOW_PRIORITY, "Word stuff"],
+            )
+        self.assertEqual(
+            set(Puzzle.objects.values_list("status", flat=True)), {Puzzle.STUCK}
+        )
+        self.assertEqual(
+            response.data,
+            PuzzleSerializer(Puzzle.objects.order_by("pk"), many=True).data,
+        )
+
+        # Changing a tag's color changes it for every puzzle with the tag.
+        other_puzzle = self._create_puzzles(1, start=3)[0]
+        self.bulk_update_puzzles(
+            [other_puzzle.pk],
+            [{"op": "add_tag", "name": "Word stuff", "color": LOCATION_COLOR}],
+        )
+        tag = PuzzleTag.objects.get(name="Word stuff")
+        self.assertEqual(tag.color, LOCATION_COLOR)
+        self.assertTrue(tag.is_location)
+
+        # Tags no puzzle has left are deleted, unless they're default tags.
+        self.check_response_status(
+            self.bulk_update_puzzles(
+                puzzle_ids + [other_puzzle.pk],
+                [
+                    {"op": "remove_tag", "name": "Word stuff"},
+                    {"op": "remove_tag", "name": PuzzleTag.LOW_PRIORITY},
+                ],
+            )
+        )
+        self.assertFalse(PuzzleTag.objects.filter(name="Word stuff").exists())
+        self.assertTrue(PuzzleTag.objects.filter(name=PuzzleTag.LOW_PRIORITY).exists())
+        self.assertFalse(Puzzle.tags.through.objects.exists())
+
+    def test_bulk_update_puzzles_metas(self):
+        meta = Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        puzzles = self._create_puzzles(2)
+        puzzle_ids = [puzzle.pk for puzzle in puzzles]
+
+        response = self.bulk_update_puzzles(
+            puzzle_ids, [{"op": "add_tag", "name": META_NAME}]
+        )
+        self.check_response_status(response)
+        for puzzle in puzzles:
+            self.assertEqual(list(puzzle.metas.all()), [meta])
+            self.assertEqual(
+                list(puzzle.tags.values_list("name", flat=True)), [META_NAME]
+            )
+        # Returns the meta too, since its feeders changed.
+        self.assertEqual(
+            [puzzle["id"] for puzzle in response.data], [meta.pk] + puzzle_ids
+        )
+        self.assertEqual(response.data[0]["feeders"], puzzle_ids)
+
+        self.check_response_status(
+            self.bulk_update_puzzles(
+                puzzle_ids, [{"op": "remove_tag", "name": META_NAME}]
+            )
+        )
+        for puzzle in puzzles:
+            self.assertEqual(list(puzzle.metas.all()), [])
+            self.assertEqual(list(puzzle.tags.all()), [])
+
+    def test_bulk_update_invalid_puzzles(self):
+        meta = Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        puzzle = self._create_puzzles(1)[0]
+        puzzle.metas.add(meta)
+        meta.metas.add(
+            Puzzle.objects.create(
+                name="Metameta",
+                url="https://cardboard.test/mm",
+                hunt=self._hunt,
+                is_meta=True,
+            )
+        )
+        solved = Puzzle.objects.create(
+            name="Solved", url="https://cardboard.test/solved", hunt=self._hunt
+        )
+        solved.set_answer("ANSWER")
+
+        for puzzle_ids, operations in [
+            # Missing puzzles and operations
+            ([], [{"op": "set_status", "status": Puzzle.STUCK}]),
+            ([puzzle.pk], []),
+            ([puzzle.pk, 1234567], [{"op": "set_status", "status": Puzzle.STUCK}]),
+            # Bad operations
+            ([puzzle.pk], [{"op": "rename", "name": "A"}]),
+            ([puzzle.pk], [{"op": "add_tag"}]),
+            ([puzzle.pk], [{"op": "set_status", "status": Puzzle.SOLVED}]),
+            ([puzzle.pk], [{"op": "add_tag", "name": "A", "color": META_COLOR}]),
+            # Solved puzzles' status
+            ([solved.pk], [{"op": "set_status", "status": Puzzle.STUCK}]),
+        ]:
+            with self.subTest(puzzle_ids=puzzle_ids, operations=operations):
+                self.check_response_status(
+                    self.bulk_update_puzzles(puzzle_ids, operations),
+                    status.HTTP_400_BAD_REQUEST,
+                )
+
+        for puzzle_ids, operations in [
+            # Meta cycles
+            ([meta.pk], [{"op": "add_tag", "name": META_NAME}]),
+            ([puzzle.pk, meta.pk], [{"op": "add_tag", "name": META_NAME}]),
+            # Metas can't lose their own tag
+            ([meta.pk], [{"op": "remove_tag", "name": META_NAME}]),
+        ]:
+            with self.subTest(puzzle_ids=puzzle_ids, operations=operations):
+                # Earlier operations are rolled back too.
+                operations = [{"op": "add_tag", "name": "Rolled back"}] + operations
+                self.check_response_status(
+                    self.bulk_update_puzzles(puzzle_ids, operations),
+                    status.HTTP_400_BAD_REQUEST,
+                )
+        self.assertFalse(PuzzleTag.objects.filter(name="Rolled back").exists())
+        self.assertEqual(
+            set(Puzzle.objects.values_list("status", flat=True)),
+            {Puzzle.SOLVING, Puzzle.SOLVED},
+        )
+
+    def test_bulk_update_puzzles_permissions(self):
+        puzzle = self._create_puzzles(1)[0]
+        self.set_permissions_level(can_access=False)
+        self.check_response_status(
+            self.bulk_update_puzzles(
+                [puzzle.pk], [{"op": "set_status", "status": Puzzle.STUCK}]
+            ),
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(Puzzle.objects.get().status, Puzzle.SOLVING)
+
+    def test_bulk_update_puzzles_query_count(self):
+        meta = Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        operations = [
+            {"op": "add_tag", "name": "Slog", "color": PuzzleTagColor.GRAY},
+            {"op": "add_tag", "name": META_NAME},
+            {"op": "set_status", "status": Puzzle.STUCK},
+            {"op": "remove_tag", "name": "Slog"},
+        ]
+
+        def bulk_update(puzzles):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.bulk_update_puzzles(
+                    [puzzle.pk for puzzle in puzzles], operations
+                )
+            self.check_response_status(response)
+            return len(queries)
+
+        bulk_update(self._create_puzzles(1))  # warms up the permission cache
+        self.assertEqual(
+            bulk_update(self._create_puzzles(2, start=1)),
+            bulk_update(self._create_puzzles(20, start=3)),
+        )
+
     def test_delete_puzzle(self):
         self.check_response_status(
             self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
@@ -215,6 +843,75 @@ class ApiTests(CardboardTestCase, APITestCase):
             status.HTTP_403_FORBIDDEN,
         )
 
+    @patch("api.views.DELTA_CURSOR_OVERLAP", timedelta(0))
+    def test_list_puzzles_since(self):
+        self.check_response_status(
+            self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
+        )
+        self.check_response_status(
+            self.create_puzzle(
+                {"name": "second test", "url": "https://secondtest.test/"}
+            )
+        )
+        puzzle = Puzzle.objects.get(name=TEST_NAME)
+        other = Puzzle.objects.get(name="second test")
+
+        response = self.list_puzzles(since="")
+        self.check_response_status(response)
+        self.assertEqual(len(response.data["puzzles"]), 2)
+        self.assertEqual(response.data["deleted"], [])
+        cursor = response.data["cursor"]
+
+        response = self.list_puzzles(since=cursor)
+        self.check_response_status(response)
+        self.assertEqual(response.data["puzzles"], [])
+        cursor = response.data["cursor"]
+
+        # Related-row changes count as changes to the puzzle.
+        self.check_response_status(self.create_answer(puzzle.pk, {"text": "ans"}))
+        response = self.list_puzzles(since=cursor)
+        self.assertEqual([p["id"] for p in response.data["puzzles"]], [puzzle.pk])
+        self.assertEqual(response.data["puzzles"][0]["guesses"][0]["text"], "ANS")
+        cursor = response.data["cursor"]
+
+        self.check_response_status(
+            self.create_tag(other.pk, {"name": "taggy", "color": PuzzleTagColor.BLUE})
+        )
+        response = self.list_puzzles(since=cursor)
+        self.assertEqual([p["id"] for p in response.data["puzzles"]], [other.pk])
+        cursor = response.data["cursor"]
+
+        self.check_response_status(self.delete_puzzle(other.pk))
+        response = self.list_puzzles(since=cursor)
+        self.assertEqual(response.data["puzzles"], [])
+        self.assertEqual(response.data["deleted"], [other.pk])
+
+    def test_list_puzzles_since_meta_assignment(self):
+        self.check_response_status(
+            self.create_puzzle({"name": META_NAME, "url": META_URL, "is_meta": True})
+        )
+        self.check_response_status(
+            self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
+        )
+        meta = Puzzle.objects.get(is_meta=True)
+        puzzle = Puzzle.objects.get(is_meta=False)
+        Puzzle.objects.update(updated_on=timezone.now() - timedelta(hours=1))
+
+        cursor = (timezone.now() - timedelta(minutes=30)).isoformat()
+        response = self.list_puzzles(since=cursor)
+        self.assertEqual(response.data["puzzles"], [])
+
+        puzzle.metas.add(meta)
+        response = self.list_puzzles(since=cursor)
+        self.assertEqual(
+            {p["id"] for p in response.data["puzzles"]}, {meta.pk, puzzle.pk}
+        )
+
+    def test_list_puzzles_invalid_since(self):
+        self.check_response_status(
+            self.list_puzzles(since="not a time"), status.HTTP_400_BAD_REQUEST
+        )
+
     def test_add_answer(self):
         self.check_response_status(
             self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
@@ -284,6 +981,30 @@ class ApiTests(CardboardTestCase, APITestCase):
         # check that you can still resubmit deleted answers
         self.check_response_status(self.create_answer(puzzle.pk, {"text": "ANSWER"}))
 
+    def test_delete_answer_solved_at(self):
+        self.check_response_status(
+            self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
+        )
+        puzzle = Puzzle.objects.get()
+
+        self.check_response_status(self.create_answer(puzzle.pk, {"text": "ANSWER"}))
+        self.check_response_status(
+            self.create_answer(puzzle.pk, {"text": "ANSWER TWO"})
+        )
+
+        puzzle.refresh_from_db()
+        guesses = list(puzzle.guesses.all())
+        self.assertEqual(puzzle.solved_at, guesses[1].created_on)
+
+        # Deleting the latest correct answer falls back to the one before it.
+        self.check_response_status(self.delete_answer(puzzle.pk, guesses[1].pk))
+        puzzle.refresh_from_db()
+        self.assertEqual(puzzle.solved_at, guesses[0].created_on)
+
+        self.check_response_status(self.delete_answer(puzzle.pk, guesses[0].pk))
+        puzzle.refresh_from_db()
+        self.assertIsNone(puzzle.solved_at)
+
     def test_delete_answer_permissions(self):
         self.check_response_status(
             self.create_puzzle({"name": TEST_NAME, "url": TEST_URL})
@@ -530,6 +1251,163 @@ class ApiTests(CardboardTestCase, APITestCase):
             )
 
 
+@override_settings(
+    CHAT_DEFAULT_SERVICE=None,
+    CHAT_SERVICES={},
+)
+class PuzzleListSerializerParityTests(CardboardTestCase, APITestCase):
+    def assert_parity(self):
+        queryset = PuzzleViewSet()._get_puzzles_queryset(self._hunt).order_by("pk")
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(PuzzleListSerializer(queryset).data),
+            renderer.render(PuzzleSerializer(queryset, many=True).data),
+        )
+
+    def create_puzzle(self, name, **kwargs):
+        return Puzzle.objects.create(
+            name=name, hunt=self._hunt, url=f"{TEST_URL}{name}", **kwargs
+        )
+
+    def test_empty_hunt(self):
+        self.assert_parity()
+
+    def test_plain_puzzle(self):
+        self.create_puzzle(TEST_NAME)
+        self.assert_parity()
+
+    def test_puzzle_with_everything(self):
+        meta = self.create_puzzle(META_NAME, is_meta=True)
+        puzzle = self.create_puzzle(
+            TEST_NAME,
+            notes="some notes",
+            sheet="https://sheets.test/1",
+            chat_room=ChatRoom.objects.create(
+                name=TEST_NAME,
+                service="FAKE",
+                text_channel_url="https://chat.test/text",
+                audio_channel_url="https://chat.test/audio",
+            ),
+        )
+        other_meta = self.create_puzzle("Other meta", is_meta=True)
+        deleted_meta = self.create_puzzle("Deleted meta", is_meta=True)
+        puzzle.metas.add(other_meta, meta, deleted_meta)
+        deleted_meta.delete()
+
+        PuzzleTag.create_default_tags(self._hunt)
+        puzzle.tags.add(
+            *PuzzleTag.objects.filter(
+                hunt=self._hunt,
+                name__in=[PuzzleTag.HIGH_PRIORITY, PuzzleTag.LOW_PRIORITY],
+            ),
+            PuzzleTag.objects.create(
+                name="Location", hunt=self._hunt, color=LOCATION_COLOR, is_location=True
+            ),
+        )
+        Answer.objects.create(puzzle=puzzle, text="WRONG", status=Answer.INCORRECT)
+        Answer.objects.create(puzzle=puzzle, text="RIGHT", status=Answer.CORRECT)
+        puzzle.status = Puzzle.SOLVED
+        puzzle.save()
+
+        now = timezone.now()
+        for i in range(7):
+            PuzzleActivity.objects.create(
+                user=Puzzler.objects.create_user(
+                    username=f"editor{i}", first_name="Editor", last_name=str(i)
+                ),
+                puzzle=puzzle,
+                last_edit_time=now - timedelta(minutes=7 * i),
+                num_edits=i * 3,
+            )
+
+        self.assert_parity()
+
+    def test_many_puzzles(self):
+        metas = [self.create_puzzle(f"Meta {i}", is_meta=True) for i in range(3)]
+        for i in range(10):
+            puzzle = self.create_puzzle(f"{TEST_NAME} {i}")
+            puzzle.metas.add(*metas[: i % 4])
+            if i % 2:
+                Answer.objects.create(
+                    puzzle=puzzle, text=f"ANSWER{i}", status=Answer.CORRECT
+                )
+        self.assert_parity()
+
+
+@override_settings(
+    CHAT_DEFAULT_SERVICE="FAKE",
+    CHAT_SERVICES={
+        "FAKE": FakeChatService,
+    },
+    GOOGLE_API_AUTHN_INFO={},
+)
+class BulkTaskTests(CardboardTestCase, APITestCase):
+    @patch("google_api_lib.tasks.create_google_sheets_for_puzzles.delay")
+    @patch("chat.tasks.create_channels_for_puzzles.delay")
+    @patch("chat.tasks.announce_puzzle_unlocks.delay")
+    def test_bulk_create_puzzles_tasks(
+        self, announce_puzzle_unlocks, create_channels, create_sheets
+    ):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.bulk_create_puzzles(
+                [
+                    {
+                        "name": "A",
+                        "url": "https://cardboard.test/a",
+                        "create_channels": True,
+                    },
+                    {"name": "B", "url": "https://cardboard.test/b"},
+                ]
+            )
+        self.check_response_status(response)
+        a, b = Puzzle.objects.order_by("name")
+        self.assertEqual(a.chat_room.name, "A")
+        self.assertEqual(b.chat_room.name, "B")
+
+        # Each pipeline gets the whole batch at once.
+        announce_puzzle_unlocks.assert_called_once_with([a.pk, b.pk])
+        create_channels.assert_called_once_with([a.pk])
+        create_sheets.assert_called_once_with([a.pk, b.pk])
+
+    @patch("google_api_lib.tasks.update_meta_and_metameta_sheets_delayed")
+    @patch("chat.tasks.handle_puzzles_meta_change.delay")
+    @patch("chat.tasks.handle_tag_added_to_puzzles.delay")
+    def test_bulk_update_puzzles_tasks(
+        self, handle_tag_added, handle_meta_change, update_meta_sheets
+    ):
+        meta = Puzzle.objects.create(
+            name=META_NAME, url=META_URL, hunt=self._hunt, is_meta=True
+        )
+        puzzles = [
+            Puzzle.objects.create(
+                name=f"Puzzle {i}",
+                url=f"https://cardboard.test/{i}",
+                hunt=self._hunt,
+                chat_room=ChatRoom.objects.create(service="FAKE", name=f"Puzzle {i}"),
+            )
+            for i in range(3)
+        ]
+        puzzle_ids = [puzzle.pk for puzzle in puzzles]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.check_response_status(
+                self.bulk_update_puzzles(
+                    puzzle_ids,
+                    [
+                        {"op": "add_tag", "name": META_NAME},
+                        {"op": "add_tag", "name": "Slog"},
+                    ],
+                )
+            )
+
+        # Each side effect happens once for the whole batch.
+        update_meta_sheets.assert_called_once_with(meta)
+        handle_meta_change.assert_called_once_with(puzzle_ids)
+        self.assertEqual(handle_tag_added.call_count, 2)
+        handle_tag_added.assert_any_call(puzzle_ids, META_NAME)
+        handle_tag_added.assert_any_call(puzzle_ids, "Slog")
+
+
 @override_settings(
     CHAT_DEFAULT_SERVICE=None,
     CHAT_SERVICES={},
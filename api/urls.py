@@ -8,6 +8,18 @@ hunt_detail = views.HuntViewSet.as_view(
     }
 )
 
+hunt_stats = views.HuntViewSet.as_view(
+    {
+        "get": "stats",
+    }
+)
+
+hunt_events = views.HuntEventsView.as_view(
+    {
+        "get": "retrieve",
+    }
+)
+
 puzzle_list = views.PuzzleViewSet.as_view(
     {
         "get": "list",
@@ -15,6 +27,13 @@ puzzle_list = views.PuzzleViewSet.as_view(
     }
 )
 
+puzzle_bulk = views.PuzzleViewSet.as_view(
+    {
+        "post": "bulk_create",
+        "patch": "bulk_update",
+    }
+)
+
 puzzle_detail = views.PuzzleViewSet.as_view(
     {
         "get": "retrieve",
@@ -57,7 +76,10 @@ tag_detail = views.PuzzleTagViewSet.as_view(
 
 urlpatterns = [
     path("v1/hunts/<int:pk>", hunt_detail, name="hunt_detail"),
+    path("v1/hunts/<int:pk>/stats", hunt_stats, name="hunt_stats"),
+    path("v1/hunts/<int:pk>/events", hunt_events, name="hunt_events"),
     path("v1/hunts/<int:hunt_id>/puzzles", puzzle_list, name="puzzle_list"),
+    path("v1/hunts/<int:hunt_id>/puzzles/bulk", puzzle_bulk, name="puzzle_bulk"),
     path(
         "v1/hunts/<int:hunt_id>/puzzles/<int:pk>", puzzle_detail, name="puzzle_detail"
     ),
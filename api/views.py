@@ -1,40 +1,97 @@
 import datetime
 import logging
+import time
+from collections import defaultdict
 
+import dateutil.parser
 from dateutil import tz
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import Exists, Max, Min, OuterRef, Prefetch, Q
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 import chat.tasks
 import google_api_lib.tasks
 from answers.models import Answer
 from chat.models import ChatRoom
+from hunts.events import open_hunt_event_stream
 from hunts.models import Hunt
-from puzzles.models import Puzzle, PuzzleModelError, is_ancestor
+from hunts.stats import get_hunt_stats
+from hunts.versions import get_hunt_version
+from puzzles.models import (
+    InvalidMetaPuzzleError,
+    MetaClosure,
+    Puzzle,
+    PuzzleActivity,
+    PuzzleModelError,
+    is_ancestor,
+    touch_puzzles,
+    update_meta_closure,
+    update_progression,
+)
 from puzzles.puzzle_tag import LOCATION_COLOR, PuzzleTag, PuzzleTagColor
 
+from .cache import serialize_puzzles
 from .permissions import (
     AnswerAccessPermission,
     HuntAccessPermission,
     PuzzleAccessPermission,
     PuzzleTagAccessPermission,
 )
+from .renderers import COMPACT_RENDERER_CLASSES, EventStreamRenderer
 from .serializers import (
     AnswerSerializer,
     HuntSerializer,
+    PuzzleBulkCreateSerializer,
+    PuzzleBulkOperationSerializer,
+    PuzzleBulkUpdateSerializer,
+    PuzzleListSerializer,
     PuzzleNotesSerializer,
     PuzzleSerializer,
     PuzzleTagSerializer,
+    compact_puzzles,
 )
 
 logger = logging.getLogger(__name__)
 
+# Incremental puzzle list requests re-send anything changed this long before the
+# client's cursor, to cover transactions that were still in flight when the
+# cursor was issued. Clients treat the results as upserts, so overlap is harmless.
+DELTA_CURSOR_OVERLAP = datetime.timedelta(seconds=10)
+
+# Largest number of puzzles that can be created in one bulk create request.
+MAX_BULK_CREATE_PUZZLES = 200
+
+# Puzzle lists include editors from a sliding time window, so their ETags also
+# expire after this long even if nothing was written.
+PUZZLE_LIST_ETAG_LIFETIME_SECONDS = 60
+
+
+def _with_etag(response, etag):
+    response["ETag"] = etag
+    # Have browsers revalidate on each request rather than reuse the response.
+    response["Cache-Control"] = "private, no-cache"
+    # Responses may be encoded differently depending on the Accept header.
+    patch_vary_headers(response, ("Accept",))
+    return response
+
+
+def _maybe_not_modified(request, etag):
+    """Returns a 304 response if the client already has `etag`, otherwise None."""
+    # Compressed responses carry weak versions of the ETag, which still match.
+    etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in etags or f"W/{etag}" in etags:
+        return _with_etag(Response(status=304), etag)
+    return None
+
+
 # Right now IsAuthenticated ensures that only logged-in users
 # can use the API, but it does not test permissions beyond that.
 # TODO: per-hunt user permissions/authentication
@@ -45,6 +102,48 @@ class HuntViewSet(viewsets.ModelViewSet):
     serializer_class = HuntSerializer
     queryset = Hunt.objects.all()
 
+    def retrieve(self, request, *args, **kwargs):
+        hunt = self.get_object()
+        # The version has to be read before the data it describes.
+        etag = f'"hunt-{get_hunt_version(hunt.pk)}"'
+        not_modified = _maybe_not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
+        return _with_etag(Response(self.get_serializer(hunt).data), etag)
+
+    def stats(self, request, *args, **kwargs):
+        """Returns the stats shown on the hunt's stats page."""
+        return Response(get_hunt_stats(self.get_object()))
+
+
+class HuntEventsView(viewsets.ViewSet):
+    """
+    Streams server-sent events describing changes to the hunt, so that clients
+    can refetch as soon as something changes instead of polling on a timer.
+    """
+
+    permission_classes = [IsAuthenticated, HuntAccessPermission]
+    renderer_classes = [EventStreamRenderer]
+
+    def retrieve(self, request, pk=None):
+        hunt = get_object_or_404(Hunt, pk=pk)
+        self.check_object_permissions(request, hunt)
+
+        stream = open_hunt_event_stream(hunt.pk)
+        if stream is None:
+            # EventSource doesn't reconnect after an error status, so clients
+            # poll until they try again later.
+            response = HttpResponse(status=503)
+            response["Retry-After"] = settings.HUNT_EVENTS_BUSY_RETRY_SECONDS
+            return response
+
+        response = StreamingHttpResponse(stream, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx-style proxies from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
 
 class AnswerViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, AnswerAccessPermission]
@@ -88,6 +187,7 @@ class AnswerViewSet(viewsets.ModelViewSet):
             answer = Answer(text=text, puzzle=puzzle)
             if puzzle.hunt.settings.answer_queue_enabled:
                 puzzle.status = Puzzle.PENDING
+                puzzle.solved_at = None
             else:
                 # If no answer queue, we assume that the submitted answer is the
                 # correct answer.
@@ -106,6 +206,8 @@ class AnswerViewSet(viewsets.ModelViewSet):
                         )
                     )
                 answer.save()
+                # The new answer is the latest correct one.
+                puzzle.solved_at = answer.created_on
                 transaction.on_commit(
                     lambda: AnswerViewSet._maybe_update_meta_sheets_for_feeder(puzzle)
                 )
@@ -147,7 +249,9 @@ class AnswerViewSet(viewsets.ModelViewSet):
 
                     puzzle.tags.remove(backsolve_tag[0])
 
-                puzzle.save()
+            # The deleted answer may have been the latest correct one.
+            puzzle.update_solved_at()
+            puzzle.save()
 
             transaction.on_commit(
                 lambda: AnswerViewSet._maybe_update_sheets_title(puzzle)
@@ -193,21 +297,219 @@ class AnswerViewSet(viewsets.ModelViewSet):
         return Response(PuzzleSerializer(puzzle).data)
 
 
+class PuzzleBulkUpdate:
+    """
+    Applies tag and status changes to many puzzles at once for
+    PuzzleViewSet.bulk_update. Each change takes a fixed number of bulk queries.
+    Bulk queries skip the m2m signal handlers, so the side effects those would
+    have had are collected instead, and finish() applies them once per puzzle
+    or meta.
+    """
+
+    def __init__(self, hunt, puzzles):
+        self.hunt = hunt
+        self.puzzles = puzzles
+        self.puzzle_ids = [puzzle.pk for puzzle in puzzles]
+        self.touched_ids = set(self.puzzle_ids)
+        self.changed_metas = {}
+        self.recategorized_ids = set()
+        self.tagged_ids = defaultdict(set)
+        self.untagged_ids = defaultdict(set)
+        self.update_sheets_titles = False
+
+    def apply(self, operation):
+        if operation["op"] == PuzzleBulkOperationSerializer.ADD_TAG:
+            self.add_tag(operation["name"], operation.get("color"))
+        elif operation["op"] == PuzzleBulkOperationSerializer.REMOVE_TAG:
+            self.remove_tag(operation["name"])
+        elif operation["op"] == PuzzleBulkOperationSerializer.SET_STATUS:
+            Puzzle.objects.filter(pk__in=self.puzzle_ids).update(
+                status=operation["status"]
+            )
+
+    def add_tag(self, name, color):
+        tag, _ = PuzzleTag.objects.get_or_create(name=name, hunt=self.hunt)
+        if tag.is_meta:
+            meta = Puzzle.objects.get(name=tag.name, hunt=self.hunt)
+            tagged_ids = self._assign_meta(meta, tag)
+        else:
+            if color is not None and color != tag.color:
+                PuzzleTag.objects.filter(pk=tag.pk).update(
+                    color=color, is_location=color == LOCATION_COLOR
+                )
+                # The color shows up on every puzzle with the tag.
+                self.touched_ids.update(tag.puzzles.values_list("pk", flat=True))
+
+            opposite_tag_name = {
+                PuzzleTag.HIGH_PRIORITY: PuzzleTag.LOW_PRIORITY,
+                PuzzleTag.LOW_PRIORITY: PuzzleTag.HIGH_PRIORITY,
+            }.get(tag.name)
+            if opposite_tag_name:
+                Puzzle.tags.through.objects.filter(
+                    puzzle_id__in=self.puzzle_ids,
+                    puzzletag__name=opposite_tag_name,
+                    puzzletag__hunt=self.hunt,
+                ).delete()
+
+            tagged_ids = self._exclude_tagged(tag)
+            Puzzle.tags.through.objects.bulk_create(
+                [Puzzle.tags.through(puzzle_id=pk, puzzletag=tag) for pk in tagged_ids],
+                ignore_conflicts=True,
+            )
+
+        self.tagged_ids[tag.name].update(tagged_ids)
+        if tag.name.upper() == PuzzleTag.BACKSOLVED.upper():
+            self.update_sheets_titles = True
+
+    def remove_tag(self, name):
+        tag = PuzzleTag.objects.filter(name=name, hunt=self.hunt).first()
+        if tag is None:
+            return
+
+        if tag.is_meta:
+            meta = Puzzle.objects.get(name=tag.name, hunt=self.hunt)
+            if meta.pk in self.puzzle_ids:
+                raise InvalidMetaPuzzleError(
+                    "You cannot remove a meta's tag (%s) from itself" % tag.name
+                )
+            untagged_ids = self._unassign_meta(meta, tag)
+        else:
+            untagged_ids = set(self.puzzle_ids) - self._exclude_tagged(tag)
+            Puzzle.tags.through.objects.filter(
+                puzzletag=tag, puzzle_id__in=untagged_ids
+            ).delete()
+            # clear db of dangling tags
+            if not tag.is_default and not tag.puzzles.exists():
+                tag.delete()
+
+        self.untagged_ids[tag.name].update(untagged_ids)
+        if tag.name.upper() == PuzzleTag.BACKSOLVED.upper():
+            self.update_sheets_titles = True
+
+    def _exclude_tagged(self, tag):
+        """Returns the ids of the puzzles that don't have `tag`."""
+        tagged = Puzzle.tags.through.objects.filter(
+            puzzletag=tag, puzzle_id__in=self.puzzle_ids
+        ).values_list("puzzle_id", flat=True)
+        return set(self.puzzle_ids) - set(tagged)
+
+    def _assign_meta(self, meta, meta_tag):
+        if (
+            meta.pk in self.puzzle_ids
+            or MetaClosure.objects.filter(
+                descendant=meta, ancestor_id__in=self.puzzle_ids
+            ).exists()
+        ):
+            raise InvalidMetaPuzzleError(
+                "Unable to assign metapuzzle since doing so would introduce a "
+                "meta-cycle."
+            )
+
+        assigned_ids = set(self.puzzle_ids) - set(
+            Puzzle.metas.through.objects.filter(
+                to_puzzle=meta, from_puzzle_id__in=self.puzzle_ids
+            ).values_list("from_puzzle_id", flat=True)
+        )
+        Puzzle.metas.through.objects.bulk_create(
+            [
+                Puzzle.metas.through(from_puzzle_id=pk, to_puzzle=meta)
+                for pk in assigned_ids
+            ]
+        )
+        Puzzle.tags.through.objects.bulk_create(
+            [
+                Puzzle.tags.through(puzzle_id=pk, puzzletag=meta_tag)
+                for pk in assigned_ids
+            ],
+            ignore_conflicts=True,
+        )
+        self._metas_changed(meta, assigned_ids)
+        return assigned_ids
+
+    def _unassign_meta(self, meta, meta_tag):
+        links = Puzzle.metas.through.objects.filter(
+            to_puzzle=meta, from_puzzle_id__in=self.puzzle_ids
+        )
+        unassigned_ids = set(links.values_list("from_puzzle_id", flat=True))
+        links.delete()
+        Puzzle.tags.through.objects.filter(
+            puzzletag=meta_tag, puzzle_id__in=unassigned_ids
+        ).delete()
+        self._metas_changed(meta, unassigned_ids)
+        return unassigned_ids
+
+    def _metas_changed(self, meta, puzzle_ids):
+        if puzzle_ids:
+            self.changed_metas[meta.pk] = meta
+            self.recategorized_ids.update(puzzle_ids)
+            self.touched_ids.add(meta.pk)
+
+    def finish(self):
+        """Bumps the changed puzzles and schedules everything else for after commit."""
+        touch_puzzles(self.touched_ids)
+        update_meta_closure(self.recategorized_ids)
+        update_progression(self.recategorized_ids)
+
+        chat_ids = {puzzle.pk for puzzle in self.puzzles if puzzle.chat_room_id}
+
+        def tasks():
+            for tag_name, puzzle_ids in self.tagged_ids.items():
+                if puzzle_ids & chat_ids:
+                    chat.tasks.handle_tag_added_to_puzzles.delay(
+                        sorted(puzzle_ids & chat_ids), tag_name
+                    )
+            for tag_name, puzzle_ids in self.untagged_ids.items():
+                if puzzle_ids & chat_ids:
+                    chat.tasks.handle_tag_removed_from_puzzles.delay(
+                        sorted(puzzle_ids & chat_ids), tag_name
+                    )
+            if self.recategorized_ids & chat_ids:
+                chat.tasks.handle_puzzles_meta_change.delay(
+                    sorted(self.recategorized_ids & chat_ids)
+                )
+
+            if google_api_lib.enabled():
+                for meta in self.changed_metas.values():
+                    google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(meta)
+            if self.update_sheets_titles:
+                for puzzle in self.puzzles:
+                    AnswerViewSet._maybe_update_sheets_title(puzzle)
+
+        transaction.on_commit(tasks)
+
+
 class PuzzleViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, PuzzleAccessPermission]
     serializer_class = PuzzleSerializer
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + COMPACT_RENDERER_CLASSES
+
+    def _get_hunt(self):
+        return get_object_or_404(
+            Hunt.objects.select_related("settings"), pk=self.kwargs["hunt_id"]
+        )
 
     def get_queryset(self):
-        hunt_id = self.kwargs["hunt_id"]
-        hunt = get_object_or_404(Hunt.objects.select_related("settings"), pk=hunt_id)
+        return self._get_puzzles_queryset(self._get_hunt())
+
+    def _get_puzzles_queryset(self, hunt):
         before_time = (
             datetime.datetime.now(tz=tz.UTC) - hunt.settings.active_user_lookback
         )
 
+        # The join doesn't go through PuzzleActivity's manager, so soft deleted
+        # activity has to be left out by hand.
+        live_activity = Q(puzzle_activities__deleted_at__isnull=True)
+        recent_edit = live_activity & Q(
+            puzzle_activities__last_edit_time__gt=before_time
+        )
+
         return (
-            Puzzle.objects.filter(hunt__id=hunt_id)
-            .select_related("chat_room")
-            .prefetch_related("metas", "feeders")
+            Puzzle.objects.filter(hunt=hunt)
+            .select_related("chat_room", "hunt__settings")
+            .prefetch_related(
+                Prefetch("metas", queryset=Puzzle.objects.order_by("pk")),
+                Prefetch("feeders", queryset=Puzzle.objects.order_by("pk")),
+            )
             .prefetch_related("tags")
             .prefetch_related(
                 Prefetch(
@@ -216,25 +518,98 @@ class PuzzleViewSet(viewsets.ModelViewSet):
                     to_attr="_prefetched_correct_answers",
                 )
             )
+            # Editor names for PuzzleSerializer; PuzzleListSerializer drops
+            # this and looks them up for all puzzles at once instead.
             .prefetch_related(
                 Prefetch(
-                    "active_users",
-                    queryset=get_user_model()
-                    .objects.filter(puzzle_activities__last_edit_time__gt=before_time)
-                    .distinct(),
-                    to_attr="_recent_editors",
+                    "puzzle_activities",
+                    queryset=PuzzleActivity.objects.select_related("user").order_by(
+                        "-num_edits", "pk"
+                    ),
+                    to_attr="_prefetched_activities",
                 )
             )
-            .prefetch_related(
-                Prefetch(
-                    "active_users",
-                    queryset=get_user_model()
-                    .objects.filter(puzzle_activities__num_edits__gt=5)
-                    .order_by("-puzzle_activities__num_edits"),
-                    to_attr="_top_editors",
-                )
+            .annotate(
+                _last_edited_on=Max(
+                    "puzzle_activities__last_edit_time", filter=live_activity
+                ),
+                _oldest_recent_edit=Min(
+                    "puzzle_activities__last_edit_time", filter=recent_edit
+                ),
+            )
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        Without a `since` query parameter, returns the list of all puzzles. These
+        responses carry an ETag derived from the hunt version, so unchanged lists
+        are answered with a 304 without querying any puzzles.
+
+        With `since`, returns {"cursor", "puzzles", "deleted"}: the puzzles that
+        changed after the given cursor, the ids of puzzles deleted after it, and a
+        new cursor to pass on the next request. An empty `since` returns all
+        puzzles along with an initial cursor.
+        """
+        compact = getattr(request.accepted_renderer, "compact_format", False)
+
+        if "since" not in request.query_params:
+            # The version has to be read before the data it describes.
+            etag = '"puzzles-%s-%d-%s"' % (
+                get_hunt_version(self.kwargs["hunt_id"]),
+                time.time() // PUZZLE_LIST_ETAG_LIFETIME_SECONDS,
+                request.accepted_renderer.format,
+            )
+            not_modified = _maybe_not_modified(request, etag)
+            if not_modified:
+                return not_modified
+
+            hunt = self._get_hunt()
+            puzzles = serialize_puzzles(
+                self._get_puzzles_queryset(hunt), hunt.settings.active_user_lookback
+            )
+            return _with_etag(
+                Response(compact_puzzles(puzzles) if compact else puzzles), etag
+            )
+
+        cursor = datetime.datetime.now(tz=tz.UTC)
+        hunt = self._get_hunt()
+        queryset = self._get_puzzles_queryset(hunt)
+        deleted = []
+
+        since = request.query_params["since"]
+        if since:
+            try:
+                since_time = dateutil.parser.isoparse(since)
+            except ValueError:
+                return Response({"detail": "Invalid since cursor."}, status=400)
+            if since_time.tzinfo is None:
+                return Response({"detail": "Invalid since cursor."}, status=400)
+
+            window_start = since_time - DELTA_CURSOR_OVERLAP
+            lookback = hunt.settings.active_user_lookback
+            # Edits age out of recent_editors without any row changing, so also
+            # include puzzles with an edit that crossed the lookback boundary.
+            expired_activity = PuzzleActivity.objects.filter(
+                puzzle=OuterRef("pk"),
+                last_edit_time__gt=window_start - lookback,
+                last_edit_time__lte=cursor - lookback,
+            )
+            queryset = queryset.filter(
+                Q(updated_on__gt=window_start) | Exists(expired_activity)
             )
-            .prefetch_related("puzzle_activities")
+            deleted = list(
+                Puzzle.deleted_objects.filter(
+                    hunt=hunt, deleted_at__gt=window_start
+                ).values_list("pk", flat=True)
+            )
+
+        puzzles = serialize_puzzles(queryset, hunt.settings.active_user_lookback)
+        return Response(
+            {
+                "cursor": cursor.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                **(compact_puzzles(puzzles) if compact else {"puzzles": puzzles}),
+                "deleted": deleted,
+            }
         )
 
     def destroy(self, request, pk=None, **kwargs):
@@ -275,6 +650,7 @@ class PuzzleViewSet(viewsets.ModelViewSet):
                 if "status" in data:
                     old_status = puzzle.status
                     puzzle.status = data["status"]
+                    puzzle.update_solved_at()
                     puzzle.save()
                     if puzzle.status == Puzzle.SOLVED:
                         if puzzle.chat_room:
@@ -400,6 +776,188 @@ class PuzzleViewSet(viewsets.ModelViewSet):
 
         return Response(PuzzleSerializer(puzzle).data)
 
+    def bulk_create(self, request, **kwargs):
+        """
+        Creates a list of puzzles, e.g. a newly unlocked round, in one
+        transaction. Each item takes the same fields as create. Sheets and
+        channels for the whole batch are created by one task each, and the
+        unlock is announced in one message.
+
+        Returns the new puzzles along with the metas they were assigned to.
+        """
+        hunt = self._get_hunt()
+        serializer = PuzzleBulkCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=MAX_BULK_CREATE_PUZZLES,
+            context={"hunt": hunt},
+        )
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+
+        with transaction.atomic():
+            chat_rooms = [None] * len(items)
+            if settings.CHAT_DEFAULT_SERVICE:
+                chat_rooms = ChatRoom.objects.bulk_create(
+                    [
+                        ChatRoom(
+                            service=settings.CHAT_DEFAULT_SERVICE, name=item["name"]
+                        )
+                        for item in items
+                    ]
+                )
+            else:
+                logger.warn("Chat rooms not created for %d puzzles" % len(items))
+
+            puzzles = []
+            for item, chat_room in zip(items, chat_rooms):
+                fields = dict(item)
+                fields.pop("assigned_meta", None)
+                fields.pop("create_channels")
+                puzzles.append(Puzzle(hunt=hunt, chat_room=chat_room, **fields))
+
+            # Metas are saved one at a time so that the signal handlers create
+            # their meta tags. Other puzzles don't need any signal handlers, so
+            # they're inserted in one query.
+            for puzzle in puzzles:
+                if puzzle.is_meta:
+                    puzzle.save()
+            Puzzle.objects.bulk_create([p for p in puzzles if not p.is_meta])
+
+            metas_by_name = {p.name: p for p in puzzles if p.is_meta}
+            assigned_meta_names = {
+                item["assigned_meta"] for item in items if item.get("assigned_meta")
+            } - metas_by_name.keys()
+            metas_by_name.update(
+                (meta.name, meta)
+                for meta in Puzzle.objects.filter(
+                    hunt=hunt, is_meta=True, name__in=assigned_meta_names
+                )
+            )
+            meta_tags_by_name = {
+                tag.name: tag
+                for tag in PuzzleTag.objects.filter(
+                    hunt=hunt, is_meta=True, name__in=metas_by_name.keys()
+                )
+            }
+
+            # Assign metas and their tags directly, doing the work of the m2m
+            # signal handlers for the whole batch at once below.
+            meta_links = []
+            meta_tag_links = []
+            for item, puzzle in zip(items, puzzles):
+                if not item.get("assigned_meta"):
+                    continue
+                meta = metas_by_name[item["assigned_meta"]]
+                meta_links.append(
+                    Puzzle.metas.through(from_puzzle=puzzle, to_puzzle=meta)
+                )
+                meta_tag_links.append(
+                    Puzzle.tags.through(
+                        puzzle=puzzle, puzzletag=meta_tags_by_name[meta.name]
+                    )
+                )
+            Puzzle.metas.through.objects.bulk_create(meta_links)
+            Puzzle.tags.through.objects.bulk_create(meta_tag_links)
+
+            assigned_metas = {link.to_puzzle for link in meta_links}
+            # Bumps the hunt version and publishes one event for the batch.
+            touch_puzzles(
+                [p.pk for p in puzzles] + [meta.pk for meta in assigned_metas]
+            )
+            assigned_ids = [link.from_puzzle.pk for link in meta_links]
+            update_meta_closure(assigned_ids)
+            update_progression(assigned_ids)
+
+            new_puzzle_ids = [p.pk for p in puzzles]
+            if settings.CHAT_DEFAULT_SERVICE:
+                transaction.on_commit(
+                    lambda: chat.tasks.announce_puzzle_unlocks.delay(new_puzzle_ids)
+                )
+                # Channels are created after the metas are assigned, so there's
+                # no need to recategorize them like create does.
+                channel_puzzle_ids = [
+                    p.pk for item, p in zip(items, puzzles) if item["create_channels"]
+                ]
+                if channel_puzzle_ids:
+                    transaction.on_commit(
+                        lambda: chat.tasks.create_channels_for_puzzles.delay(
+                            channel_puzzle_ids
+                        )
+                    )
+
+            if google_api_lib.enabled():
+                transaction.on_commit(
+                    lambda: google_api_lib.tasks.create_google_sheets_for_puzzles.delay(
+                        new_puzzle_ids
+                    )
+                )
+
+                def update_meta_sheets():
+                    for meta in assigned_metas:
+                        google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(
+                            meta
+                        )
+
+                transaction.on_commit(update_meta_sheets)
+            else:
+                logger.warn("Sheets not created for %d puzzles" % len(items))
+
+        puzzle_ids = new_puzzle_ids + [meta.pk for meta in assigned_metas]
+        return Response(
+            PuzzleListSerializer(
+                self._get_puzzles_queryset(hunt)
+                .filter(pk__in=puzzle_ids)
+                .order_by("pk")
+            ).data
+        )
+
+    def bulk_update(self, request, **kwargs):
+        """
+        Applies a list of operations to a list of puzzles in one transaction.
+        Takes {"puzzle_ids": [...], "operations": [...]}, where each operation is
+        one of
+            {"op": "add_tag", "name": ..., "color": ...}  (color is optional)
+            {"op": "remove_tag", "name": ...}
+            {"op": "set_status", "status": ...}
+        As with PuzzleTagViewSet, adding or removing a meta's tag assigns or
+        unassigns the meta.
+
+        Returns the puzzles along with the metas that were assigned or unassigned.
+        """
+        hunt = self._get_hunt()
+        serializer = PuzzleBulkUpdateSerializer(
+            data=request.data, context={"hunt": hunt}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            with transaction.atomic():
+                puzzles = list(
+                    Puzzle.objects.filter(
+                        pk__in=serializer.validated_data["puzzle_ids"]
+                    ).order_by("pk")
+                )
+                update = PuzzleBulkUpdate(hunt, puzzles)
+                for operation in serializer.validated_data["operations"]:
+                    update.apply(operation)
+                update.finish()
+        except PuzzleModelError as e:
+            return Response(
+                {"detail": str(e)},
+                status=400,
+            )
+
+        puzzle_ids = update.puzzle_ids + list(update.changed_metas)
+        return Response(
+            PuzzleListSerializer(
+                self._get_puzzles_queryset(hunt)
+                .filter(pk__in=puzzle_ids)
+                .order_by("pk")
+            ).data
+        )
+
 
 class PuzzleTagViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, PuzzleTagAccessPermission]
@@ -482,6 +1040,7 @@ class PuzzleTagViewSet(viewsets.ModelViewSet):
                 PuzzleTag.objects.filter(name=tag_name, hunt=puzzle.hunt).update(
                     color=tag_color, is_location=is_location
                 )
+                touch_puzzles(tag.puzzles.values("pk"))
                 puzzle.tags.add(tag)
                 if (
                     tag.name == PuzzleTag.HIGH_PRIORITY
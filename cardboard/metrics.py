@@ -0,0 +1,34 @@
+import logging
+
+import redis
+
+from .redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# All counters live in one Redis hash so they can be listed together, e.g. with
+# `python manage.py show_metrics`.
+METRICS_KEY = "cardboard_metrics"
+
+
+def increment(name, amount=1):
+    """
+    Adds `amount` to the named counter. Failures are logged rather than raised,
+    since metrics should never break the code being measured.
+    """
+    try:
+        get_redis_client().hincrbyfloat(METRICS_KEY, name, amount)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to record metric {name}: {e}")
+
+
+def get_metrics():
+    """Returns a dict of all counters."""
+    return {
+        name.decode(): float(value)
+        for name, value in get_redis_client().hgetall(METRICS_KEY).items()
+    }
+
+
+def reset_metrics():
+    get_redis_client().delete(METRICS_KEY)
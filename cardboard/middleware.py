@@ -0,0 +1,48 @@
+import re
+
+import brotli
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+re_accepts_brotli = re.compile(r"\bbr\b")
+
+# Brotli's default quality is tuned for static files and too slow per request.
+BROTLI_QUALITY = 5
+
+
+class ApiCompressionMiddleware(GZipMiddleware):
+    """
+    Compresses API responses with brotli if it's accepted by the client, or gzip
+    otherwise. Pages aren't compressed, since they embed CSRF
+    tokens (see BREACH), and event streams aren't either, since compressing
+    them would buffer events.
+    """
+
+    def process_response(self, request, response):
+        if not request.path.startswith("/api/"):
+            return response
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if response.streaming:
+            return super().process_response(request, response)
+
+        # Mirrors GZipMiddleware.process_response.
+        if len(response.content) < 200 or response.has_header("Content-Encoding"):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if not re_accepts_brotli.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            return super().process_response(request, response)
+
+        compressed_content = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response["Content-Length"] = str(len(response.content))
+
+        # The content differs from the uncompressed response, so the ETag can
+        # only be a weak one.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = "br"
+        return response
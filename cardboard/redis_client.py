@@ -0,0 +1,16 @@
+import functools
+
+import redis
+from django.conf import settings
+
+
+@functools.cache
+def get_redis_client():
+    """
+    Returns a client for direct Redis access, for features the Django cache API
+    doesn't cover (pub/sub, hashes). Shares settings with the cache.
+    """
+    options = {}
+    if "rediss" in settings.REDIS_URL:
+        options["ssl_cert_reqs"] = None
+    return redis.Redis.from_url(settings.REDIS_URL, **options)
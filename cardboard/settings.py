@@ -75,6 +75,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "cardboard.middleware.ApiCompressionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -303,6 +304,16 @@ CELERY_REDIS_MAX_CONNECTIONS = 1  # Only for sending results, not enqueueing tas
 CELERY_TASK_DEFAULT_PRIORITY = TaskPriority.MED.value
 CELERY_TASK_REJECT_ON_WORKER_LOST = True
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers.DatabaseScheduler"
+CELERY_BEAT_SCHEDULE = {
+    "flush-last-accessed-hunts": {
+        "task": "hunts.tasks.flush_last_accessed_hunts",
+        "schedule": 60.0,
+    },
+    "refill-sheet-pools": {
+        "task": "google_api_lib.tasks.refill_sheet_pools",
+        "schedule": 300.0,
+    },
+}
 
 # Logging configuration
 LOGGING = {
@@ -338,5 +349,54 @@ CACHES = {
 if "rediss" in REDIS_URL:
     CACHES["default"]["OPTIONS"]["ssl_cert_reqs"] = None
 
+# Server-sent hunt events. Each open stream holds a web worker thread, so streams
+# are closed periodically and clients reconnect after the retry delay.
+HUNT_EVENTS_STREAM_SECONDS = int(os.environ.get("HUNT_EVENTS_STREAM_SECONDS", 300))
+HUNT_EVENTS_HEARTBEAT_SECONDS = 15
+HUNT_EVENTS_RETRY_MILLISECONDS = 3000
+# Most streams each web process serves at once, leaving the rest of its threads
+# (see Procfile) for other requests. Clients turned away fall back to polling,
+# and try to stream again after HUNT_EVENTS_BUSY_RETRY_SECONDS.
+HUNT_EVENTS_MAX_STREAMS = int(os.environ.get("HUNT_EVENTS_MAX_STREAMS", 8))
+HUNT_EVENTS_BUSY_RETRY_SECONDS = 60
+
+# How long each user's permissions on a hunt are cached. Permission changes made
+# through guardian clear the cache right away, but changes to the user itself
+# (e.g. deactivating them) can take this long to apply.
+HUNT_PERMISSIONS_CACHE_SECONDS = 60
+
+# Meta sheets are rebuilt at most once per this many seconds, after the first
+# change in that window. Set to 0 to rebuild them on every change.
+META_SHEET_UPDATE_SECONDS = int(os.environ.get("META_SHEET_UPDATE_SECONDS", 30))
+
+# Number of ready-made copies of the sheet template to keep for each active hunt,
+# so that new puzzles get sheets without waiting on a copy. Set to 0 to copy the
+# template for each puzzle instead.
+SHEET_POOL_SIZE = int(os.environ.get("SHEET_POOL_SIZE", 10))
+
+# Google API calls allowed across all workers, as (calls per second, burst size)
+# for each bucket in google_api_lib.quota. These stay under Google's per-minute
+# quotas, so that tasks wait their turn rather than fail and retry. Each can be
+# set with GOOGLE_API_<BUCKET>_RATE and GOOGLE_API_<BUCKET>_BURST, e.g.
+# GOOGLE_API_SHEETS_WRITE_RATE, to match the quotas of the Google Cloud project.
+GOOGLE_API_RATE_LIMITS = {
+    bucket: (
+        float(os.environ.get(f"GOOGLE_API_{bucket.upper()}_RATE", rate)),
+        int(os.environ.get(f"GOOGLE_API_{bucket.upper()}_BURST", burst)),
+    )
+    for bucket, (rate, burst) in {
+        "drive": (10, 20),
+        # Sheets allows 60 reads and 60 writes a minute per service account.
+        "sheets_read": (1, 5),
+        "sheets_write": (1, 5),
+        "people": (1, 1),
+        "driveactivity": (5, 10),
+    }.items()
+}
+# Tasks that would wait longer than this for quota retry later instead.
+GOOGLE_API_QUOTA_MAX_WAIT_SECONDS = int(
+    os.environ.get("GOOGLE_API_QUOTA_MAX_WAIT_SECONDS", 20)
+)
+
 # Use 64 bit primary keys
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
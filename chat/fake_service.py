@@ -57,3 +57,6 @@ class FakeChatService(ChatService):
 
     def send_message(self, channel_id, msg, embedded_urls={}):
         self.messages.add(msg)
+
+    def announce(self, channel_id, msg, embedded_urls={}):
+        self.messages.add(msg)
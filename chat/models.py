@@ -215,6 +215,17 @@ class ChatRoom(SoftDeleteModel):
         )
         self.send_message(msg, embedded_urls)
 
+    def announce_message(self, msg, embedded_urls={}):
+        """
+        Sends msg to the hunt's puzzle announcements channel.
+        embedded_urls is a map mapping display_text to url.
+        """
+        self.get_service().announce(
+            self.puzzle.hunt.settings.discord_puzzle_announcements_channel_id,
+            msg,
+            embedded_urls,
+        )
+
     def announce_message_with_embedded_urls(self, msg, puzzle):
         embedded_urls = {}
         if puzzle:
@@ -13,6 +13,10 @@ from puzzles.puzzle_tag import PuzzleTag, PuzzleTagColor
 
 logger = logging.getLogger(__name__)
 
+# Discord allows at most 25 fields per embed, and announcements embed a link to
+# each puzzle.
+MAX_PUZZLES_PER_ANNOUNCEMENT = 25
+
 
 def _get_puzzles_queryset(include_deleted=False):
     if include_deleted:
@@ -48,6 +52,54 @@ def create_channels_for_puzzle(puzzle_id):
         logger.exception(f"create_channels_for_puzzle failed with error: {e}")
 
 
+@shared_task(rate_limit="6/m", acks_late=True, priority=TaskPriority.HIGH.value)
+def announce_puzzle_unlocks(puzzle_ids):
+    """
+    Announces puzzles that were unlocked together (see PuzzleViewSet.bulk_create)
+    in as few messages as possible.
+    """
+    puzzles = list(
+        _get_puzzles_queryset()
+        .filter(id__in=puzzle_ids, chat_room__isnull=False)
+        .order_by("id")
+    )
+    if not puzzles:
+        return
+    try:
+        if len(puzzles) == 1:
+            msg = f"**{puzzles[0].name}** has been unlocked!"
+            puzzles[0].chat_room.announce_message_with_embedded_urls(msg, puzzles[0])
+            return
+
+        for i in range(0, len(puzzles), MAX_PUZZLES_PER_ANNOUNCEMENT):
+            batch = puzzles[i : i + MAX_PUZZLES_PER_ANNOUNCEMENT]
+            msg = f"**{len(batch)} puzzles** have been unlocked!"
+            batch[0].chat_room.announce_message(
+                msg, {puzzle.name: puzzle.url for puzzle in batch}
+            )
+    except Exception as e:
+        logger.exception(f"announce_puzzle_unlocks failed with error: {e}")
+
+
+@shared_task(rate_limit="6/m", acks_late=True, priority=TaskPriority.HIGH.value)
+def create_channels_for_puzzles(puzzle_ids):
+    """Creates channels for puzzles that were created together."""
+    puzzles = (
+        _get_puzzles_queryset()
+        .filter(id__in=puzzle_ids, chat_room__isnull=False)
+        .order_by("id")
+    )
+    for puzzle in puzzles:
+        try:
+            puzzle.chat_room.create_channels()
+            msg = f"**{puzzle.name}** has been created!"
+            puzzle.chat_room.send_message_with_embedded_urls(msg, puzzle)
+        except Exception as e:
+            logger.exception(
+                f"create_channels_for_puzzles failed for {puzzle.name} with error: {e}"
+            )
+
+
 @shared_task(rate_limit="6/m", acks_late=True)
 def cleanup_puzzle_channels(puzzle_id):
     puzzle = (
@@ -87,6 +139,19 @@ def handle_puzzle_meta_change(puzzle_id):
         logger.exception(f"handle_puzzle_meta_change failed with error: {e}")
 
 
+@shared_task(rate_limit="6/m", acks_late=True, priority=TaskPriority.LOW.value)
+def handle_puzzles_meta_change(puzzle_ids):
+    """Like handle_puzzle_meta_change, for puzzles changed together."""
+    puzzles = _get_puzzles_queryset().filter(id__in=puzzle_ids, chat_room__isnull=False)
+    for puzzle in puzzles:
+        try:
+            puzzle.chat_room.update_category()
+        except Exception as e:
+            logger.exception(
+                f"handle_puzzles_meta_change failed for {puzzle.name} with error: {e}"
+            )
+
+
 @shared_task(rate_limit="6/m", acks_late=True)
 def handle_puzzle_solved(puzzle_id, answer_text):
     puzzle = _get_puzzles_queryset().get(id=puzzle_id)
@@ -136,6 +201,32 @@ def handle_tag_removed(puzzle_id, tag_name):
         logger.exception(f"handle_tag_removed failed with error: {e}")
 
 
+@shared_task(rate_limit="6/m", acks_late=True)
+def handle_tag_added_to_puzzles(puzzle_ids, tag_name):
+    """Like handle_tag_added, for puzzles tagged together."""
+    puzzles = _get_puzzles_queryset().filter(id__in=puzzle_ids, chat_room__isnull=False)
+    for puzzle in puzzles:
+        try:
+            puzzle.chat_room.handle_tag_added(puzzle, tag_name)
+        except Exception as e:
+            logger.exception(
+                f"handle_tag_added_to_puzzles failed for {puzzle.name} with error: {e}"
+            )
+
+
+@shared_task(rate_limit="6/m", acks_late=True)
+def handle_tag_removed_from_puzzles(puzzle_ids, tag_name):
+    """Like handle_tag_removed, for puzzles untagged together."""
+    puzzles = _get_puzzles_queryset().filter(id__in=puzzle_ids, chat_room__isnull=False)
+    for puzzle in puzzles:
+        try:
+            puzzle.chat_room.handle_tag_removed(puzzle, tag_name)
+        except Exception as e:
+            logger.exception(
+                f"handle_tag_removed_from_puzzles failed for {puzzle.name} with error: {e}"
+            )
+
+
 @shared_task(rate_limit="6/m", acks_late=True)
 def handle_answer_change(puzzle_id, old_answer, new_answer):
     puzzle = _get_puzzles_queryset().get(id=puzzle_id)
@@ -3,6 +3,7 @@ from django.test import TestCase, override_settings
 from hunts.models import Hunt
 from puzzles.models import Puzzle
 
+from . import tasks
 from .fake_service import FakeChatService
 from .models import ChatRoom
 from .service import ChatService
@@ -170,6 +171,37 @@ class TestChatRoom(TestCase):
         self.room.send_message(msg)
         self.assertIn(msg, self.fake_service.messages)
 
+    def _save_chat_rooms(self):
+        # Creating the rooms only links them to the puzzles in memory.
+        self.feeder.save()
+        self.meta.save()
+
+    def test_announce_puzzle_unlocks(self):
+        self._save_chat_rooms()
+        tasks.announce_puzzle_unlocks([self.feeder.pk, self.meta.pk])
+        self.assertIn("**2 puzzles** have been unlocked!", self.fake_service.messages)
+
+        tasks.announce_puzzle_unlocks([self.feeder.pk])
+        self.assertIn("**puzzle** has been unlocked!", self.fake_service.messages)
+
+    def test_create_channels_for_puzzles(self):
+        self._save_chat_rooms()
+        tasks.create_channels_for_puzzles([self.feeder.pk, self.meta.pk])
+        self.room.refresh_from_db()
+        self.meta_room.refresh_from_db()
+        self.assertIn(self.room.text_channel_id, self.fake_service.text_channels)
+        self.assertIn(self.meta_room.text_channel_id, self.fake_service.text_channels)
+
+    def test_handle_puzzles_meta_change(self):
+        self._save_chat_rooms()
+        self.room.create_channels()
+        self.feeder.metas.add(self.meta)
+        tasks.handle_puzzles_meta_change([self.feeder.pk])
+        self.assertIn(
+            self.room.text_channel_id,
+            self.fake_service.category_to_channel[self.meta.name],
+        )
+
 
 class TestChatService(TestCase):
     def test_base_chat_service_constructor_raises_error(self):
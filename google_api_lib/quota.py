@@ -0,0 +1,187 @@
+"""
+Rate limits on Google API calls, shared by all workers through Redis. Workers
+wait their turn for quota here instead of each running into Google's per-minute
+quotas and backing off on their own.
+
+Calls are grouped into buckets (see bucket_for), each a token bucket refilled at
+the rate set in GOOGLE_API_RATE_LIMITS. While a call waits for a bucket, calls
+from lower priority tasks (see TaskPriority) can't take from it.
+"""
+
+import logging
+import time
+import uuid
+from collections import Counter, defaultdict
+from urllib.parse import urlparse
+
+import redis
+from django.conf import settings
+
+from cardboard import metrics
+from cardboard.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class GoogleApiQuotaTimeout(Exception):
+    pass
+
+
+# Takes `requested` tokens from the bucket if it can, and returns 0. Otherwise
+# returns how many milliseconds to wait before trying again, and records the
+# caller as waiting until it's done or gives up.
+#   KEYS: bucket hash, waiting sorted set
+#   ARGV: rate, burst, requested, priority, waiter id, seconds to keep waiter
+_ACQUIRE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local priority = tonumber(ARGV[4])
+local member = ARGV[4] .. ":" .. ARGV[5]
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+
+-- Waiters that went away without saying so expire.
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now)
+local ahead = 0
+for _, waiter in ipairs(redis.call("ZRANGE", KEYS[2], 0, -1)) do
+    if tonumber(string.match(waiter, "^(%d+):")) > priority then
+        ahead = ahead + 1
+    end
+end
+
+-- Requests larger than the burst take it all and go into debt, which later
+-- requests wait out.
+local needed = math.min(requested, burst)
+local wait = 0
+if ahead == 0 and tokens >= needed then
+    tokens = tokens - requested
+    redis.call("ZREM", KEYS[2], member)
+else
+    if ahead > 0 then
+        wait = math.max(needed - tokens, 1) / rate
+    else
+        wait = (needed - tokens) / rate
+    end
+    redis.call("ZADD", KEYS[2], now + tonumber(ARGV[6]), member)
+    redis.call("EXPIRE", KEYS[2], math.ceil(tonumber(ARGV[6])))
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 60)
+return math.ceil(wait * 1000)
+"""
+
+
+def _bucket_key(bucket):
+    return f"google_api_quota_{bucket}"
+
+
+def _waiting_key(bucket):
+    return f"google_api_quota_waiting_{bucket}"
+
+
+def bucket_for(uri, method):
+    """
+    Returns the bucket that a call to `uri` draws from, or None if it isn't
+    limited here. Batch requests aren't, since acquire_for_requests counts the
+    calls in them.
+    """
+    url = urlparse(uri)
+    if url.path.startswith("/batch"):
+        return None
+    if url.netloc == "sheets.googleapis.com":
+        return "sheets_read" if method == "GET" else "sheets_write"
+    if url.netloc == "drive.googleapis.com" or "/drive/" in url.path:
+        return "drive"
+    if url.netloc == "people.googleapis.com":
+        return "people"
+    if url.netloc == "driveactivity.googleapis.com":
+        return "driveactivity"
+    return None
+
+
+def acquire(bucket, priority, tokens=1):
+    """
+    Waits until the bucket allows `tokens` more calls, and takes them. Raises
+    GoogleApiQuotaTimeout if that would take longer than
+    GOOGLE_API_QUOTA_MAX_WAIT_SECONDS.
+    """
+    rate, burst = settings.GOOGLE_API_RATE_LIMITS[bucket]
+    max_wait = settings.GOOGLE_API_QUOTA_MAX_WAIT_SECONDS
+    keys = [_bucket_key(bucket), _waiting_key(bucket)]
+    waiter = uuid.uuid4().hex
+    start = time.monotonic()
+    try:
+        client = get_redis_client()
+        script = client.register_script(_ACQUIRE_SCRIPT)
+        while True:
+            wait = script(keys, [rate, burst, tokens, priority, waiter, max_wait])
+            if wait == 0:
+                break
+            if time.monotonic() - start + wait / 1000 > max_wait:
+                client.zrem(keys[1], f"{priority}:{waiter}")
+                metrics.increment("google_api_quota_timeouts")
+                raise GoogleApiQuotaTimeout(
+                    f"Timed out waiting for {tokens} {bucket} calls"
+                )
+            time.sleep(wait / 1000)
+    except redis.RedisError as e:
+        # Google still enforces its own quotas, so go ahead without this one.
+        logger.warning(f"Failed to acquire Google API quota for {bucket}: {e}")
+        return
+
+    waited = time.monotonic() - start
+    metrics.increment(f"google_api_quota_{bucket}_calls", tokens)
+    if waited > 0.001:
+        metrics.increment("google_api_quota_waits")
+        metrics.increment("google_api_quota_wait_seconds", waited)
+
+
+def acquire_for_requests(requests, priority):
+    """Acquires quota for all of the given HttpRequests, e.g. before batching them."""
+    buckets = Counter(bucket_for(request.uri, request.method) for request in requests)
+    for bucket, tokens in buckets.items():
+        if bucket is not None:
+            acquire(bucket, priority, tokens)
+
+
+def get_queue_depths():
+    """
+    Returns the number of calls waiting for each bucket, as a dict of bucket
+    to a dict of priority to count.
+    """
+    now = time.time()
+    depths = {}
+    client = get_redis_client()
+    for bucket in settings.GOOGLE_API_RATE_LIMITS:
+        by_priority = defaultdict(int)
+        for waiter in client.zrangebyscore(_waiting_key(bucket), now, "+inf"):
+            by_priority[int(waiter.decode().split(":")[0])] += 1
+        depths[bucket] = dict(by_priority)
+    return depths
+
+
+class RateLimitedHttp:
+    """
+    Wraps an http object, e.g. an AuthorizedHttp, so that each call acquires
+    quota for its bucket before it's made.
+    """
+
+    def __init__(self, http, priority):
+        self.http = http
+        self.priority = priority
+
+    def request(self, uri, method="GET", *args, **kwargs):
+        bucket = bucket_for(uri, method)
+        if bucket is not None:
+            acquire(bucket, self.priority)
+        return self.http.request(uri, method, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
@@ -1,28 +1,35 @@
 import datetime
+import hashlib
 import itertools
+import json
 import logging
 import random
 import re
-import time
+from collections import defaultdict
 from typing import List, Optional
 
 import dateutil.parser
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from celery.utils.time import get_exponential_backoff_interval
 from dateutil import tz
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models import CharField, F, Value
+from django.db.models import CharField, F, Prefetch, Q, Value
 from django.db.models.functions import Concat
-from googleapiclient import _auth
 from guardian.shortcuts import assign_perm
 
+from answers.models import Answer
+from cardboard import metrics
 from cardboard.settings import TaskPriority
 from chat.tasks import handle_sheet_created
-from hunts.models import Hunt
-from puzzles.models import Puzzle, PuzzleActivity
+from hunts.models import Hunt, PooledSheet
+from hunts.permissions import invalidate_hunt_permissions
+from puzzles.models import MetaClosure, Puzzle, PuzzleActivity, touch_puzzles
 
+from . import quota
 from .utils import GoogleApiClientTask, enabled
 
 logger = logging.getLogger(__name__)
@@ -38,19 +45,19 @@ def create_google_sheets_helper(self, name, template_file_id) -> dict:
         .copy(
             fileId=template_file_id,
             body=req_body,
-            fields="id,webViewLink,permissions",
+            fields="id,webViewLink,permissions,parents",
         )
         .execute()
     )
     return file
 
 
-def maybe_get_renamable_sheet_for_puzzle(self, puzzle):
-    """Returns a sheet ID for a spare template file that can be assigned to this puzzle (without making a copy)."""
+def get_renamable_sheets(self, hunt) -> List[dict]:
+    """Returns the spare template files that can be assigned to the hunt's puzzles (without making copies)."""
 
-    template_folder_id = puzzle.hunt.settings.google_sheets_template_folder_id
+    template_folder_id = hunt.settings.google_sheets_template_folder_id
     if not template_folder_id:
-        return None
+        return []
 
     response = (
         self.drive_service()
@@ -58,15 +65,23 @@ def maybe_get_renamable_sheet_for_puzzle(self, puzzle):
         .list(
             corpora="user",
             q=f"'{template_folder_id}' in parents",
-            fields="files(id,webViewLink,permissions)",
+            fields="files(id,webViewLink,permissions,parents)",
         )
         .execute()
     )
     files = response.get("files", [])
     if len(files) == 0:
         logger.warn(
-            f"The Drive template folder {template_folder_id} for hunt {puzzle.hunt.name} is empty"
+            f"The Drive template folder {template_folder_id} for hunt {hunt.name} is empty"
         )
+    return files
+
+
+def maybe_get_renamable_sheet_for_puzzle(self, puzzle):
+    """Returns a sheet ID for a spare template file that can be assigned to this puzzle (without making a copy)."""
+
+    files = get_renamable_sheets(self, puzzle.hunt)
+    if len(files) == 0:
         return None
 
     # Return a random file to reduce race conditions or problems with a specific file
@@ -84,16 +99,376 @@ def move_drive_file(self, file_id, destination_folder_id) -> None:
     ).execute()
 
 
-# transfer new sheet ownership back to OG owner, so that scripts can run
-@shared_task(base=GoogleApiClientTask, bind=True)
-def transfer_ownership(self, file, template_file_id) -> None:
-    new_owner = self.sheets_owner(template_file_id)
+def _transfer_ownership_request(drive_service, file, new_owner):
     permission = next(p for p in file["permissions"] if p["emailAddress"] == new_owner)
-    self.drive_service().permissions().update(
+    return drive_service.permissions().update(
         fileId=file["id"],
         permissionId=permission["id"],
         body={"role": "writer", "pendingOwner": "true"},
-    ).execute()
+    )
+
+
+# transfer new sheet ownership back to OG owner, so that scripts can run
+@shared_task(base=GoogleApiClientTask, bind=True)
+def transfer_ownership(self, file, template_file_id) -> None:
+    new_owner = self.sheets_owner(template_file_id)
+    _transfer_ownership_request(self.drive_service(), file, new_owner).execute()
+
+
+# Most calls to put in one batch request. Google allows 100, but recommends
+# fewer for Drive.
+GOOGLE_API_BATCH_SIZE = 50
+
+# How long to remember who owns each sheet template.
+TEMPLATE_OWNER_TIMEOUT = 24 * 60 * 60
+
+
+def _template_owner(self, template_file_id) -> str:
+    key = f"template_owner_{template_file_id}"
+    owner = cache.get(key)
+    if owner is None:
+        owner = self.sheets_owner(template_file_id)
+        cache.set(key, owner, timeout=TEMPLATE_OWNER_TIMEOUT)
+    return owner
+
+
+def _execute_batched(self, service, calls) -> dict:
+    """
+    Makes the given (request_id, request) calls with batch requests, one round
+    trip per GOOGLE_API_BATCH_SIZE calls. Returns the errors of the calls that
+    failed, by request id.
+    """
+    errors = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            errors[request_id] = exception
+
+    for start in range(0, len(calls), GOOGLE_API_BATCH_SIZE):
+        chunk = calls[start : start + GOOGLE_API_BATCH_SIZE]
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, request in chunk:
+            batch.add(request, request_id=request_id)
+        # Each call in the batch counts against its API's quota.
+        quota.acquire_for_requests(
+            [request for _, request in chunk], self.quota_priority
+        )
+        batch.execute(http=self.authorized_http())
+    return errors
+
+
+def _sheet_setup(
+    steps,
+    sheet_url,
+    file=None,
+    puzzle=None,
+    template_file_id=None,
+    destination_folder_id=None,
+) -> dict:
+    """
+    Describes the steps left to set up a sheet, for _set_up_sheets. The steps
+    are any of:
+      "transfer": hand the file to the template's owner, so that scripts can run
+      "move": move the file to the destination folder
+      "rename": rename the sheet after the puzzle
+      "link": write the puzzle's link to the sheet
+    """
+    return {
+        "steps": steps,
+        "sheet_url": sheet_url,
+        "file": file,
+        "name": puzzle.name if puzzle else None,
+        "puzzle_url": puzzle.url if puzzle else None,
+        "template_file_id": template_file_id,
+        "destination_folder_id": destination_folder_id,
+    }
+
+
+def _set_up_sheets(self, sheet_setups) -> List[dict]:
+    """
+    Runs the steps of each sheet setup (see _sheet_setup), with batch requests
+    to Drive and to Sheets shared by all of them. Returns the setups that had
+    steps fail, with just the steps that failed.
+    """
+    drive_service = self.drive_service()
+    sheets_service = self.sheets_service()
+    drive_calls = []
+    sheets_calls = []
+    for i, setup in enumerate(sheet_setups):
+        file = setup["file"]
+        steps = setup["steps"]
+        if "transfer" in steps:
+            new_owner = _template_owner(self, setup["template_file_id"])
+            drive_calls.append(
+                (
+                    f"{i}-transfer",
+                    _transfer_ownership_request(drive_service, file, new_owner),
+                )
+            )
+        if "move" in steps:
+            # Copies and listed files come with their parents, so moving them
+            # doesn't need to look those up.
+            drive_calls.append(
+                (
+                    f"{i}-move",
+                    drive_service.files().update(
+                        fileId=file["id"],
+                        addParents=setup["destination_folder_id"],
+                        removeParents=",".join(file["parents"]),
+                    ),
+                )
+            )
+        if "rename" in steps:
+            sheets_calls.append(
+                (
+                    f"{i}-rename",
+                    _rename_sheet_request(
+                        sheets_service, setup["sheet_url"], setup["name"]
+                    ),
+                )
+            )
+        if "link" in steps:
+            sheets_calls.append(
+                (
+                    f"{i}-link",
+                    _puzzle_link_request(
+                        sheets_service, setup["puzzle_url"], setup["sheet_url"]
+                    ),
+                )
+            )
+
+    errors = _execute_batched(self, drive_service, drive_calls)
+    errors.update(_execute_batched(self, sheets_service, sheets_calls))
+
+    failed_steps = defaultdict(list)
+    for request_id, error in errors.items():
+        i, step = request_id.split("-")
+        setup = sheet_setups[int(i)]
+        logger.warn(f"Failed to {step} sheet {setup['sheet_url']}: {error}")
+        failed_steps[int(i)].append(step)
+    return [{**sheet_setups[i], "steps": steps} for i, steps in failed_steps.items()]
+
+
+@shared_task(base=GoogleApiClientTask, bind=True, priority=TaskPriority.HIGH.value)
+def set_up_sheets(self, sheet_setups) -> None:
+    """
+    Finishes setting up sheets given to new puzzles (see _sheet_setup). Steps
+    that fail are retried on their own.
+    """
+    failed = _set_up_sheets(self, sheet_setups)
+    if failed:
+        # Back off the same way as retries of failed calls (see
+        # GoogleApiClientTask), instead of the fixed default_retry_delay.
+        countdown = get_exponential_backoff_interval(
+            factor=int(max(1.0, self.retry_backoff)),
+            retries=self.request.retries,
+            maximum=self.retry_backoff_max,
+            full_jitter=self.retry_jitter,
+        )
+        raise self.retry(
+            args=(failed,), **{**self.retry_kwargs, "countdown": countdown}
+        )
+
+
+def _set_up_sheet_on_commit(sheet_setup, pending_setups=None) -> None:
+    """
+    Sets up the sheet once the transaction commits, so that nothing happens to a
+    sheet whose assignment rolls back. If pending_setups is given, the setup is
+    added to it instead, for the caller to run together with others.
+    """
+
+    def set_up():
+        if pending_setups is None:
+            set_up_sheets.delay([sheet_setup])
+        else:
+            pending_setups.append(sheet_setup)
+
+    transaction.on_commit(set_up)
+
+
+def _template_file_id(hunt):
+    return (
+        hunt.settings.google_sheets_template_file_id
+        or settings.GOOGLE_SHEETS_TEMPLATE_FILE_ID
+    )
+
+
+def _destination_folder_id(hunt):
+    return hunt.settings.google_drive_folder_id or settings.GOOGLE_DRIVE_HUNT_FOLDER_ID
+
+
+def _sheet_pool_refill_key(hunt_id):
+    return f"sheet_pool_refill_{hunt_id}"
+
+
+def _uses_sheet_pool(hunt):
+    # Spare sheets in the hunt's template folder come before copies of the
+    # template, so hunts that have one aren't given a pool that would get used
+    # first.
+    return (
+        settings.SHEET_POOL_SIZE > 0
+        and not hunt.settings.google_sheets_template_folder_id
+    )
+
+
+def _trash_pooled_sheets(self, pooled_sheets) -> None:
+    """Drops the pooled sheets, moving their files to the Drive trash."""
+    pooled_sheets = list(pooled_sheets)
+    if not pooled_sheets:
+        return
+    drive_service = self.drive_service()
+    errors = _execute_batched(
+        self,
+        drive_service,
+        [
+            (
+                str(i),
+                drive_service.files().update(
+                    fileId=pooled_sheet.file_id, body={"trashed": True}
+                ),
+            )
+            for i, pooled_sheet in enumerate(pooled_sheets)
+        ],
+    )
+    for request_id, error in errors.items():
+        logger.warn(
+            f"Failed to trash pooled sheet {pooled_sheets[int(request_id)].url}: {error}"
+        )
+    PooledSheet.objects.filter(pk__in=[sheet.pk for sheet in pooled_sheets]).delete()
+
+
+@shared_task(
+    base=GoogleApiClientTask,
+    bind=True,
+    priority=TaskPriority.LOW.value,
+    time_limit=600,
+    soft_time_limit=540,
+)
+def refill_sheet_pool(self, hunt_id) -> None:
+    """
+    Copies the hunt's sheet template until the hunt has SHEET_POOL_SIZE pooled
+    sheets (see claim_pooled_sheet), handing the copies to the template's owner
+    and moving them to the hunt's Drive folder. Pooled sheets that can no
+    longer be claimed are trashed.
+    """
+    # Only one refill per hunt at a time, so that they don't overfill the pool.
+    # Expires on its own in case the refill is killed.
+    lock_key = _sheet_pool_refill_key(hunt_id)
+    if not cache.add(lock_key, True, timeout=self.time_limit):
+        return
+
+    try:
+        hunt = Hunt.objects.select_related("settings").filter(pk=hunt_id).first()
+        if hunt is None:
+            return
+        template_file_id = _template_file_id(hunt)
+        if not template_file_id:
+            return
+        destination_folder_id = _destination_folder_id(hunt)
+
+        # Copies of an old template would never be claimed, and neither would
+        # any copies once the hunt has a template folder. Copies that aren't
+        # ready were left behind by a refill that stopped partway.
+        stale_sheets = PooledSheet.objects.filter(hunt=hunt)
+        if not hunt.settings.google_sheets_template_folder_id:
+            stale_sheets = stale_sheets.filter(
+                ~Q(template_file_id=template_file_id) | Q(ready=False)
+            )
+        _trash_pooled_sheets(self, stale_sheets)
+
+        if not _uses_sheet_pool(hunt):
+            return
+        missing = settings.SHEET_POOL_SIZE - hunt.pooled_sheets.count()
+        if missing <= 0:
+            return
+
+        steps = ["transfer", "move"] if destination_folder_id else ["transfer"]
+        sheet_setups = []
+        for _ in range(missing):
+            file = create_google_sheets_helper(
+                self, f"Unused {hunt.name} sheet", template_file_id
+            )
+            # Recorded right away, so that the next refill trashes the copy if
+            # this one stops before it's ready.
+            PooledSheet.objects.create(
+                hunt=hunt,
+                template_file_id=template_file_id,
+                file_id=file["id"],
+                url=file["webViewLink"],
+            )
+            sheet_setups.append(
+                _sheet_setup(
+                    steps,
+                    file["webViewLink"],
+                    file=file,
+                    template_file_id=template_file_id,
+                    destination_folder_id=destination_folder_id,
+                )
+            )
+
+        failed = {setup["file"]["id"] for setup in _set_up_sheets(self, sheet_setups)}
+        created = PooledSheet.objects.filter(
+            file_id__in=[setup["file"]["id"] for setup in sheet_setups]
+        )
+        ready = created.exclude(file_id__in=failed).update(ready=True)
+        # Copies that couldn't be set up are never claimed.
+        _trash_pooled_sheets(self, created.filter(file_id__in=failed))
+        metrics.increment("pooled_sheets_created", ready)
+        logger.info(f"Added {ready} sheets to the pool for {hunt.name}")
+    finally:
+        cache.delete(lock_key)
+
+
+def _schedule_sheet_pool_refill(hunt):
+    # Skip it if a refill is already running; it will be topped up next time.
+    if _uses_sheet_pool(hunt) and not cache.get(_sheet_pool_refill_key(hunt.pk)):
+        refill_sheet_pool.delay(hunt.pk)
+
+
+@shared_task(priority=TaskPriority.LOW.value)
+def refill_sheet_pools() -> None:
+    """Tops up the sheet pools of active hunts. Runs periodically from celery beat."""
+    if not enabled() or settings.SHEET_POOL_SIZE <= 0:
+        return
+    for hunt_id in Hunt.objects.filter(active=True).values_list("pk", flat=True):
+        refill_sheet_pool.delay(hunt_id)
+
+
+def claim_pooled_sheet(puzzle, pending_setups=None) -> bool:
+    """
+    Gives the puzzle one of its hunt's pooled sheets, if there are any and the
+    hunt has no template folder. Must be called in a transaction, which puts the
+    sheet back in the pool if it rolls back. Concurrent claims never get the
+    same sheet. See _set_up_sheet_on_commit for pending_setups.
+    """
+    if puzzle.hunt.settings.google_sheets_template_folder_id:
+        return False
+    pooled_sheet = (
+        PooledSheet.objects.select_for_update(skip_locked=True)
+        .filter(
+            hunt_id=puzzle.hunt_id,
+            template_file_id=_template_file_id(puzzle.hunt),
+            ready=True,
+        )
+        .order_by("pk")
+        .first()
+    )
+    if pooled_sheet is None:
+        metrics.increment("pooled_sheet_misses")
+        return False
+    pooled_sheet.delete()
+    metrics.increment("pooled_sheet_claims")
+
+    puzzle.sheet = pooled_sheet.url
+    puzzle.save()
+
+    _set_up_sheet_on_commit(
+        _sheet_setup(["rename", "link"], pooled_sheet.url, puzzle=puzzle),
+        pending_setups,
+    )
+    if puzzle.chat_room:
+        transaction.on_commit(lambda: handle_sheet_created.delay(puzzle.pk))
+    return True
 
 
 @shared_task(
@@ -108,56 +483,112 @@ def transfer_ownership(self, file, template_file_id) -> None:
 def create_google_sheets(self, puzzle_id) -> None:
     with transaction.atomic():
         puzzle = Puzzle.objects.select_related("hunt__settings").get(pk=puzzle_id)
-        template_file_id = (
-            puzzle.hunt.settings.google_sheets_template_file_id
-            or settings.GOOGLE_SHEETS_TEMPLATE_FILE_ID
-        )
-        destination_folder_id = (
-            puzzle.hunt.settings.google_drive_folder_id
-            or settings.GOOGLE_DRIVE_HUNT_FOLDER_ID
-        )
+        if not claim_pooled_sheet(puzzle):
+            existing_file = maybe_get_renamable_sheet_for_puzzle(self, puzzle)
+            _create_google_sheet(self, puzzle, existing_file)
+        transaction.on_commit(lambda: _schedule_sheet_pool_refill(puzzle.hunt))
 
-        new_file = None
 
-        existing_file = maybe_get_renamable_sheet_for_puzzle(self, puzzle)
-        if existing_file:
-            new_file = existing_file
-        else:
-            if not template_file_id:
-                logging.warn(
-                    f"Cannot create a sheet for {puzzle.name} as we can't find a sheets template"
-                )
-                return
-            new_file = create_google_sheets_helper(self, puzzle.name, template_file_id)
+@shared_task(
+    base=GoogleApiClientTask,
+    bind=True,
+    priority=TaskPriority.HIGH.value,
+    time_limit=600,
+    soft_time_limit=540,
+)
+def create_google_sheets_for_puzzles(self, puzzle_ids) -> None:
+    """
+    Creates sheets for puzzles that were created together (see
+    PuzzleViewSet.bulk_create), looking up each hunt's spare sheets only once
+    and giving every puzzle a different one. Pooled sheets are used first, for
+    hunts that have them (see claim_pooled_sheet).
+    Puzzles whose sheet can't be created here are handed to
+    create_google_sheets, which retries on its own.
+    """
+    puzzles = list(
+        Puzzle.objects.select_related("hunt__settings")
+        .filter(pk__in=puzzle_ids, sheet__isnull=True)
+        .order_by("pk")
+    )
+    spare_files_by_hunt = {}
+    # All of the sheets are set up together, once they've been assigned.
+    pending_setups = []
+    for i, puzzle in enumerate(puzzles):
+        try:
+            with transaction.atomic():
+                if claim_pooled_sheet(puzzle, pending_setups):
+                    continue
 
-        sheet_url = new_file["webViewLink"]
-        puzzle.sheet = sheet_url
-        puzzle.save()
+            if puzzle.hunt_id not in spare_files_by_hunt:
+                spare_files = get_renamable_sheets(self, puzzle.hunt)
+                random.shuffle(spare_files)
+                spare_files_by_hunt[puzzle.hunt_id] = spare_files
+            spare_files = spare_files_by_hunt[puzzle.hunt_id]
+            existing_file = spare_files.pop() if spare_files else None
+
+            with transaction.atomic():
+                _create_google_sheet(self, puzzle, existing_file, pending_setups)
+        except SoftTimeLimitExceeded:
+            for remaining in puzzles[i:]:
+                create_google_sheets.delay(remaining.pk)
+            break
+        except Exception as e:
+            logger.warn(f"Failed to create a sheet for {puzzle.name}, retrying: {e}")
+            create_google_sheets.delay(puzzle.pk)
 
-        def post_create_tasks():
-            if existing_file:
-                # We copied over an existing file, but we haven't renamed it yet
-                rename_sheet.delay(sheet_url, puzzle.name)
+    if pending_setups:
+        set_up_sheets.delay(pending_setups)
+    for hunt in {puzzle.hunt_id: puzzle.hunt for puzzle in puzzles}.values():
+        _schedule_sheet_pool_refill(hunt)
 
-            transfer_ownership.delay(new_file, template_file_id)
-            add_puzzle_link_to_sheet.delay(puzzle.url, sheet_url)
 
-            if destination_folder_id:
-                move_drive_file.delay(
-                    file_id=new_file["id"], destination_folder_id=destination_folder_id
-                )
-            else:
-                logging.warn(
-                    f"Cannot move the new puzzle for {puzzle.name} as we can't find a drive folder"
-                )
+def _create_google_sheet(self, puzzle, existing_file, pending_setups=None) -> None:
+    template_file_id = _template_file_id(puzzle.hunt)
+    destination_folder_id = _destination_folder_id(puzzle.hunt)
 
-            if puzzle.chat_room:
-                handle_sheet_created.delay(puzzle_id)
+    new_file = None
 
-        # Only run these other tasks if we successfully commit this particular sheet ID
-        # We might not be able to if there's some race condition
-        # (for example, two puzzles claiming the same sheet at the same time)
-        transaction.on_commit(post_create_tasks)
+    if existing_file:
+        new_file = existing_file
+    else:
+        if not template_file_id:
+            logging.warn(
+                f"Cannot create a sheet for {puzzle.name} as we can't find a sheets template"
+            )
+            return
+        new_file = create_google_sheets_helper(self, puzzle.name, template_file_id)
+
+    sheet_url = new_file["webViewLink"]
+    puzzle.sheet = sheet_url
+    puzzle.save()
+
+    steps = ["transfer", "link"]
+    if existing_file:
+        # We copied over an existing file, but we haven't renamed it yet
+        steps.append("rename")
+    if destination_folder_id:
+        steps.append("move")
+    else:
+        logging.warn(
+            f"Cannot move the new puzzle for {puzzle.name} as we can't find a drive folder"
+        )
+
+    # Only set up the sheet if we successfully commit this particular sheet ID
+    # We might not be able to if there's some race condition
+    # (for example, two puzzles claiming the same sheet at the same time)
+    _set_up_sheet_on_commit(
+        _sheet_setup(
+            steps,
+            sheet_url,
+            file=new_file,
+            puzzle=puzzle,
+            template_file_id=template_file_id,
+            destination_folder_id=destination_folder_id,
+        ),
+        pending_setups,
+    )
+    if puzzle.chat_room:
+        transaction.on_commit(lambda: handle_sheet_created.delay(puzzle.pk))
 
 
 def extract_id_from_sheets_url(url) -> str:
@@ -171,23 +602,30 @@ def extract_id_from_sheets_url(url) -> str:
     return url[start:end]
 
 
-@shared_task(base=GoogleApiClientTask, bind=True)
-def add_puzzle_link_to_sheet(self, puzzle_url, sheet_url) -> None:
+def _puzzle_link_request(sheets_service, puzzle_url, sheet_url):
     req_body = {
         "values": [
             [f'=HYPERLINK("{puzzle_url}", "Puzzle Link")'],
         ]
     }
-    self.sheets_service().spreadsheets().values().update(
-        spreadsheetId=extract_id_from_sheets_url(sheet_url),
-        range="A1:B2",
-        valueInputOption="USER_ENTERED",
-        body=req_body,
-    ).execute()
+    return (
+        sheets_service.spreadsheets()
+        .values()
+        .update(
+            spreadsheetId=extract_id_from_sheets_url(sheet_url),
+            range="A1:B2",
+            valueInputOption="USER_ENTERED",
+            body=req_body,
+        )
+    )
 
 
 @shared_task(base=GoogleApiClientTask, bind=True)
-def rename_sheet(self, sheet_url, name) -> None:
+def add_puzzle_link_to_sheet(self, puzzle_url, sheet_url) -> None:
+    _puzzle_link_request(self.sheets_service(), puzzle_url, sheet_url).execute()
+
+
+def _rename_sheet_request(sheets_service, sheet_url, name):
     requests = [
         {
             "updateSpreadsheetProperties": {
@@ -199,9 +637,14 @@ def rename_sheet(self, sheet_url, name) -> None:
         }
     ]
     body = {"requests": requests}
-    self.sheets_service().spreadsheets().batchUpdate(
+    return sheets_service.spreadsheets().batchUpdate(
         spreadsheetId=extract_id_from_sheets_url(sheet_url), body=body
-    ).execute()
+    )
+
+
+@shared_task(base=GoogleApiClientTask, bind=True)
+def rename_sheet(self, sheet_url, name) -> None:
+    _rename_sheet_request(self.sheets_service(), sheet_url, name).execute()
 
 
 # create new tab in spreadsheet_id with given title
@@ -227,24 +670,35 @@ def _add_sheet(sheets_service, http, spreadsheet_id, title) -> str:
     return response["replies"][-1]["addSheet"]["properties"]["sheetId"]
 
 
-def _clear_sheet(sheets_service, http, spreadsheet_id, sheet_id) -> None:
-    requests = [
-        {
-            "updateCells": {
-                "range": {"sheetId": sheet_id},
-                "fields": "userEnteredValue,userEnteredFormat",
-            }
-        }
-    ]
+def _correct_answers_prefetch():
+    return Prefetch(
+        "guesses",
+        queryset=Answer.objects.filter(status=Answer.CORRECT),
+        to_attr="_prefetched_correct_answers",
+    )
+
 
-    sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={"requests": requests},
-    ).execute(http=http)
+def _get_meta_feeders(meta_puzzle):
+    """
+    Returns the meta's feeders sorted by name, with their correct answers and
+    their own feeders (with correct answers) prefetched, in a fixed number of
+    queries however many feeders there are.
+    """
+    feeders = meta_puzzle.feeders.prefetch_related(
+        _correct_answers_prefetch(),
+        Prefetch(
+            "feeders",
+            queryset=Puzzle.objects.prefetch_related(_correct_answers_prefetch()),
+        ),
+    )
+    return sorted(feeders, key=lambda p: p.name)
 
 
 def _build_feeder_table(feeders) -> int:
-    feeders_to_answers = {f: f.correct_answers() for f in feeders}
+    feeders_to_answers = {
+        f: sorted(answer.text for answer in f._prefetched_correct_answers)
+        for f in feeders
+    }
 
     if len(feeders_to_answers) > 0:
         max_num_answers = max(1, max((len(v) for v in feeders_to_answers.values())))
@@ -297,12 +751,133 @@ def _build_feeder_table(feeders) -> int:
     return table
 
 
+# How long to remember what was last written to each meta's Feeders tab. Without
+# it, the next update rewrites the whole tab.
+META_SHEET_FINGERPRINT_TIMEOUT = 7 * 24 * 60 * 60
+
+
+def _meta_sheet_fingerprint_key(puzzle_id):
+    return f"meta_sheet_fingerprint_{puzzle_id}"
+
+
+def _hash_sheet_row(row) -> str:
+    return hashlib.sha1(json.dumps(row, sort_keys=True).encode()).hexdigest()
+
+
+def _update_rows_request(sheet_id, rows, start, end, width) -> dict:
+    """
+    Writes rows[start:end] to the same rows of the sheet. Cells in the range that
+    the rows don't cover, up to the given width, are cleared.
+    """
+    return {
+        "updateCells": {
+            "fields": "userEnteredFormat.textFormat.fontFamily,"
+            "userEnteredValue.stringValue,"
+            "userEnteredValue.formulaValue,"
+            "userEnteredFormat.textFormat.bold",
+            "range": {
+                "sheetId": sheet_id,
+                "startRowIndex": start,
+                "endRowIndex": end,
+                "startColumnIndex": 0,
+                "endColumnIndex": width,
+            },
+            "rows": rows[start:end],
+        },
+    }
+
+
+def _changed_rows_requests(
+    sheet_id, old_hashes, new_hashes, rows, old_width, new_width
+) -> List[dict]:
+    """
+    Returns requests writing each run of rows that differ from the ones last
+    written, and clearing rows past the end of the new table.
+    """
+    # Clear anything the last write left past the new table's width.
+    width = max(old_width, new_width)
+    num_rows = max(len(old_hashes), len(new_hashes))
+    changed = [
+        i >= len(old_hashes) or i >= len(new_hashes) or old_hashes[i] != new_hashes[i]
+        for i in range(num_rows)
+    ]
+
+    requests = []
+    for is_changed, run in itertools.groupby(range(num_rows), key=changed.__getitem__):
+        if is_changed:
+            run = list(run)
+            requests.append(
+                _update_rows_request(sheet_id, rows, run[0], run[-1] + 1, width)
+            )
+    return requests
+
+
+def _feeders_sheet_setup_requests(sheets_service, http, spreadsheet_id):
+    """
+    Finds or creates the spreadsheet's Feeders tab. Returns its id, and requests
+    that clear and protect it, to go before the requests writing to it.
+    """
+    response = (
+        sheets_service.spreadsheets()
+        .get(
+            spreadsheetId=spreadsheet_id,
+            fields="sheets.properties.title,sheets.properties.sheetId,sheets.protectedRanges",
+        )
+        .execute(http=http)
+    )
+
+    sheet_id = None
+    protected_range_id = None
+    for sheet in response["sheets"]:
+        if sheet["properties"]["title"] == "Feeders":
+            sheet_id = sheet["properties"]["sheetId"]
+            if "protectedRanges" in sheet and len(sheet["protectedRanges"]) > 0:
+                protected_range_id = sheet["protectedRanges"][0]["protectedRangeId"]
+            break
+
+    requests = []
+    if sheet_id is None:
+        # create Feeders tab if it does not exist
+        sheet_id = _add_sheet(sheets_service, http, spreadsheet_id, "Feeders")
+    else:
+        # otherwise, clear the sheet
+        requests.append(
+            {
+                "updateCells": {
+                    "range": {"sheetId": sheet_id},
+                    "fields": "userEnteredValue,userEnteredFormat",
+                }
+            }
+        )
+
+    if protected_range_id is None:
+        requests.append(
+            {
+                "addProtectedRange": {
+                    "protectedRange": {
+                        "range": {
+                            "sheetId": sheet_id,
+                        },
+                        "description": "Autogenerated page",
+                        "warningOnly": False,
+                        "editors": {
+                            "users": settings.GOOGLE_API_AUTHN_INFO["client_email"]
+                        },
+                    }
+                }
+            }
+        )
+    return sheet_id, requests
+
+
 @shared_task(base=GoogleApiClientTask, bind=True, priority=TaskPriority.LOW.value)
 def _update_meta_sheet_feeders(self, puzzle_id) -> None:
     """
     Updates the input meta puzzle's spreadsheet with the
     latest feeder puzzle info
     """
+    # Changes from here on need another update.
+    cache.delete(_meta_sheet_update_key(puzzle_id))
     meta_puzzle = Puzzle.objects.get(pk=puzzle_id)
     if not meta_puzzle.is_meta or not meta_puzzle.sheet:
         return
@@ -311,8 +886,7 @@ def _update_meta_sheet_feeders(self, puzzle_id) -> None:
         "Starting updating the meta sheet for '%s' " "with feeder puzzles" % meta_puzzle
     )
     spreadsheet_id = extract_id_from_sheets_url(meta_puzzle.sheet)
-    feeders = meta_puzzle.feeders.all()
-    feeders = sorted(feeders, key=lambda p: p.name)
+    feeders = _get_meta_feeders(meta_puzzle)
     feeder_table = _build_feeder_table(feeders)
     width = len(feeder_table[0]["values"])
 
@@ -359,53 +933,33 @@ def _update_meta_sheet_feeders(self, puzzle_id) -> None:
         # ignore headers
         rows += grandfeeder_table[1:]
 
-    # Each thread needs its own http object because httplib2.Http()
-    # is used under the hood and that is not thread safe.
-    # Ref: https://github.com/googleapis/google-api-python-client/blob/master/docs/thread_safety.md
-    http = _auth.authorized_http(self._credentials)
-    sheets_service = self.sheets_service()
-    response = (
-        sheets_service.spreadsheets()
-        .get(
-            spreadsheetId=spreadsheet_id,
-            fields="sheets.properties.title,sheets.properties.sheetId,sheets.protectedRanges",
-        )
-        .execute(http=http)
-    )
+    row_hashes = [_hash_sheet_row(row) for row in rows]
+    fingerprint_key = _meta_sheet_fingerprint_key(puzzle_id)
+    fingerprint = cache.get(fingerprint_key)
+    if fingerprint and fingerprint["spreadsheet_id"] != spreadsheet_id:
+        fingerprint = None
+    if fingerprint and fingerprint["rows"] == row_hashes:
+        metrics.increment("meta_sheet_writes_skipped")
+        logger.info("Meta sheet for '%s' is already up to date" % meta_puzzle)
+        return
 
-    sheet_id = None
-    protected_range_id = None
-    for sheet in response["sheets"]:
-        if sheet["properties"]["title"] == "Feeders":
-            sheet_id = sheet["properties"]["sheetId"]
-            if "protectedRanges" in sheet and len(sheet["protectedRanges"]) > 0:
-                protected_range_id = sheet["protectedRanges"][0]["protectedRangeId"]
-            break
+    http = self.authorized_http()
+    sheets_service = self.sheets_service()
 
-    if sheet_id is None:
-        # create Feeders tab if it does not exist
-        sheet_id = _add_sheet(sheets_service, http, spreadsheet_id, "Feeders")
+    if fingerprint:
+        # The tab was set up by an earlier update, which wrote the rows hashed in
+        # the fingerprint, so only rows that changed since need writing.
+        sheet_id = fingerprint["sheet_id"]
+        requests = _changed_rows_requests(
+            sheet_id, fingerprint["rows"], row_hashes, rows, fingerprint["width"], width
+        )
     else:
-        # otherwise, clear the sheet
-        _clear_sheet(sheets_service, http, spreadsheet_id, sheet_id)
+        sheet_id, requests = _feeders_sheet_setup_requests(
+            sheets_service, http, spreadsheet_id
+        )
+        requests.append(_update_rows_request(sheet_id, rows, 0, len(rows), width))
 
-    requests = [
-        {
-            "updateCells": {
-                "fields": "userEnteredFormat.textFormat.fontFamily,"
-                "userEnteredValue.stringValue,"
-                "userEnteredValue.formulaValue,"
-                "userEnteredFormat.textFormat.bold",
-                "range": {
-                    "sheetId": sheet_id,
-                    "startRowIndex": 0,
-                    "endRowIndex": len(rows),
-                    "startColumnIndex": 0,
-                    "endColumnIndex": width,
-                },
-                "rows": rows,
-            },
-        },
+    requests.append(
         {
             "autoResizeDimensions": {
                 "dimensions": {
@@ -415,39 +969,64 @@ def _update_meta_sheet_feeders(self, puzzle_id) -> None:
                     "endIndex": width,
                 },
             },
-        },
-    ]
-    if protected_range_id is None:
-        requests.append(
-            {
-                "addProtectedRange": {
-                    "protectedRange": {
-                        "range": {
-                            "sheetId": sheet_id,
-                        },
-                        "description": "Autogenerated page",
-                        "warningOnly": False,
-                        "editors": {
-                            "users": settings.GOOGLE_API_AUTHN_INFO["client_email"]
-                        },
-                    }
-                }
-            }
-        )
+        }
+    )
 
-    sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": requests}
-    ).execute(http=http)
+    try:
+        sheets_service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id, body={"requests": requests}
+        ).execute(http=http)
+    except Exception:
+        # The sheet may not be what the fingerprint says, so rewrite all of it
+        # on retry.
+        cache.delete(fingerprint_key)
+        raise
+    cache.set(
+        fingerprint_key,
+        {
+            "spreadsheet_id": spreadsheet_id,
+            "sheet_id": sheet_id,
+            "rows": row_hashes,
+            "width": width,
+        },
+        timeout=META_SHEET_FINGERPRINT_TIMEOUT,
+    )
     logger.info(
         "Done updating the meta sheet for '%s' " "with feeder puzzles" % meta_puzzle
     )
 
 
+def _meta_sheet_update_key(puzzle_id):
+    return f"meta_sheet_update_{puzzle_id}"
+
+
+def schedule_meta_sheet_update(puzzle_id):
+    """
+    Updates the meta's sheet META_SHEET_UPDATE_SECONDS from now, unless an
+    update is already scheduled, in which case that one picks up this change.
+    Bursts of changes (e.g. a round of solves) then cost one update per meta.
+    """
+    delay = settings.META_SHEET_UPDATE_SECONDS
+    if delay <= 0:
+        _update_meta_sheet_feeders.delay(puzzle_id)
+        return
+
+    # Expires on its own in case the scheduled update is lost.
+    if cache.add(_meta_sheet_update_key(puzzle_id), True, timeout=2 * delay):
+        metrics.increment("meta_sheet_updates_scheduled")
+        _update_meta_sheet_feeders.apply_async(args=(puzzle_id,), countdown=delay)
+    else:
+        metrics.increment("meta_sheet_updates_coalesced")
+
+
 def update_meta_and_metameta_sheets_delayed(meta):
-    _update_meta_sheet_feeders.delay(meta.id)
+    schedule_meta_sheet_update(meta.id)
 
-    for metameta in meta.metas.all():
-        _update_meta_sheet_feeders.delay(metameta.id)
+    # Meta sheets list feeders of feeders too, so the metas' sheets change.
+    for metameta_id in MetaClosure.objects.filter(descendant=meta, depth=1).values_list(
+        "ancestor_id", flat=True
+    ):
+        schedule_meta_sheet_update(metameta_id)
 
 
 def extract_id_from_person_name(person_name) -> Optional[str]:
@@ -481,8 +1060,7 @@ def get_puzzler_from_uid(google_api_client, uid) -> Optional[str]:
 
     # Fall back to People API
     # Note that this API depends on the email being added as service account's contact list
-    # It also has a tight request limit
-    time.sleep(1)
+    # It also has a tight request limit, which the "people" quota keeps us under
 
     response = (
         google_api_client.people_service()
@@ -664,6 +1242,8 @@ def update_active_users(self, hunt_id):
                 updates, fields=["last_edit_time", "num_edits"]
             )
 
+        touch_puzzles({puzzle_pk for (_, puzzle_pk) in latest.keys()})
+
         hunt.last_active_users_update_time = end
         hunt.save()
 
@@ -713,3 +1293,5 @@ def sync_drive_permissions_for_hunt(self, hunt_id):
         id__in=[user.pk for user in users_with_access]
     )
     assign_perm("hunt_access", users, hunt)
+    # Assigning to a queryset skips the signals that clear cached permissions.
+    invalidate_hunt_permissions(hunt.pk)
@@ -1,9 +1,22 @@
-from unittest.mock import patch
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from celery.exceptions import Retry
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 import google_api_lib
-from hunts.models import Hunt
+from answers.models import Answer
+from cardboard.metrics import get_metrics
+from cardboard.redis_client import get_redis_client
+from cardboard.settings import TaskPriority
+from google_api_lib import quota
+from google_api_lib.utils import GoogleApiClientTask
+from hunts.models import Hunt, PooledSheet
 from puzzles.models import Puzzle
 
 TEST_SHEET = "testsheet.com"
@@ -101,3 +114,580 @@ class TestGoogleSheets(TestCase):
         self.assertEqual(
             Puzzle.objects.get(pk=puzzle.id).sheet, TEST_SHEET_EXISTING_FILE_URL
         )
+
+    @patch(
+        "google_api_lib.tasks.create_google_sheets_helper",
+        mock_create_google_sheets_helper,
+    )
+    @patch(
+        "google_api_lib.tasks.transfer_ownership.delay",
+        mock_transfer_ownership,
+    )
+    @patch("google_api_lib.tasks.move_drive_file.delay", mock_move_drive_file)
+    @patch(
+        "google_api_lib.tasks.get_renamable_sheets",
+        lambda *args: [
+            {"id": "1", "webViewLink": "spare1.com"},
+            {"id": "2", "webViewLink": "spare2.com"},
+        ],
+    )
+    @patch(
+        "google_api_lib.tasks.add_puzzle_link_to_sheet", mock_add_puzzle_link_to_sheet
+    )
+    def test_sheet_creation_for_puzzles(self):
+        puzzles = [
+            Puzzle.objects.create(
+                name=f"test{i}",
+                hunt=self._test_hunt,
+                url=f"fake_url{i}.com",
+                is_meta=False,
+            )
+            for i in range(3)
+        ]
+        google_api_lib.tasks.create_google_sheets_for_puzzles(
+            [puzzle.id for puzzle in puzzles]
+        )
+
+        # Each spare sheet is used once before copying the template.
+        self.assertEqual(
+            sorted(Puzzle.objects.values_list("sheet", flat=True)),
+            ["spare1.com", "spare2.com", TEST_SHEET],
+        )
+
+    @patch("google_api_lib.tasks.create_google_sheets_helper")
+    @patch("google_api_lib.tasks.maybe_get_renamable_sheet_for_puzzle")
+    @patch("google_api_lib.tasks.set_up_sheets.delay")
+    @patch("google_api_lib.tasks.refill_sheet_pool.delay")
+    def test_sheet_creation_from_pool(
+        self,
+        refill_sheet_pool,
+        set_up_sheets,
+        maybe_get_renamable_sheet_for_puzzle,
+        create_google_sheets_helper,
+    ):
+        stale = PooledSheet.objects.create(
+            hunt=self._test_hunt,
+            template_file_id="oldtemplate",
+            file_id="old",
+            url="old.com",
+            ready=True,
+        )
+        PooledSheet.objects.create(
+            hunt=self._test_hunt,
+            template_file_id=TEST_SHEET_TEMPLATE_ID,
+            file_id="pooled",
+            url="pooled.com",
+            ready=True,
+        )
+        cache.delete(google_api_lib.tasks._sheet_pool_refill_key(self._test_hunt.pk))
+        puzzle = Puzzle.objects.create(
+            name="test", hunt=self._test_hunt, url="fake_url.com", is_meta=False
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            google_api_lib.tasks.create_google_sheets(puzzle.id)
+
+        self.assertEqual(Puzzle.objects.get(pk=puzzle.id).sheet, "pooled.com")
+        self.assertEqual(list(self._test_hunt.pooled_sheets.all()), [stale])
+        # The sheet only needs renaming and the puzzle link.
+        ((sheet_setups,), _) = set_up_sheets.call_args
+        self.assertEqual(
+            [(setup["sheet_url"], setup["steps"]) for setup in sheet_setups],
+            [("pooled.com", ["rename", "link"])],
+        )
+        refill_sheet_pool.assert_called_once_with(self._test_hunt.pk)
+        self.assertFalse(maybe_get_renamable_sheet_for_puzzle.called)
+        self.assertFalse(create_google_sheets_helper.called)
+
+    @contextmanager
+    def mock_google_services(self, task, drive_service, sheets_service):
+        cache.delete(f"template_owner_{TEST_SHEET_TEMPLATE_ID}")
+        with patch.multiple(
+            task,
+            sheets_owner=MagicMock(return_value="owner@test.com"),
+            drive_service=MagicMock(return_value=drive_service),
+            sheets_service=MagicMock(return_value=sheets_service),
+            authorized_http=MagicMock(),
+        ), patch("google_api_lib.quota.acquire_for_requests"):
+            yield
+
+    def test_sheets_set_up_in_batches(self):
+        def fake_batch(service, failing_request_ids):
+            batches = []
+
+            def new_batch_http_request(callback):
+                batch = MagicMock()
+                batch.request_ids = []
+                batch.add.side_effect = (
+                    lambda request, request_id: batch.request_ids.append(request_id)
+                )
+                batch.execute.side_effect = lambda http: [
+                    callback(
+                        request_id,
+                        None,
+                        Exception() if request_id in failing_request_ids else None,
+                    )
+                    for request_id in batch.request_ids
+                ]
+                batches.append(batch)
+                return batch
+
+            service.new_batch_http_request.side_effect = new_batch_http_request
+            return batches
+
+        drive_service = MagicMock()
+        sheets_service = MagicMock()
+        drive_batches = fake_batch(drive_service, [])
+        sheets_batches = fake_batch(sheets_service, ["1-link"])
+        puzzles = [
+            Puzzle.objects.create(
+                name=f"test{i}", hunt=self._test_hunt, url=f"fake_url{i}.com"
+            )
+            for i in range(2)
+        ]
+        sheet_setups = [
+            google_api_lib.tasks._sheet_setup(
+                ["transfer", "link", "rename", "move"],
+                f"sheet{i}.com",
+                file={
+                    "id": str(i),
+                    "permissions": [{"id": "p", "emailAddress": "owner@test.com"}],
+                    "parents": ["root"],
+                },
+                puzzle=puzzle,
+                template_file_id=TEST_SHEET_TEMPLATE_ID,
+                destination_folder_id="huntfolder",
+            )
+            for i, puzzle in enumerate(puzzles)
+        ]
+
+        task = google_api_lib.tasks.set_up_sheets
+        with self.mock_google_services(task, drive_service, sheets_service):
+            failed = google_api_lib.tasks._set_up_sheets(task, sheet_setups)
+
+        # One batch request to each service sets up both sheets.
+        self.assertEqual(
+            [batch.request_ids for batch in drive_batches],
+            [["0-transfer", "0-move", "1-transfer", "1-move"]],
+        )
+        self.assertEqual(
+            [batch.request_ids for batch in sheets_batches],
+            [["0-rename", "0-link", "1-rename", "1-link"]],
+        )
+        # Files are moved without looking up their parents.
+        self.assertFalse(drive_service.files().get.called)
+        # Only the step that failed is left to retry.
+        self.assertEqual(
+            [(setup["sheet_url"], setup["steps"]) for setup in failed],
+            [("sheet1.com", ["link"])],
+        )
+
+        # It's retried with backoff rather than the fixed default delay, even
+        # after celery's autoretry has left a countdown in retry_kwargs.
+        with patch(
+            "google_api_lib.tasks._set_up_sheets", return_value=failed
+        ), patch.dict(task.retry_kwargs, countdown=60), patch.object(
+            task, "retry", return_value=Retry()
+        ) as retry:
+            with self.assertRaises(Retry):
+                task(sheet_setups)
+        self.assertEqual(retry.call_args.kwargs["args"], (failed,))
+        self.assertLessEqual(retry.call_args.kwargs["countdown"], 1)
+
+    @override_settings(SHEET_POOL_SIZE=3)
+    @patch("google_api_lib.tasks.create_google_sheets_helper")
+    def test_refill_sheet_pool(self, create_google_sheets_helper):
+        self._test_hunt.settings.google_drive_folder_id = "huntfolder"
+        self._test_hunt.settings.save()
+        PooledSheet.objects.create(
+            hunt=self._test_hunt,
+            template_file_id="oldtemplate",
+            file_id="old",
+            url="old.com",
+            ready=True,
+        )
+        PooledSheet.objects.create(
+            hunt=self._test_hunt,
+            template_file_id=TEST_SHEET_TEMPLATE_ID,
+            file_id="pooled",
+            url="pooled.com",
+            ready=True,
+        )
+        create_google_sheets_helper.side_effect = lambda self, name, template: {
+            "id": f"new{create_google_sheets_helper.call_count}",
+            "webViewLink": f"new{create_google_sheets_helper.call_count}.com",
+            "permissions": [{"id": "permission", "emailAddress": "owner@test.com"}],
+            "parents": ["root"],
+        }
+        lock_key = google_api_lib.tasks._sheet_pool_refill_key(self._test_hunt.pk)
+        cache.delete(lock_key)
+
+        drive_service = MagicMock()
+        with self.mock_google_services(
+            google_api_lib.tasks.refill_sheet_pool, drive_service, MagicMock()
+        ):
+            google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+
+            # Copies of the old template are trashed, and new ones made up to
+            # the pool size.
+            self.assertEqual(
+                sorted(self._test_hunt.pooled_sheets.values_list("file_id", flat=True)),
+                ["new1", "new2", "pooled"],
+            )
+            trash_call, *move_calls = drive_service.files().update.call_args_list
+            self.assertEqual(
+                trash_call.kwargs, {"fileId": "old", "body": {"trashed": True}}
+            )
+            # Each copy is ready to use.
+            self.assertFalse(self._test_hunt.pooled_sheets.filter(ready=False).exists())
+            self.assertEqual(drive_service.permissions().update.call_count, 2)
+            self.assertEqual(
+                [call.kwargs["addParents"] for call in move_calls],
+                ["huntfolder", "huntfolder"],
+            )
+
+            # A full pool isn't refilled, and neither is one already being
+            # refilled.
+            google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+            PooledSheet.objects.filter(file_id="pooled").delete()
+            cache.add(lock_key, True)
+            google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+            cache.delete(lock_key)
+            self.assertEqual(create_google_sheets_helper.call_count, 2)
+
+    @override_settings(SHEET_POOL_SIZE=3)
+    @patch("google_api_lib.tasks.create_google_sheets_helper")
+    def test_refill_sheet_pool_interrupted(self, create_google_sheets_helper):
+        def copy_once(self, name, template):
+            if create_google_sheets_helper.call_count > 1:
+                raise quota.GoogleApiQuotaTimeout()
+            return {
+                "id": "new1",
+                "webViewLink": "new1.com",
+                "permissions": [{"id": "permission", "emailAddress": "owner@test.com"}],
+                "parents": ["root"],
+            }
+
+        create_google_sheets_helper.side_effect = copy_once
+        cache.delete(google_api_lib.tasks._sheet_pool_refill_key(self._test_hunt.pk))
+
+        drive_service = MagicMock()
+        with self.mock_google_services(
+            google_api_lib.tasks.refill_sheet_pool, drive_service, MagicMock()
+        ):
+            with self.assertRaises(quota.GoogleApiQuotaTimeout):
+                google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+            # The copy made before the refill stopped is kept track of, but
+            # isn't claimed.
+            self.assertEqual(
+                list(self._test_hunt.pooled_sheets.values_list("file_id", "ready")),
+                [("new1", False)],
+            )
+
+            # The next refill trashes it.
+            with self.assertRaises(quota.GoogleApiQuotaTimeout):
+                google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+        self.assertFalse(self._test_hunt.pooled_sheets.exists())
+        drive_service.files().update.assert_called_once_with(
+            fileId="new1", body={"trashed": True}
+        )
+
+    @override_settings(SHEET_POOL_SIZE=3)
+    @patch("google_api_lib.tasks.create_google_sheets_helper")
+    @patch("google_api_lib.tasks.refill_sheet_pool.delay")
+    def test_no_sheet_pool_with_template_folder(
+        self, refill_sheet_pool_delay, create_google_sheets_helper
+    ):
+        self._test_hunt.settings.google_sheets_template_folder_id = "templatefolder"
+        self._test_hunt.settings.save()
+        PooledSheet.objects.create(
+            hunt=self._test_hunt,
+            template_file_id=TEST_SHEET_TEMPLATE_ID,
+            file_id="pooled",
+            url="pooled.com",
+            ready=True,
+        )
+        cache.delete(google_api_lib.tasks._sheet_pool_refill_key(self._test_hunt.pk))
+        puzzle = Puzzle.objects.create(
+            name="test", hunt=self._test_hunt, url="fake_url.com", is_meta=False
+        )
+
+        # The template folder's spare sheets are used instead of the pool.
+        with transaction.atomic():
+            self.assertFalse(google_api_lib.tasks.claim_pooled_sheet(puzzle))
+        google_api_lib.tasks._schedule_sheet_pool_refill(self._test_hunt)
+        self.assertFalse(refill_sheet_pool_delay.called)
+
+        # Sheets pooled before the folder was set are trashed.
+        drive_service = MagicMock()
+        with self.mock_google_services(
+            google_api_lib.tasks.refill_sheet_pool, drive_service, MagicMock()
+        ):
+            google_api_lib.tasks.refill_sheet_pool(self._test_hunt.pk)
+        self.assertFalse(self._test_hunt.pooled_sheets.exists())
+        drive_service.files().update.assert_called_once_with(
+            fileId="pooled", body={"trashed": True}
+        )
+        self.assertFalse(create_google_sheets_helper.called)
+
+    @override_settings(META_SHEET_UPDATE_SECONDS=30)
+    @patch("google_api_lib.tasks._update_meta_sheet_feeders.apply_async")
+    def test_meta_sheet_updates_coalesced(self, apply_async):
+        meta = Puzzle.objects.create(
+            name="meta", hunt=self._test_hunt, url="meta.com", is_meta=True
+        )
+        metameta = Puzzle.objects.create(
+            name="metameta", hunt=self._test_hunt, url="metameta.com", is_meta=True
+        )
+        meta.metas.add(metameta)
+        for puzzle in (meta, metameta):
+            cache.delete(google_api_lib.tasks._meta_sheet_update_key(puzzle.pk))
+        coalesced = get_metrics().get("meta_sheet_updates_coalesced", 0)
+
+        for _ in range(3):
+            google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(meta)
+        self.assertEqual(
+            sorted(call.kwargs["args"] for call in apply_async.call_args_list),
+            [(meta.pk,), (metameta.pk,)],
+        )
+        self.assertEqual(get_metrics()["meta_sheet_updates_coalesced"], coalesced + 4)
+
+        # Once the update starts, later changes schedule another one.
+        google_api_lib.tasks._update_meta_sheet_feeders(meta.pk)
+        google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(meta)
+        self.assertEqual(apply_async.call_count, 3)
+        apply_async.assert_called_with(args=(meta.pk,), countdown=30)
+
+    def run_meta_sheet_update(self, meta, sheets_service):
+        with patch.object(
+            google_api_lib.tasks._update_meta_sheet_feeders, "authorized_http"
+        ), patch.object(
+            google_api_lib.tasks._update_meta_sheet_feeders,
+            "sheets_service",
+            return_value=sheets_service,
+        ):
+            google_api_lib.tasks._update_meta_sheet_feeders(meta.pk)
+
+    def test_meta_sheet_update_writes_changed_rows(self):
+        meta = Puzzle.objects.create(
+            name="meta",
+            hunt=self._test_hunt,
+            url="meta.com",
+            sheet="https://docs.google.com/spreadsheets/d/metasheet/edit",
+            is_meta=True,
+        )
+        feeders = [
+            Puzzle.objects.create(
+                name=f"feeder{i}", hunt=self._test_hunt, url=f"feeder{i}.com"
+            )
+            for i in range(3)
+        ]
+        meta.feeders.add(*feeders)
+        cache.delete(google_api_lib.tasks._meta_sheet_fingerprint_key(meta.pk))
+
+        sheets_service = MagicMock()
+        spreadsheets = sheets_service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            "sheets": [
+                {
+                    "properties": {"title": "Feeders", "sheetId": 7},
+                    "protectedRanges": [{"protectedRangeId": 1}],
+                }
+            ]
+        }
+
+        def update():
+            spreadsheets.reset_mock()
+            self.run_meta_sheet_update(meta, sheets_service)
+            if not spreadsheets.batchUpdate.called:
+                return None
+            return spreadsheets.batchUpdate.call_args.kwargs["body"]["requests"]
+
+        # The first update clears the tab and writes all of it.
+        requests = update()
+        self.assertTrue(spreadsheets.get.called)
+        self.assertEqual(
+            [list(request) for request in requests],
+            [["updateCells"], ["updateCells"], ["autoResizeDimensions"]],
+        )
+        self.assertEqual(len(requests[1]["updateCells"]["rows"]), 7)
+
+        # Nothing changed, so nothing is written.
+        self.assertIsNone(update())
+
+        # Only the changed feeder's row is written.
+        Answer.objects.create(text="ANSWER", puzzle=feeders[1]).set_status(
+            Answer.CORRECT
+        )
+        requests = update()
+        self.assertFalse(spreadsheets.get.called)
+        self.assertEqual(len(requests), 2)
+        cells = requests[0]["updateCells"]
+        self.assertEqual(cells["range"]["startRowIndex"], 5)
+        self.assertEqual(cells["range"]["endRowIndex"], 6)
+        self.assertEqual(
+            cells["rows"][0]["values"][3]["userEnteredValue"]["stringValue"], "ANSWER"
+        )
+
+        # Rows past the end of the table are cleared.
+        meta.feeders.remove(feeders[2])
+        requests = update()
+        cells = requests[0]["updateCells"]
+        self.assertEqual(cells["range"]["startRowIndex"], 6)
+        self.assertEqual(cells["range"]["endRowIndex"], 7)
+        self.assertEqual(cells["rows"], [])
+
+    def test_meta_sheet_update_query_count_independent_of_feeders(self):
+        metameta = Puzzle.objects.create(
+            name="metameta",
+            hunt=self._test_hunt,
+            url="metameta.com",
+            sheet="https://docs.google.com/spreadsheets/d/metasheet/edit",
+            is_meta=True,
+        )
+        sheets_service = MagicMock()
+        spreadsheets = sheets_service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            "sheets": [
+                {
+                    "properties": {"title": "Feeders", "sheetId": 7},
+                    "protectedRanges": [{"protectedRangeId": 1}],
+                }
+            ]
+        }
+
+        def add_feeders(count):
+            meta = Puzzle.objects.create(
+                name=f"meta{metameta.feeders.count()}",
+                hunt=self._test_hunt,
+                url=f"meta{metameta.feeders.count()}.com",
+                is_meta=True,
+            )
+            metameta.feeders.add(meta)
+            for i in range(count):
+                feeder = Puzzle.objects.create(
+                    name=f"{meta.name} feeder{i}",
+                    hunt=self._test_hunt,
+                    url=f"{meta.url}/{i}",
+                )
+                Answer.objects.create(text=f"ANSWER{i}", puzzle=feeder).set_status(
+                    Answer.CORRECT
+                )
+                meta.feeders.add(feeder)
+                metameta.feeders.add(feeder)
+
+        def count_queries():
+            cache.delete(google_api_lib.tasks._meta_sheet_fingerprint_key(metameta.pk))
+            with CaptureQueriesContext(connection) as queries:
+                self.run_meta_sheet_update(metameta, sheets_service)
+            return len(queries)
+
+        add_feeders(2)
+        small = count_queries()
+        for _ in range(3):
+            add_feeders(5)
+        self.assertEqual(count_queries(), small)
+
+
+class TestGoogleApiClients(TestCase):
+    def setUp(self):
+        self.task = GoogleApiClientTask()
+        self.task._credentials = MagicMock(valid=True)
+
+    def test_clients_reused_per_thread(self):
+        sheets_service = self.task.sheets_service()
+        self.assertIs(self.task.sheets_service(), sheets_service)
+        self.assertIsNot(self.task.drive_service(), sheets_service)
+        self.assertIs(self.task.drive_service()._http, sheets_service._http)
+
+        other_thread_services = []
+        thread = threading.Thread(
+            target=lambda: other_thread_services.append(self.task.sheets_service())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(other_thread_services[0], sheets_service)
+
+    def test_credentials_refreshed_before_expiry(self):
+        credentials = self.task._credentials
+        credentials.valid = False
+        credentials.refresh.side_effect = lambda request: setattr(
+            credentials, "valid", True
+        )
+
+        self.task.sheets_service()
+        self.task.sheets_service()
+        credentials.refresh.assert_called_once()
+
+
+@override_settings(
+    GOOGLE_API_RATE_LIMITS={"test": (10, 1)}, GOOGLE_API_QUOTA_MAX_WAIT_SECONDS=5
+)
+class TestGoogleApiQuota(TestCase):
+    def setUp(self):
+        get_redis_client().delete(quota._bucket_key("test"), quota._waiting_key("test"))
+
+    def try_acquire(self, priority, waiter):
+        script = get_redis_client().register_script(quota._ACQUIRE_SCRIPT)
+        keys = [quota._bucket_key("test"), quota._waiting_key("test")]
+        return script(keys, [10, 1, 1, priority, waiter, 5])
+
+    def test_calls_wait_for_quota(self):
+        start = time.monotonic()
+        quota.acquire("test", TaskPriority.LOW.value)
+        quota.acquire("test", TaskPriority.LOW.value)
+        self.assertGreater(time.monotonic() - start, 0.05)
+
+        with override_settings(GOOGLE_API_QUOTA_MAX_WAIT_SECONDS=0):
+            with self.assertRaises(quota.GoogleApiQuotaTimeout):
+                quota.acquire("test", TaskPriority.LOW.value, tokens=5)
+
+    def test_higher_priority_calls_go_first(self):
+        self.assertEqual(self.try_acquire(TaskPriority.LOW.value, "low"), 0)
+        self.assertGreater(self.try_acquire(TaskPriority.HIGH.value, "high"), 0)
+        self.assertEqual(
+            quota.get_queue_depths(), {"test": {TaskPriority.HIGH.value: 1}}
+        )
+
+        # Once there's quota again, the waiting high priority call gets it.
+        time.sleep(0.15)
+        self.assertGreater(self.try_acquire(TaskPriority.LOW.value, "low"), 0)
+        self.assertEqual(self.try_acquire(TaskPriority.HIGH.value, "high"), 0)
+        self.assertEqual(
+            quota.get_queue_depths(), {"test": {TaskPriority.LOW.value: 1}}
+        )
+
+    def test_buckets(self):
+        self.assertEqual(
+            quota.bucket_for(
+                "https://sheets.googleapis.com/v4/spreadsheets/abc?alt=json", "GET"
+            ),
+            "sheets_read",
+        )
+        self.assertEqual(
+            quota.bucket_for(
+                "https://sheets.googleapis.com/v4/spreadsheets/abc:batchUpdate", "POST"
+            ),
+            "sheets_write",
+        )
+        self.assertEqual(
+            quota.bucket_for("https://www.googleapis.com/drive/v3/files/abc", "GET"),
+            "drive",
+        )
+        self.assertEqual(
+            quota.bucket_for("https://people.googleapis.com/v1/people/123", "GET"),
+            "people",
+        )
+        # Calls in batches are counted by acquire_for_requests instead.
+        self.assertIsNone(
+            quota.bucket_for("https://www.googleapis.com/batch/drive/v3", "POST")
+        )
+
+    @patch("google_api_lib.quota.acquire")
+    def test_rate_limited_http(self, acquire):
+        http = quota.RateLimitedHttp(MagicMock(), TaskPriority.HIGH.value)
+        http.request("https://sheets.googleapis.com/v4/spreadsheets/abc", "PUT")
+        acquire.assert_called_once_with("sheets_write", TaskPriority.HIGH.value)
+        http.http.request.assert_called_once_with(
+            "https://sheets.googleapis.com/v4/spreadsheets/abc", "PUT"
+        )
@@ -1,12 +1,17 @@
 import logging
+import threading
 
+import google_auth_httplib2
 import googleapiclient
 import googleapiclient.discovery
 import googleapiclient.errors
+import httplib2
 from celery import Task
 from django.conf import settings
 from google.oauth2 import service_account
 
+from .quota import GoogleApiQuotaTimeout, RateLimitedHttp
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,40 +20,89 @@ def enabled():
 
 
 class GoogleApiClientTask(Task):
-    autoretry_for = (googleapiclient.errors.Error,)
+    autoretry_for = (googleapiclient.errors.Error, GoogleApiQuotaTimeout)
     retry_kwargs = {"max_retries": 5}
     retry_backoff = True
     retry_backoff_max = 600
     retry_jitter = True
 
+    # Credentials are shared by all tasks in the worker, so that they fetch one
+    # access token between them.
+    _shared_credentials = None
+    _credentials_lock = threading.Lock()
+
     def __init__(self):
+        # Clients are kept for the life of the worker, one set per thread, since
+        # the HTTP connections under them aren't thread safe.
+        # Ref: https://github.com/googleapis/google-api-python-client/blob/main/docs/thread_safety.md
+        self._clients = threading.local()
         if not enabled():
             return
 
-        self._credentials = service_account.Credentials.from_service_account_info(
-            settings.GOOGLE_API_AUTHN_INFO,
-            scopes=settings.GOOGLE_DRIVE_PERMISSIONS_SCOPES,
-        )
+        with GoogleApiClientTask._credentials_lock:
+            if GoogleApiClientTask._shared_credentials is None:
+                GoogleApiClientTask._shared_credentials = (
+                    service_account.Credentials.from_service_account_info(
+                        settings.GOOGLE_API_AUTHN_INFO,
+                        scopes=settings.GOOGLE_DRIVE_PERMISSIONS_SCOPES,
+                    )
+                )
+        self._credentials = GoogleApiClientTask._shared_credentials
+
+    def _refresh_credentials(self):
+        # Credentials stop being valid a few minutes before they expire, so this
+        # refreshes them ahead of time, once for all threads, rather than in the
+        # middle of a request on each of them.
+        if self._credentials.valid:
+            return
+        with GoogleApiClientTask._credentials_lock:
+            if not self._credentials.valid:
+                self._credentials.refresh(google_auth_httplib2.Request(httplib2.Http()))
+
+    @property
+    def quota_priority(self):
+        """The priority with which the task's calls acquire quota (see quota.acquire)."""
+        if self.priority is None:
+            return settings.CELERY_TASK_DEFAULT_PRIORITY
+        return self.priority
+
+    def authorized_http(self):
+        """
+        Returns this thread's authorized HTTP connection, shared by its clients.
+        Each call made through it waits for quota first.
+        """
+        self._refresh_credentials()
+        if getattr(self._clients, "http", None) is None:
+            self._clients.http = RateLimitedHttp(
+                google_auth_httplib2.AuthorizedHttp(
+                    self._credentials, http=httplib2.Http()
+                ),
+                self.quota_priority,
+            )
+        return self._clients.http
+
+    def _service(self, name, version):
+        http = self.authorized_http()
+        services = self._clients.__dict__.setdefault("services", {})
+        if (name, version) not in services:
+            # Uses the discovery document bundled with the client library, so
+            # building makes no requests.
+            services[(name, version)] = googleapiclient.discovery.build(
+                name, version, http=http, cache_discovery=False, static_discovery=True
+            )
+        return services[(name, version)]
 
     def people_service(self):
-        return googleapiclient.discovery.build(
-            "people", "v1", credentials=self._credentials, cache_discovery=False
-        )
+        return self._service("people", "v1")
 
     def drive_service(self):
-        return googleapiclient.discovery.build(
-            "drive", "v3", credentials=self._credentials, cache_discovery=False
-        )
+        return self._service("drive", "v3")
 
     def drive_activity_service(self):
-        return googleapiclient.discovery.build(
-            "driveactivity", "v2", credentials=self._credentials, cache_discovery=False
-        )
+        return self._service("driveactivity", "v2")
 
     def sheets_service(self):
-        return googleapiclient.discovery.build(
-            "sheets", "v4", credentials=self._credentials, cache_discovery=False
-        )
+        return self._service("sheets", "v4")
 
     def sheets_owner(self, file_id):
         """Returns the owner of the provided Sheet."""
@@ -1,4 +1,3 @@
-from django.db.models import Case, Max, When
 from django.utils import timezone
 
 from puzzles.models import Puzzle
@@ -6,9 +5,11 @@ from puzzles.models import Puzzle
 from .models import Hunt
 
 
-def can_use_chart(hunt):
+def can_use_chart(hunt, num_unlocked=None):
     if not hunt.start_time:
-        return hunt.get_num_unlocked() > 0
+        if num_unlocked is None:
+            num_unlocked = hunt.get_num_unlocked()
+        return num_unlocked > 0
 
     return timezone.now() > hunt.start_time
 
@@ -27,6 +28,21 @@ def get_chart_data(hunt, unlocks=False):
     if not chart_start_time:
         chart_start_time = hunt.puzzles.earliest("created_on").created_on
 
+    if unlocks:
+        sorted_puzzles = hunt.puzzles.all().order_by("created_on")
+        points = [(p.name, p.created_on, p.is_meta) for p in sorted_puzzles]
+    else:
+        sorted_puzzles = hunt.puzzles.filter(
+            status=Puzzle.SOLVED, solved_at__isnull=False
+        ).order_by("solved_at")
+        points = [(p.name, p.solved_at, p.is_meta) for p in sorted_puzzles]
+
+    return build_chart_data(hunt, points, chart_start_time, unlocks=unlocks)
+
+
+# Returns get_chart_data's result given the (name, time, is_meta) of each solved
+# or unlocked puzzle, sorted by time.
+def build_chart_data(hunt, points, chart_start_time, unlocks=False):
     labels = ["Start"]
     times = [chart_start_time.isoformat()]
     counts = [0]
@@ -36,37 +52,18 @@ def get_chart_data(hunt, unlocks=False):
     if hunt.end_time:
         chart_end_time = min(chart_end_time, hunt.end_time)
 
-    if unlocks:
-        sorted_puzzles = hunt.puzzles.all().order_by("created_on")
-    else:
-        sorted_puzzles = (
-            hunt.puzzles.filter(status=Puzzle.SOLVED)
-            .annotate(
-                _solved_time=Max(
-                    Case(When(guesses__status="CORRECT", then="guesses__created_on"))
-                )
-            )
-            .order_by("_solved_time")
-        )
-    total_count = sorted_puzzles.count()
-
-    for i, puzzle in enumerate(sorted_puzzles):
-        if (not unlocks and puzzle._solved_time > chart_end_time) or (
-            unlocks and puzzle.created_on > chart_end_time
-        ):
+    total_count = len(points)
+    for i, (name, time_data, puzzle_is_meta) in enumerate(points):
+        if time_data > chart_end_time:
             total_count = i
             break
-        labels.append(puzzle.name)
-        if unlocks:
-            time_data = puzzle.created_on
-        else:
-            time_data = puzzle._solved_time
+        labels.append(name)
         if time_data < chart_start_time:
             time_data = chart_start_time
         times.append(time_data.isoformat())
         counts.append(i + 1)
         if not unlocks:
-            is_meta.append(puzzle.is_meta)
+            is_meta.append(puzzle_is_meta)
 
     if hunt.end_time and chart_end_time < hunt.end_time:
         labels.append("Now")
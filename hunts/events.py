@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.db import connection, transaction
+
+from cardboard import metrics
+from cardboard.redis_client import get_redis_client
+
+from .versions import get_hunt_version
+
+logger = logging.getLogger(__name__)
+
+# Event types streamed to clients. Events only say what changed; clients refetch
+# the data they care about (e.g. an incremental puzzle list request).
+HUNT_EVENT = "hunt"
+PUZZLES_EVENT = "puzzles"
+ANSWERS_EVENT = "answers"
+TAGS_EVENT = "tags"
+
+
+def _hunt_channel(hunt_id):
+    return f"hunt_events_{hunt_id}"
+
+
+def publish_hunt_event(hunt_id, event, **data):
+    """
+    Publishes a change event to everyone listening on the hunt's event stream
+    once the current transaction commits. Failures are logged rather than
+    raised, since clients fall back to polling anyway.
+    """
+    message = json.dumps({"event": event, "data": data})
+
+    def publish():
+        try:
+            get_redis_client().publish(_hunt_channel(hunt_id), message)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish {event} event for hunt {hunt_id}: {e}")
+
+    transaction.on_commit(publish)
+
+
+def _format_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def stream_hunt_events(hunt_id):
+    """
+    Generates server-sent events for the hunt. The stream starts with the
+    current hunt version and ends after HUNT_EVENTS_STREAM_SECONDS so that the
+    worker serving it is freed up; browsers reconnect automatically.
+    """
+    pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(_hunt_channel(hunt_id))
+    try:
+        # Subscribe before reading the version, so that nothing published after
+        # the version was read can be missed.
+        yield f"retry: {settings.HUNT_EVENTS_RETRY_MILLISECONDS}\n"
+        yield _format_event("version", {"version": get_hunt_version(hunt_id)})
+
+        # Streams are long-lived, so don't hold on to a database connection
+        # while waiting for events.
+        if not connection.in_atomic_block:
+            connection.close()
+
+        deadline = time.monotonic() + settings.HUNT_EVENTS_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=settings.HUNT_EVENTS_HEARTBEAT_SECONDS)
+            if message is None:
+                # Comment lines keep proxies from closing idle connections.
+                yield ": heartbeat\n\n"
+                continue
+            payload = json.loads(message["data"])
+            yield _format_event(payload["event"], payload["data"])
+    finally:
+        pubsub.close()
+
+
+# Streams currently served by this process. See open_hunt_event_stream.
+_open_streams = 0
+_open_streams_lock = threading.Lock()
+
+
+class _HuntEventStream:
+    """Streams hunt events, and frees up the stream's slot once closed."""
+
+    def __init__(self, hunt_id):
+        self._events = stream_hunt_events(hunt_id)
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._events)
+
+    def close(self):
+        # The response closes its content, whether or not it was iterated.
+        global _open_streams
+        self._events.close()
+        with _open_streams_lock:
+            if not self._closed:
+                self._closed = True
+                _open_streams -= 1
+
+
+def open_hunt_event_stream(hunt_id):
+    """
+    Returns a stream of the hunt's events (see stream_hunt_events), or None if
+    this process is already serving HUNT_EVENTS_MAX_STREAMS of them. Each stream
+    holds a web worker thread, so without a limit, open tabs could leave no
+    threads for other requests. Clients turned away poll instead.
+    """
+    global _open_streams
+    with _open_streams_lock:
+        if _open_streams >= settings.HUNT_EVENTS_MAX_STREAMS:
+            metrics.increment("hunt_event_streams_rejected")
+            return None
+        _open_streams += 1
+    return _HuntEventStream(hunt_id)
@@ -0,0 +1,48 @@
+import logging
+
+import redis
+
+from cardboard.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Hash of user id to the id of the hunt they last accessed, for accesses not yet
+# written to Puzzler.last_accessed_hunt (see hunts.tasks.flush_last_accessed_hunts).
+LAST_ACCESSED_HUNTS_KEY = "last_accessed_hunts"
+
+
+def set_last_accessed_hunt(user, hunt):
+    """
+    Records that the user accessed the hunt. The write to the user's row is
+    buffered and flushed in bulk, since this happens on most page loads.
+    """
+    try:
+        get_redis_client().hset(LAST_ACCESSED_HUNTS_KEY, user.pk, hunt.pk)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to buffer last accessed hunt for {user.pk}: {e}")
+        if user.last_accessed_hunt_id != hunt.pk:
+            user.last_accessed_hunt = hunt
+            user.save(update_fields=["last_accessed_hunt"])
+
+
+def get_last_accessed_hunt_id(user):
+    """Returns the id of the hunt the user last accessed, or None."""
+    try:
+        hunt_id = get_redis_client().hget(LAST_ACCESSED_HUNTS_KEY, user.pk)
+    except redis.RedisError as e:
+        logger.warning(f"Failed to read last accessed hunt for {user.pk}: {e}")
+        hunt_id = None
+    if hunt_id is None:
+        return user.last_accessed_hunt_id
+    return int(hunt_id)
+
+
+def pop_last_accessed_hunts():
+    """
+    Returns and clears all buffered accesses, as a dict of user id to hunt id.
+    """
+    with get_redis_client().pipeline() as pipe:
+        pipe.hgetall(LAST_ACCESSED_HUNTS_KEY)
+        pipe.delete(LAST_ACCESSED_HUNTS_KEY)
+        buffered, _ = pipe.execute()
+    return {int(user_id): int(hunt_id) for user_id, hunt_id in buffered.items()}
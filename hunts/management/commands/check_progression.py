@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from hunts.models import Hunt
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks the progression puzzles maintained for the stats page against "
+        "the ones found by walking the meta graph."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hunt", type=int, help="Only check the hunt with this id."
+        )
+        parser.add_argument(
+            "--fix", action="store_true", help="Correct any mismatches found."
+        )
+
+    def handle(self, *args, **options):
+        hunts = Hunt.objects.order_by("pk")
+        if options["hunt"] is not None:
+            hunts = hunts.filter(pk=options["hunt"])
+
+        for hunt in hunts:
+            missing_ids, extra_ids = hunt.check_progression(fix=options["fix"])
+            if missing_ids or extra_ids:
+                self.stdout.write(
+                    f"{hunt.name}: missing {sorted(missing_ids)}, "
+                    f"extra {sorted(extra_ids)}"
+                )
+            else:
+                self.stdout.write(f"{hunt.name}: OK")
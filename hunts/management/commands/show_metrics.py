@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from cardboard.metrics import get_metrics, reset_metrics
+from google_api_lib.quota import get_queue_depths
+
+
+class Command(BaseCommand):
+    help = "Prints the counters recorded in cardboard.metrics."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Clear all counters afterwards."
+        )
+
+    def handle(self, *args, **options):
+        metrics = get_metrics()
+        for name in sorted(metrics):
+            self.stdout.write(f"{name}: {metrics[name]:g}")
+
+        # Derive hit rates for counters recorded as <prefix>_hits/<prefix>_misses.
+        for name in sorted(metrics):
+            if name.endswith("_hits"):
+                prefix = name[: -len("_hits")]
+                total = metrics[name] + metrics.get(f"{prefix}_misses", 0)
+                if total:
+                    self.stdout.write(f"{prefix}_hit_rate: {metrics[name] / total:.1%}")
+
+        # Calls waiting for Google API quota right now, by bucket and priority.
+        for bucket, depths in get_queue_depths().items():
+            for priority, depth in sorted(depths.items()):
+                self.stdout.write(
+                    f"google_api_quota_{bucket}_queue_depth_priority_{priority}: {depth}"
+                )
+
+        if options["reset"]:
+            reset_metrics()
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 22:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hunts", "0017_alter_hunt_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PooledSheet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("template_file_id", models.CharField(max_length=128)),
+                ("file_id", models.CharField(max_length=128, unique=True)),
+                ("url", models.URLField()),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "hunt",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pooled_sheets",
+                        to="hunts.hunt",
+                    ),
+                ),
+            ],
+        ),
+    ]
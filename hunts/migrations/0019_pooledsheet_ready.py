@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hunts", "0018_pooled_sheet"),
+    ]
+
+    operations = [
+        # Sheets pooled so far were only recorded once they were set up.
+        migrations.AddField(
+            model_name="pooledsheet",
+            name="ready",
+            field=models.BooleanField(default=True),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="pooledsheet",
+            name="ready",
+            field=models.BooleanField(default=False),
+        ),
+    ]
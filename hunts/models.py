@@ -2,13 +2,39 @@ from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models import Case, Max, Q, When
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from django.template.defaultfilters import slugify
 from django.utils import timezone
 from guardian.shortcuts import get_users_with_perms
 
-from puzzles.models import Puzzle, PuzzleTag
+from puzzles.models import ProgressionPuzzle, Puzzle, PuzzleTag
+
+from .events import HUNT_EVENT, publish_hunt_event
+from .last_accessed import set_last_accessed_hunt
+from .versions import bump_hunt_version
+
+
+# Both take the output of Hunt.time_stats_helper.
+def format_solves_per_hour(time_stats_info):
+    if not time_stats_info:
+        return "N/A"
+    solved, interval_start, interval_end = time_stats_info
+
+    hours_elapsed = (interval_end - interval_start).total_seconds() / 3600
+    return "{:.2f}".format(round(solved / hours_elapsed, 2))
+
+
+def format_minutes_per_solve(time_stats_info):
+    if not time_stats_info:
+        return "N/A"
+    solved, interval_start, interval_end = time_stats_info
+
+    if solved == 0:
+        return "N/A"
+
+    minutes_elapsed = (interval_end - interval_start).total_seconds() / 60
+    return "{:.2f}".format(round(minutes_elapsed / solved, 2))
 
 
 class Hunt(models.Model):
@@ -42,13 +68,14 @@ class Hunt(models.Model):
         super().save(*args, **kwargs)
         if not hasattr(self, "settings"):
             HuntSettings.objects.create(hunt=self)
+        bump_hunt_version(self.pk)
+        publish_hunt_event(self.pk, HUNT_EVENT)
 
     @staticmethod
     def get_object_or_404(user=None, **kwargs):
         hunt = get_object_or_404(Hunt, **kwargs)
-        if user and user.is_authenticated and user.last_accessed_hunt != hunt:
-            user.last_accessed_hunt = hunt
-            user.save(update_fields=["last_accessed_hunt"])
+        if user and user.is_authenticated:
+            set_last_accessed_hunt(user, hunt)
         return hunt
 
     def get_num_solved(self):
@@ -92,24 +119,38 @@ class Hunt(models.Model):
         """
         return Hunt.objects.raw(query, [str(self.pk)])
 
+    # Compares the maintained progression membership (see ProgressionPuzzle)
+    # against get_progression_puzzles, and returns the ids of the puzzles missing
+    # from it and those wrongly in it. If fix is set, also corrects them.
+    def check_progression(self, fix=False):
+        expected_ids = {p.pk for p in self.get_progression_puzzles()}
+        actual_ids = set(
+            ProgressionPuzzle.objects.filter(puzzle__hunt=self).values_list(
+                "puzzle_id", flat=True
+            )
+        )
+        missing_ids = expected_ids - actual_ids
+        extra_ids = actual_ids - expected_ids
+        if fix:
+            ProgressionPuzzle.objects.bulk_create(
+                [ProgressionPuzzle(puzzle_id=pk) for pk in missing_ids],
+                ignore_conflicts=True,
+            )
+            ProgressionPuzzle.objects.filter(puzzle_id__in=extra_ids).delete()
+        return missing_ids, extra_ids
+
     # Returns a list of solved meta names and solve times in [name, time] pairs.
     # Pairs sorted by latest solves first.
     def get_meta_solve_list(self):
-        solved_metas = (
-            self.puzzles.filter(Q(status=Puzzle.SOLVED), Q(is_meta=True))
-            .annotate(
-                _solved_time=Max(
-                    Case(When(guesses__status="CORRECT", then="guesses__created_on"))
-                )
-            )
-            .order_by("-_solved_time")
-        )
+        solved_metas = self.puzzles.filter(
+            Q(status=Puzzle.SOLVED), Q(is_meta=True)
+        ).order_by("-solved_at")
 
-        return [[p.name, p._solved_time] for p in solved_metas]
+        return [[p.name, p.solved_at] for p in solved_metas]
 
-    # Returns ends of the time interval for the time stats (6 hrs or entire hunt)
-    # and # of solves within the interval.
-    def time_stats_helper(self, recent=False):
+    # Returns ends of the time interval for the time stats (6 hrs or entire hunt),
+    # or None if the hunt hasn't started.
+    def get_time_stats_interval(self, recent=False):
         interval_end = timezone.now()
         if self.end_time:
             interval_end = min(interval_end, self.end_time)
@@ -119,45 +160,31 @@ class Hunt(models.Model):
         interval_start = self.start_time
         if recent:
             interval_start = max(interval_start, interval_end - timedelta(hours=6))
+        return interval_start, interval_end
+
+    # Returns ends of the time interval for the time stats (6 hrs or entire hunt)
+    # and # of solves within the interval.
+    def time_stats_helper(self, recent=False):
+        interval = self.get_time_stats_interval(recent=recent)
+        if not interval:
+            return None
+        interval_start, interval_end = interval
 
         if recent:
-            solved = (
-                self.puzzles.filter(Q(status=Puzzle.SOLVED))
-                .annotate(
-                    _solved_time=Max(
-                        Case(
-                            When(guesses__status="CORRECT", then="guesses__created_on")
-                        )
-                    )
-                )
-                .filter(_solved_time__range=[interval_start, interval_end])
-                .count()
-            )
+            solved = self.puzzles.filter(
+                status=Puzzle.SOLVED,
+                solved_at__range=[interval_start, interval_end],
+            ).count()
         else:
             solved = self.get_num_solved()
 
         return solved, interval_start, interval_end
 
     def get_solves_per_hour(self, recent=False):
-        time_stats_info = self.time_stats_helper(recent=recent)
-        if not time_stats_info:
-            return "N/A"
-        solved, interval_start, interval_end = time_stats_info
-
-        hours_elapsed = (interval_end - interval_start).total_seconds() / 3600
-        return "{:.2f}".format(round(solved / hours_elapsed, 2))
+        return format_solves_per_hour(self.time_stats_helper(recent=recent))
 
     def get_minutes_per_solve(self, recent=False):
-        time_stats_info = self.time_stats_helper(recent=recent)
-        if not time_stats_info:
-            return "N/A"
-        solved, interval_start, interval_end = time_stats_info
-
-        if solved == 0:
-            return "N/A"
-
-        minutes_elapsed = (interval_end - interval_start).total_seconds() / 60
-        return "{:.2f}".format(round(minutes_elapsed / solved, 2))
+        return format_minutes_per_solve(self.time_stats_helper(recent=recent))
 
     def get_users_with_perm(self, perm):
         users_perms = get_users_with_perms(self, attach_perms=True)
@@ -264,3 +291,33 @@ class HuntSettings(models.Model):
         default=timedelta(minutes=10),
         help_text="Amount of time to look back for active users of a puzzle.",
     )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        bump_hunt_version(self.hunt_id)
+        publish_hunt_event(self.hunt_id, HUNT_EVENT)
+
+
+class PooledSheet(models.Model):
+    """
+    A copy of the hunt's sheet template, made ahead of time so that a new
+    puzzle can have its sheet right away. The copy has already been handed to
+    the template's owner and moved to the hunt's Drive folder, so claiming it
+    only takes a rename and writing the puzzle link.
+    See google_api_lib.tasks.refill_sheet_pool.
+    """
+
+    hunt = models.ForeignKey(
+        Hunt, on_delete=models.CASCADE, related_name="pooled_sheets"
+    )
+    # Copies of a template that the hunt no longer uses are never claimed.
+    template_file_id = models.CharField(max_length=128)
+    file_id = models.CharField(max_length=128, unique=True)
+    url = models.URLField()
+    # Copies are recorded as soon as they're made, so that they can be trashed
+    # if setting them up doesn't finish, and are only claimed once it has.
+    ready = models.BooleanField(default=False)
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Pooled sheet {self.file_id} for {self.hunt}"
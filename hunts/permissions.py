@@ -0,0 +1,121 @@
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from guardian.core import ObjectPermissionChecker
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from puzzles.models import Puzzle
+
+from .models import Hunt
+
+
+def _hunt_permissions_generation_key(hunt_id):
+    return f"hunt_permissions_generation_{hunt_id}"
+
+
+def _get_hunt_permissions_generation(hunt_id):
+    key = _hunt_permissions_generation_key(hunt_id)
+    generation = cache.get(key)
+    if generation is None:
+        # Seed from the clock so that a flushed generation can't come back to
+        # one that was used before.
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_hunt_permissions(hunt_id):
+    """
+    Drops everyone's cached permissions for the hunt. Permission changes through
+    assign_perm and remove_perm do this automatically, except for assignments
+    to querysets of users, which skip signals.
+    """
+
+    def invalidate():
+        try:
+            cache.incr(_hunt_permissions_generation_key(hunt_id))
+        except ValueError:
+            # Not cached yet; seeding it is as good as a bump.
+            _get_hunt_permissions_generation(hunt_id)
+
+    invalidate()
+    # Requests made before the change commits may cache the old permissions, so
+    # drop them again once it does.
+    transaction.on_commit(invalidate)
+
+
+def get_hunt_permissions(user, hunt_id):
+    """
+    Returns the set of permission codenames (e.g. "hunt_access") that the user
+    has on the hunt. Results are kept on the user object for the rest of the
+    request, and cached for HUNT_PERMISSIONS_CACHE_SECONDS, so that checking
+    permissions on every API request doesn't query the database. Changes to
+    users themselves (e.g. their groups) can take that long to apply.
+    """
+    if not user.is_authenticated or not user.is_active:
+        return frozenset()
+
+    local_cache = user.__dict__.setdefault("_hunt_permissions_cache", {})
+    if hunt_id not in local_cache:
+        key = "hunt_permissions_%d_%d_%d" % (
+            hunt_id,
+            _get_hunt_permissions_generation(hunt_id),
+            user.pk,
+        )
+        permissions = cache.get(key)
+        if permissions is None:
+            checker = ObjectPermissionChecker(user)
+            permissions = frozenset(checker.get_perms(Hunt(pk=hunt_id)))
+            cache.set(key, permissions, settings.HUNT_PERMISSIONS_CACHE_SECONDS)
+        local_cache[hunt_id] = permissions
+    return local_cache[hunt_id]
+
+
+def has_hunt_permission(user, permission, hunt_id):
+    return permission in get_hunt_permissions(user, hunt_id)
+
+
+# How long to remember which hunt a puzzle belongs to. A puzzle never moves to
+# another hunt, but its id can be reused once it's deleted (e.g. on SQLite, or
+# after a database reset), so entries are dropped on delete and don't live long.
+PUZZLE_HUNT_CACHE_TIMEOUT = 60 * 60
+
+
+def _puzzle_hunt_key(puzzle_id):
+    return f"puzzle_hunt_{puzzle_id}"
+
+
+def get_puzzle_hunt_id(puzzle_id):
+    """Returns the id of the puzzle's hunt, or None if there's no such puzzle."""
+    key = _puzzle_hunt_key(puzzle_id)
+    hunt_id = cache.get(key)
+    if hunt_id is None:
+        hunt_id = (
+            Puzzle.global_objects.filter(pk=puzzle_id)
+            .values_list("hunt_id", flat=True)
+            .first()
+        )
+        # Missing puzzles aren't cached, in case the puzzle gets created later.
+        if hunt_id is not None:
+            cache.set(key, hunt_id, PUZZLE_HUNT_CACHE_TIMEOUT)
+    return hunt_id
+
+
+@receiver(post_delete, sender=Puzzle)
+def forget_puzzle_hunt_on_delete(sender, instance, **kwargs):
+    cache.delete(_puzzle_hunt_key(instance.pk))
+
+
+@receiver(post_save, sender=UserObjectPermission)
+@receiver(post_delete, sender=UserObjectPermission)
+@receiver(post_save, sender=GroupObjectPermission)
+@receiver(post_delete, sender=GroupObjectPermission)
+def invalidate_hunt_permissions_on_change(sender, instance, **kwargs):
+    content_type = ContentType.objects.get_for_id(instance.content_type_id)
+    if content_type.model_class() is Hunt:
+        invalidate_hunt_permissions(int(instance.object_pk))
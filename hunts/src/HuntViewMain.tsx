@@ -56,7 +56,54 @@ export const HuntViewMain = (props: { huntId: HuntId }) => {
     dispatch(fetchPuzzles(props.huntId));
   };
 
-  useInterval(updatePuzzleData, 10 * 1000);
+  // While the hunt's event stream is connected, puzzles are refetched as soon as
+  // they change, so polling is only a fallback.
+  const [liveUpdates, setLiveUpdates] = React.useState(false);
+  useInterval(updatePuzzleData, (liveUpdates ? 60 : 10) * 1000);
+
+  React.useEffect(() => {
+    if (typeof EventSource === "undefined") {
+      return;
+    }
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    const scheduleUpdate = () => {
+      // Changes usually arrive in bursts, so batch them into one fetch.
+      clearTimeout(timer);
+      timer = setTimeout(updatePuzzleData, 250);
+    };
+    let events: EventSource;
+    let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+    const connect = () => {
+      const source = new EventSource(`/api/v1/hunts/${props.huntId}/events`);
+      events = source;
+      source.onopen = () => {
+        setLiveUpdates(true);
+        // Catch up on anything that changed while disconnected.
+        updatePuzzleData();
+      };
+      source.onerror = () => {
+        setLiveUpdates(false);
+        // The server turns streams away when it's busy, and EventSource then
+        // gives up, so keep polling and try again in a while.
+        if (source.readyState === EventSource.CLOSED) {
+          reconnectTimer = setTimeout(connect, 60 * 1000);
+        }
+      };
+      source.addEventListener("puzzles", scheduleUpdate);
+      source.addEventListener("answers", scheduleUpdate);
+      source.addEventListener("tags", () => {
+        dispatch(fetchHunt(props.huntId));
+        scheduleUpdate();
+      });
+      source.addEventListener("hunt", () => dispatch(fetchHunt(props.huntId)));
+    };
+    connect();
+    return () => {
+      clearTimeout(timer);
+      clearTimeout(reconnectTimer);
+      events.close();
+    };
+  }, [props.huntId]);
 
   const ModalComponent = MODAL_COMPONENTS[modal.type];
   React.useEffect(() => {
@@ -1,6 +1,13 @@
 import Cookies from "js-cookie";
 
-import { AnswerId, HuntId, PuzzleId, TagId } from "./types";
+import {
+  AnswerId,
+  CompactPuzzleDelta,
+  HuntId,
+  PuzzleDelta,
+  PuzzleId,
+  TagId,
+} from "./types";
 
 const API_PREFIX = "/api/v1";
 
@@ -24,9 +31,27 @@ function handleErrors(response: Response) {
   return response.json();
 }
 
-function getPuzzles(huntId: HuntId) {
-  const puzzlesApiUrl = `${API_PREFIX}/hunts/${huntId}/puzzles`;
-  return fetch(puzzlesApiUrl).then(handleErrors);
+// Pass the cursor from the previous response to only get puzzles that changed
+// since then. A null cursor returns all puzzles along with an initial cursor.
+function getPuzzles(huntId: HuntId, cursor: string | null) {
+  const since = encodeURIComponent(cursor ?? "");
+  const puzzlesApiUrl = `${API_PREFIX}/hunts/${huntId}/puzzles?since=${since}`;
+  // The compact format sends each tag once rather than once per puzzle.
+  return fetch(puzzlesApiUrl, {
+    headers: { Accept: "application/vnd.cardboard.compact+json" },
+  })
+    .then(handleErrors)
+    .then((delta: CompactPuzzleDelta): PuzzleDelta => {
+      const tags = new Map(delta.tags.map((tag) => [tag.id, tag]));
+      return {
+        cursor: delta.cursor,
+        puzzles: delta.puzzles.map((puzzle) => ({
+          ...puzzle,
+          tags: puzzle.tags.map((tagId) => tags.get(tagId)!),
+        })),
+        deleted: delta.deleted,
+      };
+    });
 }
 
 function addPuzzle(
@@ -7,7 +7,14 @@ import {
 import api from "./api";
 
 import { RootState } from "./store";
-import { AnswerId, HuntId, Puzzle, PuzzleId, TagId } from "./types";
+import {
+  AnswerId,
+  HuntId,
+  Puzzle,
+  PuzzleDelta,
+  PuzzleId,
+  TagId,
+} from "./types";
 
 export const addPuzzle = createAsyncThunk(
   "puzzles/addPuzzle",
@@ -46,15 +53,15 @@ export const deletePuzzle = createAsyncThunk(
 );
 
 export const fetchPuzzles = createAsyncThunk<
-  { timestamp: number; result: Puzzle[] },
+  { timestamp: number; cursor: string | null; result: PuzzleDelta },
   HuntId,
   { state: RootState }
 >(
   "puzzles/fetchPuzzles",
   async (huntId: HuntId, { getState }: { getState: () => RootState }) => {
-    const { timestamp } = getState().puzzles;
-    const response = await api.getPuzzles(huntId);
-    return { timestamp, result: response };
+    const { timestamp, cursor } = getState().puzzles;
+    const response = await api.getPuzzles(huntId, cursor);
+    return { timestamp, cursor, result: response };
   }
 );
 
@@ -202,6 +209,7 @@ export const puzzlesSlice = createSlice({
   name: "puzzles",
   initialState: puzzlesAdapter.getInitialState({
     timestamp: 0, // A logical timestamp for detecting stale fetchPuzzle actions
+    cursor: null as string | null, // Server cursor for incremental fetches
   }),
   reducers: {},
   extraReducers: (builder) => {
@@ -215,11 +223,19 @@ export const puzzlesSlice = createSlice({
         ++state.timestamp;
       })
       .addCase(fetchPuzzles.fulfilled, (state, action) => {
-        const { timestamp, result } = action.payload;
-        if (timestamp == state.timestamp) {
+        const { timestamp, cursor, result } = action.payload;
+        if (timestamp == state.timestamp && cursor == state.cursor) {
           // Only apply the update if no other action has completed
-          // in between dispatching the fetch and it completing
-          puzzlesAdapter.setAll(state, result);
+          // in between dispatching the fetch and it completing.
+          // Otherwise the cursor is left alone, so the next fetch
+          // picks up these changes again.
+          if (cursor === null) {
+            puzzlesAdapter.setAll(state, result.puzzles);
+          } else {
+            puzzlesAdapter.upsertMany(state, result.puzzles);
+            puzzlesAdapter.removeMany(state, result.deleted);
+          }
+          state.cursor = result.cursor;
         }
         ++state.timestamp;
       })
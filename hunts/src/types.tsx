@@ -47,6 +47,21 @@ export interface Puzzle {
   last_edited_on: string | null;
 }
 
+// Response of an incremental puzzle list request
+export interface PuzzleDelta {
+  cursor: string;
+  puzzles: Puzzle[];
+  deleted: PuzzleId[];
+}
+
+// The same in the compact format, where puzzles refer to tags by id
+export interface CompactPuzzleDelta {
+  cursor: string;
+  puzzles: (Omit<Puzzle, "tags"> & { tags: TagId[] })[];
+  tags: PuzzleTag[];
+  deleted: PuzzleId[];
+}
+
 // All the answers that are currently assigned to a given puzzle.
 // If an answer is deleted, it won't be in this list.
 // Should maybe be called 'answers' instead of 'guesses'?
@@ -0,0 +1,119 @@
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+
+from cardboard import metrics
+from puzzles.models import Puzzle, PuzzleTag
+
+from .chart_utils import build_chart_data, can_use_chart
+from .models import format_minutes_per_solve, format_solves_per_hour
+from .versions import get_hunt_version
+
+# Stats are cached per hunt version, so they're recomputed whenever a puzzle is
+# unlocked or solved. Some of them (e.g. solves per hour) also change with time,
+# so entries expire after this long regardless.
+HUNT_STATS_CACHE_SECONDS = 60
+
+
+def _has_tag(name):
+    return Exists(PuzzleTag.objects.filter(puzzles=OuterRef("pk"), name=name))
+
+
+def compute_hunt_stats(hunt):
+    """
+    Returns a dict of the stats shown on the hunt's stats page. Counts come from a
+    single aggregate query, and everything else from one query listing puzzles.
+    """
+    puzzles = hunt.puzzles.annotate(
+        _is_backsolved=_has_tag(PuzzleTag.BACKSOLVED),
+        _is_freebie=_has_tag(PuzzleTag.FREEBIE),
+    )
+
+    solved = Q(status=Puzzle.SOLVED)
+    counts = {
+        "num_unlocked": Count("pk"),
+        "num_solved": Count("pk", filter=solved),
+        "num_backsolved": Count("pk", filter=solved & Q(_is_backsolved=True)),
+        "num_freebie": Count("pk", filter=solved & Q(_is_freebie=True)),
+        "num_metas_solved": Count("pk", filter=solved & Q(is_meta=True)),
+        "num_metas_unsolved": Count("pk", filter=~solved & Q(is_meta=True)),
+        "num_progression": Count("pk", filter=Q(progression__isnull=False)),
+    }
+    recent_interval = hunt.get_time_stats_interval(recent=True)
+    if recent_interval:
+        counts["num_solved_recently"] = Count(
+            "pk", filter=solved & Q(solved_at__range=recent_interval)
+        )
+    counts = puzzles.aggregate(**counts)
+
+    num_solved = counts["num_solved"]
+    interval = hunt.get_time_stats_interval()
+    time_stats_info = (num_solved, *interval) if interval else None
+    recent_time_stats_info = None
+    if recent_interval:
+        recent_time_stats_info = (counts["num_solved_recently"], *recent_interval)
+
+    rows = list(
+        puzzles.order_by("created_on", "pk").values_list(
+            "name", "created_on", "is_meta", "status", "solved_at"
+        )
+    )
+    solves = sorted(
+        (
+            (name, solved_time, is_meta)
+            for name, _, is_meta, status, solved_time in rows
+            if status == Puzzle.SOLVED and solved_time
+        ),
+        key=lambda solve: solve[1],
+    )
+
+    chart_solve_data = None
+    chart_unlock_data = None
+    if can_use_chart(hunt, num_unlocked=counts["num_unlocked"]):
+        # if start_time not given, use first puzzle creation time
+        chart_start_time = hunt.start_time or rows[0][1]
+        chart_solve_data = build_chart_data(hunt, solves, chart_start_time)
+        chart_unlock_data = build_chart_data(
+            hunt,
+            [(name, created_on, is_meta) for name, created_on, is_meta, *_ in rows],
+            chart_start_time,
+            unlocks=True,
+        )
+
+    return {
+        "num_solved": num_solved,
+        "num_forward_solved": num_solved
+        - counts["num_backsolved"]
+        - counts["num_freebie"],
+        "num_backsolved": counts["num_backsolved"],
+        "num_freebie": counts["num_freebie"],
+        "num_unsolved": counts["num_unlocked"] - num_solved,
+        "num_unlocked": counts["num_unlocked"],
+        "num_metas_solved": counts["num_metas_solved"],
+        "num_metas_unsolved": counts["num_metas_unsolved"],
+        "solves_per_hour": format_solves_per_hour(time_stats_info),
+        "minutes_per_solve": format_minutes_per_solve(time_stats_info),
+        "solves_per_hour_recent": format_solves_per_hour(recent_time_stats_info),
+        "minutes_per_solve_recent": format_minutes_per_solve(recent_time_stats_info),
+        "meta_names_and_times": [
+            [name, solved_time]
+            for name, solved_time, is_meta in reversed(solves)
+            if is_meta
+        ],
+        "progression": counts["num_progression"],
+        "chart_solve_data": chart_solve_data,
+        "chart_unlock_data": chart_unlock_data,
+    }
+
+
+def get_hunt_stats(hunt):
+    """Returns compute_hunt_stats(hunt), cached until the hunt changes."""
+    # The version has to be read before the data it describes.
+    key = f"hunt_stats_{hunt.pk}_{get_hunt_version(hunt.pk)}"
+    stats = cache.get(key)
+    if stats is None:
+        metrics.increment("hunt_stats_cache_misses")
+        stats = compute_hunt_stats(hunt)
+        cache.set(key, stats, HUNT_STATS_CACHE_SECONDS)
+    else:
+        metrics.increment("hunt_stats_cache_hits")
+    return stats
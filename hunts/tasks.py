@@ -0,0 +1,36 @@
+import logging
+from collections import defaultdict
+
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from cardboard.settings import TaskPriority
+
+from .last_accessed import pop_last_accessed_hunts
+from .models import Hunt
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(priority=TaskPriority.LOW.value)
+def flush_last_accessed_hunts():
+    """
+    Writes buffered last accessed hunts (see set_last_accessed_hunt) to users'
+    rows, with one UPDATE per hunt. Runs periodically from celery beat.
+    """
+    user_ids_by_hunt = defaultdict(list)
+    for user_id, hunt_id in pop_last_accessed_hunts().items():
+        user_ids_by_hunt[hunt_id].append(user_id)
+
+    # Skip hunts deleted since they were accessed.
+    hunt_ids = Hunt.objects.filter(pk__in=user_ids_by_hunt).values_list("pk", flat=True)
+    num_updated = 0
+    for hunt_id in hunt_ids:
+        num_updated += (
+            get_user_model()
+            .objects.filter(pk__in=user_ids_by_hunt[hunt_id])
+            .exclude(last_accessed_hunt_id=hunt_id)
+            .update(last_accessed_hunt_id=hunt_id)
+        )
+    if num_updated:
+        logger.info(f"Updated last accessed hunt for {num_updated} users")
@@ -5,12 +5,15 @@ from django.utils import timezone
 
 from accounts.models import Puzzler
 from answers.models import Answer
-from puzzles.models import Puzzle
+from puzzles.models import ProgressionPuzzle, Puzzle
 from puzzles.puzzle_tag import PuzzleTag
 
 from .chart_utils import can_use_chart, get_chart_data
 from .forms import HuntForm
+from .last_accessed import get_last_accessed_hunt_id
 from .models import Hunt
+from .stats import compute_hunt_stats, get_hunt_stats
+from .tasks import flush_last_accessed_hunts
 
 
 class TestHunt(TestCase):
@@ -89,6 +92,83 @@ class TestHunt(TestCase):
 
         self.assertEqual(len(list(hunt.get_progression_puzzles())), 3)
 
+        stats = compute_hunt_stats(hunt)
+        self.assertEqual(stats["num_solved"], 2)
+        self.assertEqual(stats["num_forward_solved"], 2)
+        self.assertEqual(stats["num_unsolved"], 3)
+        self.assertEqual(stats["num_unlocked"], 5)
+        self.assertEqual(stats["num_metas_solved"], 1)
+        self.assertEqual(stats["num_metas_unsolved"], 0)
+        self.assertEqual(stats["progression"], 3)
+        self.assertEqual(hunt.check_progression(), (set(), set()))
+        self.assertEqual(stats["meta_names_and_times"], hunt.get_meta_solve_list())
+        # Charts end at the current time, which differs between the two.
+        for chart, expected in [
+            (stats["chart_solve_data"], get_chart_data(hunt)),
+            (stats["chart_unlock_data"], get_chart_data(hunt, unlocks=True)),
+        ]:
+            labels, times, *rest = chart
+            expected_labels, expected_times, *expected_rest = expected
+            self.assertEqual(labels, expected_labels)
+            self.assertEqual(times[:-1], expected_times[:-1])
+            self.assertEqual(rest, expected_rest)
+
+    def test_stats_cache(self):
+        start_time = timezone.now() - timedelta(hours=1)
+        hunt = self.create_hunt("test_hunt", start=start_time)
+        puzzle = self.create_puzzle("puzzle", hunt)
+        self.assertEqual(get_hunt_stats(hunt)["num_solved"], 0)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_hunt_stats(hunt)["num_solved"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Answer.objects.create(text="guess", puzzle=puzzle).set_status(
+                Answer.CORRECT
+            )
+        stats = get_hunt_stats(hunt)
+        self.assertEqual(stats["num_solved"], 1)
+        self.assertEqual(stats["solves_per_hour"], hunt.get_solves_per_hour())
+        self.assertEqual(
+            stats["minutes_per_solve_recent"],
+            hunt.get_minutes_per_solve(recent=True),
+        )
+
+    def test_progression(self):
+        hunt = self.create_hunt("test_hunt")
+        metameta = self.create_puzzle("metameta", hunt, True)
+        meta = self.create_puzzle("meta", hunt, True)
+        feeder = self.create_puzzle("feeder", hunt, False)
+        other = self.create_puzzle("other", hunt, False)
+        meta.metas.add(metameta)
+        feeder.metas.add(meta)
+
+        def progression():
+            self.assertEqual(hunt.check_progression(), (set(), set()))
+            return compute_hunt_stats(hunt)["progression"]
+
+        self.assertEqual(progression(), 0)
+        guess = Answer.objects.create(text="answer", puzzle=metameta)
+        guess.set_status(Answer.CORRECT)
+        self.assertEqual(progression(), 3)
+
+        other.metas.add(meta)
+        self.assertEqual(progression(), 4)
+        feeder.metas.remove(meta)
+        other.metas.remove(meta)
+        self.assertEqual(progression(), 2)
+        feeder.metas.add(meta)
+        self.assertEqual(progression(), 3)
+
+        guess.set_status(Answer.INCORRECT)
+        self.assertEqual(progression(), 0)
+
+        # Mismatches are found, and fixed if asked to.
+        feeder.set_answer("answer")
+        ProgressionPuzzle.objects.filter(puzzle=feeder).delete()
+        ProgressionPuzzle.objects.create(puzzle=other)
+        self.assertEqual(hunt.check_progression(fix=True), ({feeder.pk}, {other.pk}))
+        self.assertEqual(progression(), 1)
+
     def test_meta_list(self):
         hunt = self.create_hunt("test_hunt")
 
@@ -220,6 +300,31 @@ class TestHunt(TestCase):
             times, [hunt_past.start_time.isoformat(), hunt_past.end_time.isoformat()]
         )
 
+    def test_last_accessed_hunt(self):
+        flush_last_accessed_hunts()
+        hunt1 = self.create_hunt("hunt1")
+        hunt2 = self.create_hunt("hunt2")
+
+        with self.assertNumQueries(1):
+            Hunt.get_object_or_404(user=self._user, pk=hunt1.pk)
+        self.assertEqual(get_last_accessed_hunt_id(self._user), hunt1.pk)
+        self.assertRedirects(
+            self.client.get("/"), "/hunts/hunt1/", fetch_redirect_response=False
+        )
+
+        Hunt.get_object_or_404(user=self._user, pk=hunt2.pk)
+        self._user.refresh_from_db()
+        self.assertIsNone(self._user.last_accessed_hunt_id)
+        self.assertEqual(get_last_accessed_hunt_id(self._user), hunt2.pk)
+
+        flush_last_accessed_hunts()
+        self._user.refresh_from_db()
+        self.assertEqual(self._user.last_accessed_hunt_id, hunt2.pk)
+        self.assertEqual(get_last_accessed_hunt_id(self._user), hunt2.pk)
+        self.assertRedirects(
+            self.client.get("/"), "/hunts/hunt2/", fetch_redirect_response=False
+        )
+
 
 class HuntFormTests(TestCase):
     def setUp(self):
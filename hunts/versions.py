@@ -0,0 +1,38 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _hunt_version_key(hunt_id):
+    return f"hunt_version_{hunt_id}"
+
+
+def get_hunt_version(hunt_id):
+    """
+    Returns a counter that increases whenever data served for the hunt (its
+    settings, tags, or puzzles) changes. Only hits the cache, never the database.
+    """
+    key = _hunt_version_key(hunt_id)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so versions keep increasing if the cache is flushed.
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_hunt_version(hunt_id):
+    """
+    Bumps the hunt's version once the current transaction commits, so that
+    nobody can read the new version together with the old data.
+    """
+
+    def bump():
+        try:
+            cache.incr(_hunt_version_key(hunt_id))
+        except ValueError:
+            # Not cached yet; seeding it is as good as a bump.
+            get_hunt_version(hunt_id)
+
+    transaction.on_commit(bump)
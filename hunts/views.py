@@ -18,9 +18,10 @@ from guardian.shortcuts import assign_perm, get_objects_for_user
 from google_api_lib.tasks import sync_drive_permissions_for_hunt
 from puzzles.models import PuzzleTag
 
-from .chart_utils import get_chart_data
 from .forms import HuntForm, HuntSettingsForm
+from .last_accessed import get_last_accessed_hunt_id
 from .models import Hunt
+from .stats import get_hunt_stats
 
 logger = logging.getLogger(__name__)
 
@@ -100,42 +101,10 @@ def edit(request, hunt_slug):
 def stats(request, hunt_slug):
     hunt = Hunt.get_object_or_404(user=request.user, slug=hunt_slug)
 
-    num_solved = hunt.get_num_solved()
-    num_backsolved = hunt.get_num_backsolved()
-    num_freebie = hunt.get_num_freebie()
-    num_unsolved = hunt.get_num_unsolved()
-    num_unlocked = hunt.get_num_unlocked()
-    num_metas_solved = hunt.get_num_metas_solved()
-    num_metas_unsolved = hunt.get_num_metas_unsolved()
-    solves_per_hour = hunt.get_solves_per_hour()
-    minutes_per_solve = hunt.get_minutes_per_solve()
-    solves_per_hour_recent = hunt.get_solves_per_hour(recent=True)
-    minutes_per_solve_recent = hunt.get_minutes_per_solve(recent=True)
-    meta_names_and_times = hunt.get_meta_solve_list()
-    progression = len(list(hunt.get_progression_puzzles()))
-
-    chart_solve_data = get_chart_data(hunt, unlocks=False)
-    chart_unlock_data = get_chart_data(hunt, unlocks=True)
-
     context = {
-        "num_solved": num_solved,
-        "num_forward_solved": num_solved - num_backsolved - num_freebie,
-        "num_backsolved": num_backsolved,
-        "num_freebie": num_freebie,
-        "num_unsolved": num_unsolved,
-        "num_unlocked": num_unlocked,
-        "num_metas_solved": num_metas_solved,
-        "num_metas_unsolved": num_metas_unsolved,
-        "solves_per_hour": solves_per_hour,
-        "minutes_per_solve": minutes_per_solve,
-        "solves_per_hour_recent": solves_per_hour_recent,
-        "minutes_per_solve_recent": minutes_per_solve_recent,
-        "meta_names_and_times": meta_names_and_times,
-        "progression": progression,
+        **get_hunt_stats(hunt),
         "hunt_name": hunt.name,
         "hunt_slug": hunt.slug,
-        "chart_solve_data": chart_solve_data,
-        "chart_unlock_data": chart_unlock_data,
     }
 
     return render(request, "stats.html", context=context)
@@ -190,7 +159,8 @@ class LastAccessedHuntRedirectView(LoginRequiredMixin, RedirectView):
     pattern_name = "hunts:all_puzzles_react"
 
     def get_redirect_url(self, *args, **kwargs):
-        hunt = self.request.user.last_accessed_hunt
+        hunt_id = get_last_accessed_hunt_id(self.request.user)
+        hunt = Hunt.objects.filter(pk=hunt_id).first() if hunt_id else None
         if not hunt or not hunt.active:
             return reverse("hunts:index")
         kwargs["hunt_slug"] = hunt.slug
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:37
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_solved_at(apps, schema_editor):
+    Puzzle = apps.get_model("puzzles", "Puzzle")
+    Answer = apps.get_model("answers", "Answer")
+    Puzzle.objects.filter(status="SOLVED").update(
+        solved_at=Subquery(
+            Answer.objects.filter(puzzle=OuterRef("pk"), status="CORRECT")
+            .order_by("-created_on")
+            .values("created_on")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("answers", "0010_answer_queue_indexes"),
+        ("puzzles", "0035_puzzles_soft_delete"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="puzzle",
+            name="solved_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="puzzle",
+            index=models.Index(
+                fields=["hunt", "solved_at"], name="puzzle_solved_at_idx"
+            ),
+        ),
+        migrations.RunPython(
+            backfill_solved_at,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
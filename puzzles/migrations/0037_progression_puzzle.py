@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Same walk as Hunt.get_progression_puzzles, for every hunt at once.
+BACKFILL_PROGRESSION = """
+WITH RECURSIVE progression_puzzles (id) AS (
+    SELECT id
+    FROM puzzles_puzzle
+    WHERE status = 'SOLVED'
+    UNION
+    SELECT Metas.from_puzzle_id
+    FROM puzzles_puzzle_metas Metas
+    INNER JOIN progression_puzzles ON progression_puzzles.id = Metas.to_puzzle_id
+)
+INSERT INTO puzzles_progressionpuzzle (puzzle_id)
+SELECT id FROM progression_puzzles
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("puzzles", "0036_puzzle_solved_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProgressionPuzzle",
+            fields=[
+                (
+                    "puzzle",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="progression",
+                        serialize=False,
+                        to="puzzles.puzzle",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunSQL(BACKFILL_PROGRESSION, reverse_sql=migrations.RunSQL.noop),
+    ]
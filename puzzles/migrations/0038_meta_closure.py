@@ -0,0 +1,66 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_META_CLOSURE = """
+WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+    SELECT to_puzzle_id, from_puzzle_id, 1
+    FROM puzzles_puzzle_metas
+    UNION
+    SELECT Metas.to_puzzle_id, paths.descendant_id, paths.depth + 1
+    FROM puzzles_puzzle_metas Metas
+    INNER JOIN paths ON paths.ancestor_id = Metas.from_puzzle_id
+)
+INSERT INTO puzzles_metaclosure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM paths
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("puzzles", "0037_progression_puzzle"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MetaClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="puzzles.puzzle",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="puzzles.puzzle",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="metaclosure",
+            constraint=models.UniqueConstraint(
+                fields=("descendant", "ancestor", "depth"),
+                name="unique_meta_closure_path",
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_META_CLOSURE, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1,9 +1,14 @@
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.db.models import Q
+from django.db import connection, models
+from django.db.models import Exists, Max, OuterRef, Q
+from django.utils import timezone
 from django_softdelete.models import SoftDeleteModel
 
 from answers.models import Answer
+from hunts.events import PUZZLES_EVENT, publish_hunt_event
+from hunts.versions import bump_hunt_version
 
 from .puzzle_tag import PuzzleTag
 
@@ -58,6 +63,10 @@ class Puzzle(SoftDeleteModel):
     # TODO: remove this
     answer = models.CharField(max_length=128, blank=True)
 
+    # When the latest correct answer was submitted if the puzzle is solved, or null
+    # otherwise. Denormalized for stats; see update_solved_at.
+    solved_at = models.DateTimeField(null=True, blank=True)
+
     tags = models.ManyToManyField(PuzzleTag, related_name="puzzles", blank=True)
 
     metas = models.ManyToManyField(
@@ -87,6 +96,9 @@ class Puzzle(SoftDeleteModel):
                 fields=["name", "hunt"], name="unique_names_per_hunt"
             ),
         ]
+        indexes = [
+            models.Index(fields=["hunt", "solved_at"], name="puzzle_solved_at_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -140,11 +152,17 @@ class Puzzle(SoftDeleteModel):
     def set_answer(self, answer):
         self.answer = answer
         self.status = Puzzle.SOLVED
+        self.update_solved_at()
         self.save()
 
     def clear_answer(self, guess):
         # puzzle already solved by different guess, so this current guess does not affect state
         if self.status == Puzzle.SOLVED and self.answer != guess:
+            # It may have been the latest correct answer though.
+            old_solved_at = self.solved_at
+            self.update_solved_at()
+            if self.solved_at != old_solved_at:
+                self.save()
             return
 
         self.answer = ""
@@ -153,17 +171,28 @@ class Puzzle(SoftDeleteModel):
         else:
             self.status = Puzzle.SOLVING
 
+        self.update_solved_at()
         self.save()
 
+    def update_solved_at(self):
+        """
+        Sets solved_at from the puzzle's status and correct answers. Call this
+        before saving whenever either of them changes.
+        """
+        if self.status == Puzzle.SOLVED:
+            self.solved_at = self.guesses.filter(status=Answer.CORRECT).aggregate(
+                solved_at=Max("created_on")
+            )["solved_at"]
+        else:
+            self.solved_at = None
+
     def is_solved(self):
         return self.status == Puzzle.SOLVED
 
     def solved_time(self):
         if not self.is_solved():
             return None
-        return (
-            self.guesses.filter(status=Answer.CORRECT).latest("created_on").created_on
-        )
+        return self.solved_at
 
     def has_assigned_meta(self):
         return len(self.metas.all()) > 0
@@ -216,17 +245,176 @@ class DeletedPuzzle(Puzzle):
         proxy = True
 
 
+# Paths through the meta graph: one row for each length of path by which
+# `descendant` feeds into `ancestor` (depth 1 for its metas, 2 for their metas,
+# and so on). Kept up to date by update_meta_closure.
+class MetaClosure(models.Model):
+    # Hidden relations, so soft deleting a puzzle leaves its paths alone.
+    ancestor = models.ForeignKey(Puzzle, on_delete=models.CASCADE, related_name="+")
+    descendant = models.ForeignKey(Puzzle, on_delete=models.CASCADE, related_name="+")
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["descendant", "ancestor", "depth"],
+                name="unique_meta_closure_path",
+            ),
+        ]
+
+
+def get_descendant_ids(puzzle_ids):
+    """Returns the ids of the puzzles feeding into any of the given ones."""
+    return set(
+        MetaClosure.objects.filter(ancestor_id__in=puzzle_ids).values_list(
+            "descendant_id", flat=True
+        )
+    )
+
+
+def update_meta_closure(puzzle_ids):
+    """
+    Recomputes the paths up from the given puzzles and everything feeding into
+    them. Call this after changing the metas of the given puzzles.
+    """
+    puzzle_ids = set(puzzle_ids)
+    if not puzzle_ids:
+        return
+    puzzle_ids |= get_descendant_ids(puzzle_ids)
+    MetaClosure.objects.filter(descendant_id__in=puzzle_ids).delete()
+    # One placeholder per id rather than Postgres' ANY, so this runs on SQLite
+    # too.
+    placeholders = ", ".join(["%s"] * len(puzzle_ids))
+    query = f"""
+    WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+        SELECT to_puzzle_id, from_puzzle_id, 1
+        FROM puzzles_puzzle_metas
+        WHERE from_puzzle_id IN ({placeholders})
+        UNION
+        SELECT Metas.to_puzzle_id, paths.descendant_id, paths.depth + 1
+        FROM puzzles_puzzle_metas Metas
+        INNER JOIN paths ON paths.ancestor_id = Metas.from_puzzle_id
+    )
+    INSERT INTO puzzles_metaclosure (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, descendant_id, depth FROM paths
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(query, list(puzzle_ids))
+
+
 # Used for cycle detection before adding an edge from potential ancestor to child.
 # We cannot have cycles, otherwise the sorting will break.
 def is_ancestor(potential_ancestor, child):
     if child.pk == potential_ancestor.pk:
         return True
-    if not child.has_assigned_meta():
-        False
-    for parent in child.metas.all():
-        if is_ancestor(potential_ancestor, parent):
-            return True
-    return False
+    return MetaClosure.objects.filter(
+        ancestor=potential_ancestor, descendant=child
+    ).exists()
+
+
+# Bumps updated_on for puzzles whose serialized form changed because of a related
+# row (answers, tags, metas, chat rooms, activity) rather than the puzzle itself.
+# Incremental puzzle list requests rely on updated_on to find changed puzzles.
+def touch_puzzles(puzzle_ids):
+    puzzles = Puzzle.global_objects.filter(pk__in=puzzle_ids)
+    puzzle_ids_by_hunt = defaultdict(list)
+    for pk, hunt_id in puzzles.values_list("pk", "hunt_id"):
+        puzzle_ids_by_hunt[hunt_id].append(pk)
+    for hunt_id, ids in puzzle_ids_by_hunt.items():
+        bump_hunt_version(hunt_id)
+        publish_hunt_event(hunt_id, PUZZLES_EVENT, ids=ids)
+    puzzles.update(updated_on=timezone.now())
+
+
+def _meta_tags(hunt_id, meta_ids):
+    return PuzzleTag.objects.filter(
+        hunt_id=hunt_id,
+        is_meta=True,
+        name__in=Puzzle.global_objects.filter(pk__in=meta_ids).values("name"),
+    )
+
+
+# Tags every one of the feeders with the tags of every one of the metas. Like the
+# other bulk m2m writes here, this doesn't send m2m_changed for tags.
+def add_meta_tags(hunt_id, feeder_ids, meta_ids):
+    tag_ids = list(_meta_tags(hunt_id, meta_ids).values_list("pk", flat=True))
+    Puzzle.tags.through.objects.bulk_create(
+        [
+            Puzzle.tags.through(puzzle_id=puzzle_id, puzzletag_id=tag_id)
+            for puzzle_id in feeder_ids
+            for tag_id in tag_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def remove_meta_tags(hunt_id, feeder_ids, meta_ids):
+    Puzzle.tags.through.objects.filter(
+        puzzle_id__in=feeder_ids, puzzletag__in=_meta_tags(hunt_id, meta_ids)
+    ).delete()
+
+
+# Puzzles that count towards the hunt's progression: solved puzzles, and puzzles
+# feeding into solved metas. Kept up to date by update_progression so the stats
+# page doesn't have to walk the meta graph like Hunt.get_progression_puzzles
+# (see Hunt.check_progression). Deleted puzzles keep their membership.
+class ProgressionPuzzle(models.Model):
+    puzzle = models.OneToOneField(
+        Puzzle,
+        # Kept when puzzles are soft deleted; see delete_progression_post_delete
+        # for hard deletes.
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name="progression",
+    )
+
+
+def update_progression(puzzle_ids):
+    """
+    Recomputes progression membership for the given puzzles and everything
+    feeding into them. Call this after changing a puzzle's status between SOLVED
+    and anything else, or after update_meta_closure.
+    """
+    puzzle_ids = set(puzzle_ids)
+    if not puzzle_ids:
+        return
+    rows = (
+        Puzzle.global_objects.filter(
+            Q(pk__in=puzzle_ids)
+            | Q(
+                pk__in=MetaClosure.objects.filter(ancestor_id__in=puzzle_ids).values(
+                    "descendant_id"
+                )
+            )
+        )
+        .annotate(
+            _in_progression=Exists(
+                ProgressionPuzzle.objects.filter(puzzle=OuterRef("pk"))
+            ),
+            _feeds_solved_meta=Exists(
+                MetaClosure.objects.filter(
+                    descendant=OuterRef("pk"), ancestor__status=Puzzle.SOLVED
+                )
+            ),
+        )
+        .values_list("pk", "status", "_in_progression", "_feeds_solved_meta")
+    )
+    added_ids = set()
+    removed_ids = set()
+    for pk, status, in_progression, feeds_solved_meta in rows:
+        should_be_in_progression = status == Puzzle.SOLVED or feeds_solved_meta
+        if should_be_in_progression and not in_progression:
+            added_ids.add(pk)
+        elif in_progression and not should_be_in_progression:
+            removed_ids.add(pk)
+
+    if added_ids:
+        ProgressionPuzzle.objects.bulk_create(
+            [ProgressionPuzzle(puzzle_id=pk) for pk in added_ids],
+            ignore_conflicts=True,
+        )
+    if removed_ids:
+        ProgressionPuzzle.objects.filter(puzzle_id__in=removed_ids).delete()
 
 
 class PuzzleActivity(SoftDeleteModel):
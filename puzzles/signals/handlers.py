@@ -1,16 +1,53 @@
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
+from django.utils import timezone
 from django_softdelete.signals import post_restore, post_soft_delete
 
 import chat.tasks
 import google_api_lib.tasks
-from puzzles.models import DeletedPuzzle, Puzzle
+from answers.models import Answer
+from chat.models import ChatRoom
+from hunts.events import ANSWERS_EVENT, PUZZLES_EVENT, TAGS_EVENT, publish_hunt_event
+from hunts.versions import bump_hunt_version
+from puzzles.models import (
+    DeletedPuzzle,
+    ProgressionPuzzle,
+    Puzzle,
+    add_meta_tags,
+    remove_meta_tags,
+    touch_puzzles,
+    update_meta_closure,
+    update_progression,
+)
 from puzzles.puzzle_tag import META_COLOR, PuzzleTag
 
 from ..models import Puzzle
 
+# Puzzle fields as of when the instance was loaded or last saved, so that hooks
+# can tell what a save changed without querying for the old row.
+SAVED_STATE_FIELDS = ["name", "url", "is_meta", "status"]
+
+# Puzzle fields that the answer queue shows alongside each answer.
+ANSWER_QUEUE_FIELDS = ["name", "url", "is_meta"]
+
+
+@receiver(post_init, sender=Puzzle)
+def remember_saved_state_post_init(sender, instance, **kwargs):
+    # Deferred fields aren't loaded, and loading them here would cost a query.
+    instance._saved_state = {
+        field: instance.__dict__.get(field) for field in SAVED_STATE_FIELDS
+    }
+
+
 # Hooks for syncing metas and tags
 
 
@@ -19,47 +56,62 @@ def update_tags_pre_save(sender, instance, **kwargs):
     if instance.is_deleted:
         return
 
+    saved = {} if instance._state.adding else instance._saved_state
     if instance.is_meta:
-        puzzles_needing_new_tag = []
-        if instance.pk is not None:
-            old_instance = Puzzle.global_objects.get(pk=instance.pk)
-            if not old_instance.is_meta:
-                puzzles_needing_new_tag = [instance]
-            elif old_instance.name != instance.name:
-                instance.tags.filter(name=old_instance.name).delete()
-                puzzles_needing_new_tag = [instance] + list(instance.feeders.all())
+        # Feeders need the new tag too if the meta was renamed
+        feeder_ids = []
+        if saved.get("is_meta"):
+            if saved["name"] == instance.name:
+                return
+            PuzzleTag.objects.filter(
+                name=saved["name"], hunt_id=instance.hunt_id, is_meta=True
+            ).delete()
+            feeder_ids = list(instance.feeders.values_list("pk", flat=True))
 
         (new_tag, _) = PuzzleTag.objects.update_or_create(
             name=instance.name,
             defaults={"color": META_COLOR, "is_meta": True},
             hunt=instance.hunt,
         )
+        instance._new_meta_tag = new_tag
+        instance._new_meta_tag_feeder_ids = feeder_ids
 
-        for p in puzzles_needing_new_tag:
-            p.tags.add(new_tag)
-
-    else:
-        PuzzleTag.objects.filter(name=instance.name, hunt=instance.hunt).filter(
-            is_meta=True
+    elif saved.get("is_meta"):
+        PuzzleTag.objects.filter(
+            name=saved["name"], hunt_id=instance.hunt_id, is_meta=True
         ).delete()
 
 
 @receiver(post_save, sender=Puzzle)
 def update_tags_post_save(sender, instance, created, **kwargs):
+    new_tag = instance.__dict__.pop("_new_meta_tag", None)
+    if new_tag is None:
+        return
+
+    # Through the related manager for the meta itself, which also drops any tags
+    # prefetched on the instance.
+    instance.tags.add(new_tag)
+    retagged_ids = instance.__dict__.pop("_new_meta_tag_feeder_ids")
+    if retagged_ids:
+        Puzzle.tags.through.objects.bulk_create(
+            [
+                Puzzle.tags.through(puzzle_id=pk, puzzletag=new_tag)
+                for pk in retagged_ids
+            ],
+            ignore_conflicts=True,
+        )
+        touch_puzzles(retagged_ids)
+
     # make sure puzzles that already had tag now get assigned the meta
     # this has to happen post save, since instance has to exist first
-    if instance.is_meta:
-        puzzles_with_tag = Puzzle.objects.filter(
-            hunt=instance.hunt, tags__name__in=[instance.name]
-        ).exclude(name=instance.name)
-        for p in puzzles_with_tag:
-            p.metas.add(instance)
-            p.save()
-
-        if created:
-            instance.tags.add(
-                PuzzleTag.objects.get(name=instance.name, hunt=instance.hunt)
-            )
+    feeder_ids = set(
+        Puzzle.objects.filter(hunt_id=instance.hunt_id, tags=new_tag)
+        .exclude(pk=instance.pk)
+        .exclude(metas=instance)
+        .values_list("pk", flat=True)
+    )
+    if feeder_ids:
+        instance.feeders.add(*feeder_ids)
 
 
 @receiver(post_soft_delete, sender=Puzzle)
@@ -68,6 +120,7 @@ def update_tags_post_delete(sender, instance, **kwargs):
         PuzzleTag.objects.filter(name=instance.name, hunt=instance.hunt).delete()
 
 
+@receiver(post_restore, sender=Puzzle)
 @receiver(post_restore, sender=DeletedPuzzle)
 def update_tags_post_restore(sender, instance, **kwargs):
     if instance.is_meta:
@@ -80,19 +133,74 @@ def update_tags_post_restore(sender, instance, **kwargs):
 
 
 @receiver(m2m_changed, sender=Puzzle.metas.through)
-def update_tags_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
-    if action == "post_add":
-        for pk in pk_set:
-            meta = Puzzle.objects.get(pk=pk)
-            meta_tag = PuzzleTag.objects.get(name=meta.name, hunt=meta.hunt)
-            instance.tags.add(meta_tag)
-    elif action == "post_remove":
-        for pk in pk_set:
-            meta = Puzzle.objects.get(pk=pk)
-            meta_tag = PuzzleTag.objects.get(name=meta.name, hunt=meta.hunt)
-            instance.tags.remove(meta_tag)
+def sync_metas_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Updates everything that depends on which metas puzzles feed into, for all
+    the links added or removed at once.
+    """
+    if action == "pre_clear":
+        # pk_set isn't provided for clears, so remember the rows being removed
+        related = instance.feeders if reverse else instance.metas
+        instance._cleared_meta_link_ids = set(related.values_list("pk", flat=True))
+        return
     elif action == "post_clear":
-        instance.tags.filter(is_meta=True).exclude(name=instance.name).remove()
+        pk_set = instance.__dict__.pop("_cleared_meta_link_ids", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+    if not pk_set:
+        return
+
+    if reverse:
+        feeder_ids, meta_ids = set(pk_set), {instance.pk}
+    else:
+        feeder_ids, meta_ids = {instance.pk}, set(pk_set)
+
+    if action == "post_add":
+        add_meta_tags(instance.hunt_id, feeder_ids, meta_ids)
+    else:
+        remove_meta_tags(instance.hunt_id, feeder_ids, meta_ids)
+    update_meta_closure(feeder_ids)
+    update_progression(feeder_ids)
+    touch_puzzles(feeder_ids | meta_ids)
+
+    def tasks():
+        if google_api_lib.enabled():
+            for meta in Puzzle.objects.filter(pk__in=meta_ids):
+                google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(meta)
+        if reverse:
+            chat.tasks.handle_puzzles_meta_change.delay(sorted(feeder_ids))
+        elif instance.chat_room_id:
+            chat.tasks.handle_puzzle_meta_change.delay(instance.pk)
+
+    transaction.on_commit(tasks)
+
+
+# Hooks for maintaining meta paths and progression membership
+
+
+@receiver(post_save, sender=Puzzle)
+def update_progression_post_save(sender, instance, created, **kwargs):
+    was_solved = not created and instance._saved_state["status"] == Puzzle.SOLVED
+    if instance.is_solved() != was_solved:
+        update_progression([instance.pk])
+
+
+@receiver(pre_delete, sender=Puzzle)
+@receiver(pre_delete, sender=DeletedPuzzle)
+def remember_feeders_pre_delete(sender, instance, **kwargs):
+    instance._deleted_feeder_ids = set(instance.feeders.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Puzzle)
+@receiver(post_delete, sender=DeletedPuzzle)
+def delete_progression_post_delete(sender, instance, **kwargs):
+    # Soft deletes send this too, but keep the puzzle and its membership.
+    if Puzzle.global_objects.filter(pk=instance.pk).exists():
+        return
+    ProgressionPuzzle.objects.filter(puzzle_id=instance.pk).delete()
+    feeder_ids = instance.__dict__.pop("_deleted_feeder_ids", ())
+    update_meta_closure(feeder_ids)
+    update_progression(feeder_ids)
 
 
 @receiver(post_soft_delete, sender=Puzzle)
@@ -138,23 +246,93 @@ def clear_cache(sender, instance, using, **kwargs):
         cache.delete(instance.id)
 
 
-@receiver(m2m_changed, sender=Puzzle.metas.through)
-def update_meta_sheets_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
-    if action == "post_add" or action == "post_remove":
+# Hooks for bumping Puzzle.updated_on when related rows change, so that
+# incremental puzzle list requests don't miss them
 
-        def update_metas():
-            for pk in pk_set:
-                meta = Puzzle.objects.get(pk=pk)
-                google_api_lib.tasks.update_meta_and_metameta_sheets_delayed(meta)
 
-        if google_api_lib.enabled():
-            transaction.on_commit(update_metas)
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def touch_puzzle_answers(sender, instance, **kwargs):
+    # Only the hunt is needed, so don't load the whole puzzle if it isn't already.
+    if Answer.puzzle.is_cached(instance):
+        hunt_id = instance.puzzle.hunt_id
+    else:
+        hunt_id = (
+            Puzzle.global_objects.filter(pk=instance.puzzle_id)
+            .values_list("hunt_id", flat=True)
+            .first()
+        )
+    publish_hunt_event(hunt_id, ANSWERS_EVENT, puzzle_id=instance.puzzle_id)
+    touch_puzzles([instance.puzzle_id])
 
 
-@receiver(m2m_changed, sender=Puzzle.metas.through)
-def update_meta_chat_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
-    if action == "post_add" or action == "post_remove":
-        if instance.chat_room:
-            transaction.on_commit(
-                lambda: chat.tasks.handle_puzzle_meta_change.delay(instance.id)
-            )
+@receiver(post_save, sender=Puzzle)
+def touch_answers_post_save(sender, instance, created, **kwargs):
+    # The answer queue's incremental feed only looks at Answer.updated_on, so
+    # answers have to change too when the puzzle fields shown with them do.
+    if created:
+        return
+    deferred = instance.get_deferred_fields()
+    if all(
+        field in deferred or instance._saved_state[field] == getattr(instance, field)
+        for field in ANSWER_QUEUE_FIELDS
+    ):
+        return
+    if Answer.objects.filter(puzzle=instance).update(updated_on=timezone.now()):
+        publish_hunt_event(instance.hunt_id, ANSWERS_EVENT, puzzle_id=instance.pk)
+
+
+@receiver(m2m_changed, sender=Puzzle.tags.through)
+def touch_puzzles_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action == "pre_clear":
+        # pk_set isn't provided for clears, so look up the rows about to be removed
+        if isinstance(instance, PuzzleTag):
+            pk_set = set(instance.puzzles.values_list("pk", flat=True))
+        else:
+            pk_set = set()
+    elif action not in ("post_add", "post_remove"):
+        return
+
+    puzzle_ids = set(pk_set) if model is Puzzle else set()
+    if isinstance(instance, Puzzle):
+        puzzle_ids.add(instance.pk)
+    touch_puzzles(puzzle_ids)
+
+
+@receiver(post_save, sender=Puzzle)
+def bump_hunt_version_post_save(sender, instance, **kwargs):
+    bump_hunt_version(instance.hunt_id)
+    publish_hunt_event(instance.hunt_id, PUZZLES_EVENT, ids=[instance.pk])
+
+
+@receiver(post_save, sender=PuzzleTag)
+@receiver(pre_delete, sender=PuzzleTag)
+def touch_puzzles_tag(sender, instance, **kwargs):
+    # Tags are also listed on the hunt itself, so bump even if no puzzle has it.
+    bump_hunt_version(instance.hunt_id)
+    publish_hunt_event(instance.hunt_id, TAGS_EVENT, ids=[instance.pk])
+    touch_puzzles(list(instance.puzzles.values_list("pk", flat=True)))
+
+
+@receiver(post_save, sender=ChatRoom)
+def touch_puzzle_chat_room(sender, instance, **kwargs):
+    touch_puzzles(Puzzle.global_objects.filter(chat_room=instance).values("pk"))
+
+
+@receiver(post_soft_delete, sender=Puzzle)
+@receiver(post_restore, sender=Puzzle)
+@receiver(post_restore, sender=DeletedPuzzle)
+def touch_puzzle_neighbors(sender, instance, **kwargs):
+    # Metas list their feeders and vice versa, so those change too when a
+    # puzzle disappears or comes back.
+    puzzle_ids = set(instance.metas.values_list("pk", flat=True))
+    puzzle_ids.update(instance.feeders.values_list("pk", flat=True))
+    if not instance.is_deleted:
+        puzzle_ids.add(instance.pk)
+    touch_puzzles(puzzle_ids)
+
+
+# Registered last, so that the hooks above still see the state before the save.
+@receiver(post_save, sender=Puzzle)
+def remember_saved_state_post_save(sender, instance, **kwargs):
+    remember_saved_state_post_init(sender, instance)
@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from guardian.shortcuts import assign_perm
 from rest_framework.test import APITestCase
 
@@ -8,7 +10,7 @@ from chat.fake_service import FakeChatService
 from chat.models import ChatRoom
 from hunts.models import Hunt
 
-from .models import Puzzle, is_ancestor
+from .models import MetaClosure, Puzzle, is_ancestor
 from .puzzle_tag import PuzzleTag
 
 
@@ -69,6 +71,18 @@ class TestPuzzle(APITestCase):
         guess2.set_status(Answer.CORRECT)
         self.assertEqual(test_puzzle.solved_time(), guess2.created_on)
 
+        # Still solved by guess1, but no longer by the latest correct answer.
+        guess1.set_status(Answer.CORRECT)
+        guess2.set_status(Answer.INCORRECT)
+        test_puzzle.refresh_from_db()
+        self.assertTrue(test_puzzle.is_solved())
+        self.assertEqual(test_puzzle.solved_at, guess1.created_on)
+
+        guess1.set_status(Answer.INCORRECT)
+        test_puzzle.refresh_from_db()
+        self.assertFalse(test_puzzle.is_solved())
+        self.assertIsNone(test_puzzle.solved_at)
+
     def test_is_ancestor(self):
         meta1 = self.create_puzzle("unit_meta1", True)
         meta2 = self.create_puzzle("unit_meta2", True)
@@ -86,6 +100,50 @@ class TestPuzzle(APITestCase):
         self.assertFalse(is_ancestor(meta1, meta3))
         self.assertTrue(is_ancestor(meta3, meta1))
 
+    def test_meta_closure(self):
+        metameta = self.create_puzzle("unit_metameta", True)
+        meta = self.create_puzzle("unit_meta", True)
+        feeder = self.create_puzzle("unit_feeder", False)
+
+        def paths():
+            return set(
+                MetaClosure.objects.values_list(
+                    "descendant__name", "ancestor__name", "depth"
+                )
+            )
+
+        feeder.metas.add(meta)
+        meta.metas.add(metameta)
+        self.assertEqual(
+            paths(),
+            {
+                ("unit_feeder", "unit_meta", 1),
+                ("unit_meta", "unit_metameta", 1),
+                ("unit_feeder", "unit_metameta", 2),
+            },
+        )
+
+        # A second, shorter path to the metameta
+        feeder.metas.add(metameta)
+        self.assertIn(("unit_feeder", "unit_metameta", 1), paths())
+        self.assertIn(("unit_feeder", "unit_metameta", 2), paths())
+
+        meta.metas.remove(metameta)
+        self.assertEqual(
+            paths(),
+            {
+                ("unit_feeder", "unit_meta", 1),
+                ("unit_feeder", "unit_metameta", 1),
+            },
+        )
+
+        # Paths through hard deleted metas go away too.
+        meta.metas.add(metameta)
+        feeder.metas.remove(metameta)
+        meta.hard_delete()
+        self._puzzles.remove(meta)
+        self.assertEqual(paths(), set())
+
     def test_meta_creates_tag(self):
         meta = self.create_puzzle("meta", True)
         self.assertTrue(
@@ -153,6 +211,29 @@ class TestPuzzle(APITestCase):
         )
         self.assertTrue(feeder.tags.filter(name="newname").exists())
 
+    def test_meta_changes_batched(self):
+        meta = self.create_puzzle("oldname", True)
+        feeders = [self.create_puzzle(f"feeder{i}", False) for i in range(10)]
+
+        def rename(name):
+            with CaptureQueriesContext(connection) as queries:
+                meta.name = name
+                meta.save()
+            return len(queries)
+
+        meta.feeders.add(*feeders[:2])
+        small = rename("newname")
+        meta.feeders.add(*feeders[2:])
+        self.assertEqual(rename("newername"), small)
+        for feeder in feeders:
+            self.assertEqual(
+                list(feeder.tags.values_list("name", flat=True)), ["newername"]
+            )
+
+        meta.feeders.clear()
+        for feeder in feeders:
+            self.assertFalse(feeder.tags.exists())
+
     def test_sheets_redirect(self):
         puzzle = self.create_puzzle("test_redirects", False)
         response = self.client.get(f"/puzzles/s/{puzzle.pk}", follow=False)